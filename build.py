@@ -1,26 +1,28 @@
 from __future__ import annotations
 
-import argparse
-import csv
+import hashlib
+import io
+import itertools
 import json
 import os
-import platform
-import shutil
+import shlex
 import subprocess
 import sys
 import time
-from dataclasses import dataclass
 from datetime import datetime
+from functools import cache
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, NamedTuple
 
 
-def _agent_debug_log(project_root: Path, *, run_id: str, hypothesis_id: str, location: str, message: str, data: dict) -> None:
+_AGENT_LOG_BUF: list[str] = []
+
+
+def _agent_debug_log(*, run_id: str, hypothesis_id: str, location: str, message: str, data: dict) -> None:
     # region agent log
+    # Buffered in memory; written out in one go by _flush_agent_log.
     try:
-        p = project_root / ".cursor" / "debug.log"
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.open("a", encoding="utf-8").write(
+        _AGENT_LOG_BUF.append(
             json.dumps(
                 {
                     "sessionId": "debug-session",
@@ -40,46 +42,110 @@ def _agent_debug_log(project_root: Path, *, run_id: str, hypothesis_id: str, loc
     # endregion
 
 
-@dataclass(frozen=True)
-class BuildConfig:
+def _flush_agent_log(project_root: Path) -> None:
+    # region agent log
+    if not _AGENT_LOG_BUF:
+        return
+    try:
+        p = project_root / ".cursor" / "debug.log"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        with open(p, "a", encoding="utf-8", buffering=1 << 16) as f:
+            f.writelines(_AGENT_LOG_BUF)
+    except Exception:
+        pass
+    finally:
+        _AGENT_LOG_BUF.clear()
+    # endregion
+
+
+class BuildConfig(NamedTuple):
     entry: Path
     name: str
     onefile: bool
     console: bool
-    hidden_imports: list[str]
+    hidden_imports: tuple[str, ...]
     keep_temp: bool
     log_file: Path
 
 
+_SANITIZE_TBL = {i: "_" for i in range(128) if not (chr(i).isalnum() or chr(i) in "_-")}
+
+
 def _sanitize_exe_name(name: str) -> str:
     # PyInstaller is tolerant, but keep it simple for Windows filenames
-    cleaned = "".join(ch if (ch.isalnum() or ch in ("_", "-")) else "_" for ch in name.strip())
+    name = name.strip()
+    if name.isascii():
+        cleaned = name.translate(_SANITIZE_TBL)
+    else:
+        cleaned = "".join(ch if (ch.isalnum() or ch in ("_", "-")) else "_" for ch in name)
     return cleaned or "app"
 
 
+_PY_SUBPATH = ("Scripts", "python.exe") if os.name == "nt" else ("bin", "python")
+
+
 def _venv_python(venv_dir: Path) -> Path:
+    return venv_dir.joinpath(*_PY_SUBPATH)
+
+
+_BUILD_TOOLING = ("pip", "setuptools", "wheel", "pipreqs", "pyinstaller")
+
+# Written into a cached venv once every install step succeeded; a venv without it is rebuilt.
+_VENV_READY_MARKER = ".build_ready"
+_VENV_CACHE_KEY_LEN = 16
+
+
+def _venv_cache_key(*parts: str) -> str:
+    h = hashlib.sha256(sys.version.encode("utf-8"))
+    for part in parts:
+        h.update(part.encode("utf-8"))
+    return h.hexdigest()[:_VENV_CACHE_KEY_LEN]
+
+
+class _LogSink:
+    """Append-only handle to the build log, opened lazily on first write."""
+
+    def __init__(self, log_file: Path) -> None:
+        self.log_file = log_file
+        self._fh = None
+
+    def write(self, text: str) -> None:
+        if self._fh is None:
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self.log_file, "a", encoding="utf-8", errors="replace", buffering=1 << 16)
+        self._fh.write(text)
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+def _format_cmd(args: list[str]) -> str:
+    # One call for the whole argv, quoted the way the current platform's shell expects.
     if os.name == "nt":
-        return venv_dir / "Scripts" / "python.exe"
-    return venv_dir / "bin" / "python"
+        return subprocess.list2cmdline(args)
+    return shlex.join(args)
 
 
 def _run(
     args: list[str],
     *,
     cwd: Path | None = None,
-    log_file: Path | None = None,
+    log_sink: _LogSink | None = None,
     env: dict[str, str] | None = None,
 ) -> None:
-    cmd_str = " ".join([subprocess.list2cmdline([a]) if " " in a else a for a in args])
+    cmd_str = _format_cmd(args)
     prefix = f"[cmd] {cmd_str}\n"
 
-    if log_file is not None:
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        log_file.write_text(log_file.read_text(encoding="utf-8", errors="ignore") + prefix, encoding="utf-8") if log_file.exists() else log_file.write_text(prefix, encoding="utf-8")
+    if log_sink is not None:
+        log_sink.write(prefix)
 
     print(prefix, end="")
 
-    proc = subprocess.run(
+    # Stream output line by line so long pip/PyInstaller runs show progress
+    # and never hold the whole output in memory.
+    proc = subprocess.Popen(
         args,
         cwd=str(cwd) if cwd else None,
         env=env,
@@ -88,18 +154,172 @@ def _run(
         text=True,
         encoding="utf-8",
         errors="replace",
+        bufsize=1,
     )
+    assert proc.stdout is not None
+    with proc.stdout:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            if log_sink is not None:
+                log_sink.write(line)
+    returncode = proc.wait()
+
+    if returncode != 0:
+        raise RuntimeError(f"Command failed (exit {returncode}): {cmd_str}")
+
+
+def _run_capture(
+    args: list[str],
+    *,
+    cwd: Path | None = None,
+    log_sink: _LogSink | None = None,
+    env: dict[str, str] | None = None,
+) -> str:
+    """Like _run, but return stdout instead of echoing it (stderr is still shown and logged)."""
+    cmd_str = _format_cmd(args)
+    prefix = f"[cmd] {cmd_str}\n"
 
-    out = proc.stdout or ""
-    if log_file is not None and out:
-        log_file.write_text(log_file.read_text(encoding="utf-8", errors="ignore") + out, encoding="utf-8")
+    if log_sink is not None:
+        log_sink.write(prefix)
 
-    if out:
-        print(out, end="")
+    print(prefix, end="")
+
+    proc = subprocess.run(
+        args,
+        cwd=str(cwd) if cwd else None,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+
+    for chunk in (proc.stderr, proc.stdout):
+        if chunk:
+            sys.stdout.write(chunk)
+            if log_sink is not None:
+                log_sink.write(chunk)
 
     if proc.returncode != 0:
         raise RuntimeError(f"Command failed (exit {proc.returncode}): {cmd_str}")
 
+    return proc.stdout or ""
+
+
+def _install_build_tooling(
+    vpy: Path,
+    wheel_dir: Path,
+    *,
+    cwd: Path,
+    log_sink: _LogSink,
+    env: dict[str, str],
+) -> None:
+    """
+    Install pip + build tooling into a venv created with --without-pip.
+
+    The wheels are downloaded once (with the building interpreter's pip) into wheel_dir;
+    later venvs bootstrap pip by running it straight from its wheel and install offline.
+    Delete wheel_dir to pick up newer tooling versions.
+    """
+    pip_wheels = list(wheel_dir.glob("pip-*.whl"))
+    if not pip_wheels:
+        wheel_dir.mkdir(parents=True, exist_ok=True)
+        _run(
+            [sys.executable, "-m", "pip", "download", "--dest", str(wheel_dir), *_BUILD_TOOLING],
+            cwd=cwd,
+            log_sink=log_sink,
+            env=env,
+        )
+        pip_wheels = list(wheel_dir.glob("pip-*.whl"))
+        if not pip_wheels:
+            raise RuntimeError(f"pip wheel not found in: {wheel_dir}")
+
+    pip_wheel = max(pip_wheels, key=lambda p: p.stat().st_mtime)
+    _run(
+        [
+            str(vpy),
+            str(pip_wheel / "pip"),
+            "install",
+            "--no-index",
+            "--find-links",
+            str(wheel_dir),
+            *_BUILD_TOOLING,
+        ],
+        cwd=cwd,
+        log_sink=log_sink,
+        env=env,
+    )
+
+
+def _ensure_cached_venv(
+    venv_dir: Path,
+    *,
+    wheel_dir: Path,
+    requirements_file: Path | None = None,
+    cwd: Path,
+    log_sink: _LogSink,
+    env: dict[str, str],
+) -> Path:
+    """
+    Return the python of a ready venv at venv_dir, creating it if needed.
+
+    The venv gets the build tooling plus, optionally, the given requirements file.
+    It is only considered reusable once every install step has completed.
+    """
+    vpy = _venv_python(venv_dir)
+    marker = venv_dir / _VENV_READY_MARKER
+    if marker.exists() and vpy.exists():
+        log_sink.write(f"[cache] reusing venv: {venv_dir}\n")
+        print(f"[cache] reusing venv: {venv_dir}")
+        return vpy
+
+    if venv_dir.exists():
+        import shutil
+
+        # Leftover from an interrupted build: start over.
+        shutil.rmtree(venv_dir, ignore_errors=True)
+
+    # `python -m venv` exits non-zero (and _run raises) if it could not create the interpreter.
+    # Skipping ensurepip avoids its slow bundled-pip install; pip comes from the wheel dir instead.
+    _run([sys.executable, "-m", "venv", "--without-pip", str(venv_dir)], cwd=cwd, log_sink=log_sink, env=env)
+
+    _install_build_tooling(vpy, wheel_dir, cwd=cwd, log_sink=log_sink, env=env)
+    if requirements_file is not None:
+        _run([str(vpy), "-m", "pip", "install", "-r", str(requirements_file)], cwd=cwd, log_sink=log_sink, env=env)
+
+    marker.write_text(time.strftime("%Y-%m-%dT%H:%M:%S") + "\n", encoding="utf-8")
+    return vpy
+
+
+def _prune_venv_cache(cache_root: Path, keep: Iterable[Path], *, log_sink: _LogSink) -> None:
+    """
+    Remove cached venvs other than `keep` (older Python versions or requirement sets).
+
+    Only directories named like a cache key are touched; the shared pip/wheel caches stay.
+    """
+    import shutil
+
+    keep_names = {p.name for p in keep}
+    try:
+        with os.scandir(cache_root) as it:
+            stale = [
+                Path(e.path)
+                for e in it
+                if e.is_dir() and e.name not in keep_names and _is_venv_cache_name(e.name)
+            ]
+    except OSError:
+        # Best-effort: the build itself already succeeded
+        return
+    for venv_dir in stale:
+        log_sink.write(f"[cache] removing stale venv: {venv_dir}\n")
+        shutil.rmtree(venv_dir, ignore_errors=True)
+
+
+def _is_venv_cache_name(name: str) -> bool:
+    key = name.removeprefix("tools-")
+    return len(key) == _VENV_CACHE_KEY_LEN and all(c in "0123456789abcdef" for c in key)
+
 
 def _load_optional_config(config_path: Path) -> dict:
     if not config_path.exists():
@@ -115,7 +335,10 @@ def _default_app_name(project_root: Path) -> str:
 
 
 def _parse_args(project_root: Path) -> tuple[BuildConfig, Path]:
-    # First pass: read only --config without hijacking --help output.
+    import argparse
+
+    # First pass: read only --config without hijacking --help output. The same parser is then
+    # extended with the remaining options, whose defaults come from the config file.
     parser = argparse.ArgumentParser(
         description="Build .exe using a temporary venv + pipreqs + PyInstaller",
         add_help=False,
@@ -126,9 +349,7 @@ def _parse_args(project_root: Path) -> tuple[BuildConfig, Path]:
     config_path = (project_root / args0.config).resolve()
     cfg = _load_optional_config(config_path)
 
-    parser = argparse.ArgumentParser(description="Build .exe using a temporary venv + pipreqs + PyInstaller")
-
-    parser.add_argument("--config", default=str(config_path), help="Optional config JSON file")
+    parser.add_argument("-h", "--help", action="help", help="show this help message and exit")
 
     parser.add_argument("--entry", default=cfg.get("entry", "main.py"), help="Entry point .py file")
     parser.add_argument("--name", default=cfg.get("name", _default_app_name(project_root)), help="Executable name")
@@ -164,7 +385,7 @@ def _parse_args(project_root: Path) -> tuple[BuildConfig, Path]:
             name=name,
             onefile=bool(args.onefile),
             console=bool(args.console),
-            hidden_imports=list(args.hidden_imports or []),
+            hidden_imports=tuple(args.hidden_imports or ()),
             keep_temp=bool(args.keep_temp),
             log_file=log_file,
         ),
@@ -172,9 +393,9 @@ def _parse_args(project_root: Path) -> tuple[BuildConfig, Path]:
     )
 
 
-def _pipreqs_ignore_args() -> list[str]:
-    # Avoid scanning build artifacts / temp venvs.
-    ignore = [
+# Avoid scanning build artifacts / temp venvs.
+_PIPREQS_IGNORE = ",".join(
+    [
         ".build_tmp",
         "dist",
         "build",
@@ -183,34 +404,30 @@ def _pipreqs_ignore_args() -> list[str]:
         "venv",
         ".git",
     ]
-    return ["--ignore", ",".join(ignore)]
+)
 
 
-def _iter_hidden_import_flags(hidden_imports: Iterable[str]) -> list[str]:
-    flags: list[str] = []
-    for hi in hidden_imports:
-        hi = (hi or "").strip()
-        if not hi:
-            continue
-        flags.extend(["--hidden-import", hi])
-    return flags
+@cache
+def _pipreqs_ignore_args() -> tuple[str, ...]:
+    return ("--ignore", _PIPREQS_IGNORE)
 
 
-def _dedupe_keep_order(items: Iterable[str]) -> list[str]:
+def _hidden_import_flags(items: Iterable[str]) -> list[str]:
+    # Dedupe (keeping first occurrence) and expand into PyInstaller flags in one pass.
     seen: set[str] = set()
-    out: list[str] = []
+    flags: list[str] = []
     for x in items:
         x = (x or "").strip()
-        if not x:
-            continue
-        if x in seen:
+        if not x or x in seen:
             continue
         seen.add(x)
-        out.append(x)
-    return out
+        flags.append("--hidden-import")
+        flags.append(x)
+    return flags
 
 
-def _auto_hidden_imports_for_project(entry: Path) -> list[str]:
+@cache
+def _auto_hidden_imports_for_project() -> tuple[str, ...]:
     """
     Auto hidden-imports for modules loaded via __import__/importlib.
 
@@ -220,7 +437,7 @@ def _auto_hidden_imports_for_project(entry: Path) -> list[str]:
     """
     # Windows-only runtime modules used by this app.
     if os.name != "nt":
-        return []
+        return ()
 
     # Keep it focused to avoid bloating. Add pywin32 core pieces for pythoncom.
     base = [
@@ -257,7 +474,7 @@ def _auto_hidden_imports_for_project(entry: Path) -> list[str]:
         ]
     )
 
-    return base
+    return tuple(base)
 
 
 def main() -> int:
@@ -265,8 +482,9 @@ def main() -> int:
 
     config, config_path = _parse_args(project_root)
 
-    tmp_root = project_root / ".build_tmp" / datetime.now().strftime("%Y%m%d_%H%M%S")
-    venv_dir = tmp_root / "venv"
+    build_start = datetime.now()
+    tmp_root = project_root / ".build_tmp" / build_start.strftime("%Y%m%d_%H%M%S")
+    venv_cache_root = project_root / ".build_tmp" / "venv-cache"
     work_dir = tmp_root / "work"
     spec_dir = tmp_root / "spec"
     dist_dir = project_root / "dist"
@@ -275,22 +493,25 @@ def main() -> int:
     # Always keep temp on failure for debugging.
     keep_temp_effective = config.keep_temp
 
+    import platform
+
     config.log_file.parent.mkdir(parents=True, exist_ok=True)
+    # The header truncates any previous log; everything after it is appended via the sink.
     config.log_file.write_text(
-        f"Build started: {datetime.now().isoformat()}\n"
+        f"Build started: {build_start.isoformat()}\n"
         f"Project: {project_root}\n"
         f"Python: {sys.executable}\n"
         f"Platform: {platform.platform()}\n"
         f"Config file: {config_path if config_path.exists() else '(none)'}\n\n",
         encoding="utf-8",
     )
+    sink = _LogSink(config.log_file)
 
     print(f"Project root: {project_root}")
     print(f"Entry: {config.entry}")
     print(f"Name: {config.name}")
     print(f"Output: {dist_dir / (config.name + '.exe')}")
     _agent_debug_log(
-        project_root,
         run_id="pre-fix",
         hypothesis_id="A",
         location="build.py:main:init",
@@ -307,45 +528,53 @@ def main() -> int:
 
     tmp_root.mkdir(parents=True, exist_ok=True)
 
-    try:
-        # 1) Create venv
-        _run([sys.executable, "-m", "venv", str(venv_dir)], cwd=project_root, log_file=config.log_file)
+    # Share downloaded wheels between every cached venv.
+    env = dict(os.environ, PIP_CACHE_DIR=str(venv_cache_root / "pip"))
 
-        vpy = _venv_python(venv_dir)
-        if not vpy.exists():
-            raise RuntimeError(f"venv python not found at: {vpy}")
-
-        # 2) Upgrade pip + install build tooling
-        _run([str(vpy), "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel"], cwd=project_root, log_file=config.log_file)
-        _run([str(vpy), "-m", "pip", "install", "pipreqs", "pyinstaller"], cwd=project_root, log_file=config.log_file)
+    try:
+        # 1+2) Tooling venv (pipreqs + PyInstaller), reused across builds on the same Python
+        tools_venv_dir = venv_cache_root / f"tools-{_venv_cache_key()}"
+        tools_vpy = _ensure_cached_venv(
+            tools_venv_dir,
+            wheel_dir=venv_cache_root / "wheels",
+            cwd=project_root,
+            log_sink=sink,
+            env=env,
+        )
 
-        # 3) Generate requirements using pipreqs
-        req_file.parent.mkdir(parents=True, exist_ok=True)
-        _run(
+        # 3) Generate requirements using pipreqs (printed to stdout, kept in memory for the cache key;
+        #    the file copy is for diagnostics and for `pip install -r` on a cache miss)
+        requirements = _run_capture(
             [
-                str(vpy),
+                str(tools_vpy),
                 "-m",
                 "pipreqs.pipreqs",
                 str(project_root),
-                "--force",
-                "--savepath",
-                str(req_file),
+                "--print",
                 *_pipreqs_ignore_args(),
             ],
             cwd=project_root,
-            log_file=config.log_file,
+            log_sink=sink,
+            env=env,
+        )
+        req_file.parent.mkdir(parents=True, exist_ok=True)
+        req_file.write_text(requirements, encoding="utf-8")
+
+        # 4) Build venv keyed by the generated requirements; unchanged requirements skip all installs
+        build_venv_dir = venv_cache_root / _venv_cache_key(requirements)
+        vpy = _ensure_cached_venv(
+            build_venv_dir,
+            wheel_dir=venv_cache_root / "wheels",
+            requirements_file=req_file,
+            cwd=project_root,
+            log_sink=sink,
+            env=env,
         )
-
-        # 4) Install requirements into temp venv
-        _run([str(vpy), "-m", "pip", "install", "-r", str(req_file)], cwd=project_root, log_file=config.log_file)
 
         # 5) Generate .spec (makespec)
         spec_dir.mkdir(parents=True, exist_ok=True)
-        effective_hidden_imports = _dedupe_keep_order(
-            [*config.hidden_imports, *_auto_hidden_imports_for_project(config.entry)]
-        )
 
-        makespec_args = [
+        makespec_base = (
             str(vpy),
             "-m",
             "PyInstaller.utils.cliutils.makespec",
@@ -353,28 +582,28 @@ def main() -> int:
             config.name,
             "--specpath",
             str(spec_dir),
-        ]
-        makespec_args.append("--onefile" if config.onefile else "--onedir")
-        makespec_args.append("--console" if config.console else "--windowed")
-        makespec_args.extend(_iter_hidden_import_flags(effective_hidden_imports))
-        makespec_args.append(str(config.entry))
+            "--onefile" if config.onefile else "--onedir",
+            "--console" if config.console else "--windowed",
+        )
+        hidden_flags = _hidden_import_flags(itertools.chain(config.hidden_imports, _auto_hidden_imports_for_project()))
+        makespec_args = [*makespec_base, *hidden_flags, str(config.entry)]
 
-        _run(makespec_args, cwd=project_root, log_file=config.log_file)
+        _run(makespec_args, cwd=project_root, log_sink=sink)
 
-        # Find spec file
-        spec_files = sorted(spec_dir.glob("*.spec"))
-        if not spec_files:
+        # Find spec file (single directory pass; DirEntry.stat() is cached)
+        with os.scandir(spec_dir) as it:
+            spec_candidates = [
+                (e.stat().st_mtime, Path(e.path)) for e in it if e.name.endswith(".spec") and e.is_file()
+            ]
+        if not spec_candidates:
             raise RuntimeError(f"No .spec produced in: {spec_dir}")
 
-        spec_file = None
         expected = spec_dir / f"{config.name}.spec"
-        if expected.exists():
+        if any(p == expected for _, p in spec_candidates):
             spec_file = expected
-        elif len(spec_files) == 1:
-            spec_file = spec_files[0]
         else:
             # Last resort: pick newest
-            spec_file = max(spec_files, key=lambda p: p.stat().st_mtime)
+            spec_file = max(spec_candidates)[1]
 
         # 6) Build final .exe using the .spec
         work_dir.mkdir(parents=True, exist_ok=True)
@@ -385,7 +614,6 @@ def main() -> int:
         exe_path = dist_dir / f"{config.name}.exe"
         if config.onefile and exe_path.exists():
             _agent_debug_log(
-                project_root,
                 run_id="pre-fix",
                 hypothesis_id="A",
                 location="build.py:pre_delete",
@@ -397,152 +625,181 @@ def main() -> int:
                     "writable_file": os.access(str(exe_path), os.W_OK),
                 },
             )
-            # Quick process check (best-effort). If it's running, that's the most common lock reason.
-            running_pids: list[int] = []
+            # A running exe cannot be deleted on Windows, but it can be renamed. Moving it aside
+            # frees the name for PyInstaller immediately; only fall back to taskkill + retries
+            # when even the rename is refused.
+            old_exe = exe_path.with_name(f"{exe_path.stem}.old.{int(time.time())}{exe_path.suffix}")
+            moved_aside = False
             try:
-                tl = subprocess.run(
-                    ["tasklist", "/FI", f"IMAGENAME eq {exe_path.name}", "/FO", "CSV", "/NH"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    encoding="utf-8",
-                    errors="replace",
+                os.replace(exe_path, old_exe)
+                moved_aside = True
+                _agent_debug_log(
+                    run_id="pre-fix",
+                    hypothesis_id="B",
+                    location="build.py:pre_delete:rename",
+                    message="exe moved aside",
+                    data={"exe_path": str(exe_path), "moved_to": str(old_exe)},
                 )
+            except OSError as e:
                 _agent_debug_log(
-                    project_root,
                     run_id="pre-fix",
-                    hypothesis_id="A",
-                    location="build.py:pre_delete:tasklist",
-                    message="tasklist result",
-                    data={"returncode": tl.returncode, "output": (tl.stdout or "")[:8000]},
+                    hypothesis_id="B",
+                    location="build.py:pre_delete:rename",
+                    message=f"{type(e).__name__} renaming exe",
+                    data={
+                        "exe_path": str(exe_path),
+                        "winerror": getattr(e, "winerror", None),
+                        "errno": getattr(e, "errno", None),
+                    },
                 )
 
-                # Parse tasklist CSV output to extract PIDs, then try to kill them so we can overwrite.
-                # This is the most common cause of Windows refusing to delete/overwrite a .exe.
+            # Best-effort removal of moved-aside exes (this one and leftovers from earlier builds);
+            # those still locked by a running process are retried on the next build.
+            for stale in dist_dir.glob(f"{exe_path.stem}.old.*{exe_path.suffix}"):
                 try:
-                    for row in csv.reader((tl.stdout or "").splitlines()):
-                        if not row:
-                            continue
-                        # Expected: "robot_mql5.exe","19624","Console","1","8.944 K"
-                        if row[0].strip().lower() != exe_path.name.lower():
-                            continue
-                        try:
-                            running_pids.append(int(row[1]))
-                        except Exception:
-                            continue
-                    running_pids = sorted(set(running_pids))
-                except Exception as e:
+                    stale.unlink()
+                except OSError:
+                    pass
+
+            if not moved_aside:
+                # Quick process check (best-effort). If it's running, that's the most common lock reason.
+                running_pids: list[int] = []
+                try:
+                    tl = subprocess.run(
+                        ["tasklist", "/FI", f"IMAGENAME eq {exe_path.name}", "/FO", "CSV", "/NH"],
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
+                        text=True,
+                        encoding="utf-8",
+                        errors="replace",
+                    )
                     _agent_debug_log(
-                        project_root,
                         run_id="pre-fix",
                         hypothesis_id="A",
-                        location="build.py:pre_delete:tasklist_parse",
-                        message="Failed to parse tasklist CSV",
-                        data={"error": repr(e)},
+                        location="build.py:pre_delete:tasklist",
+                        message="tasklist result",
+                        data={"returncode": tl.returncode, "output": (tl.stdout or "")[:8000]},
                     )
 
-                if running_pids:
-                    _agent_debug_log(
-                        project_root,
-                        run_id="pre-fix",
-                        hypothesis_id="D",
-                        location="build.py:pre_delete:taskkill",
-                        message="Attempting to kill running exe processes",
-                        data={"exe_name": exe_path.name, "pids": running_pids},
-                    )
+                    # Parse tasklist CSV output to extract PIDs, then try to kill them so we can overwrite.
+                    # This is the most common cause of Windows refusing to delete/overwrite a .exe.
                     try:
-                        tk = subprocess.run(
-                            ["taskkill", "/F", "/T", *sum([["/PID", str(pid)] for pid in running_pids], [])],
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.STDOUT,
-                            text=True,
-                            encoding="utf-8",
-                            errors="replace",
-                        )
+                        import csv
+
+                        # /FI "IMAGENAME eq ..." already narrows the rows to this exe; anything
+                        # else (e.g. the "INFO: No tasks..." line) has no PID column.
+                        for row in csv.reader(io.StringIO(tl.stdout or "")):
+                            if len(row) < 2:
+                                continue
+                            # Expected: "robot_mql5.exe","19624","Console","1","8.944 K"
+                            try:
+                                running_pids.append(int(row[1]))
+                            except Exception:
+                                continue
+                        running_pids = sorted(set(running_pids))
+                    except Exception as e:
                         _agent_debug_log(
-                            project_root,
                             run_id="pre-fix",
-                            hypothesis_id="D",
-                            location="build.py:pre_delete:taskkill",
-                            message="taskkill result",
-                            data={"returncode": tk.returncode, "output": (tk.stdout or "")[:8000]},
+                            hypothesis_id="A",
+                            location="build.py:pre_delete:tasklist_parse",
+                            message="Failed to parse tasklist CSV",
+                            data={"error": repr(e)},
                         )
-                    except Exception as e:
+
+                    if running_pids:
                         _agent_debug_log(
-                            project_root,
                             run_id="pre-fix",
                             hypothesis_id="D",
                             location="build.py:pre_delete:taskkill",
-                            message="taskkill failed",
-                            data={"error": repr(e), "pids": running_pids},
+                            message="Attempting to kill running exe processes",
+                            data={"exe_name": exe_path.name, "pids": running_pids},
                         )
-            except Exception as e:
-                _agent_debug_log(
-                    project_root,
-                    run_id="pre-fix",
-                    hypothesis_id="A",
-                    location="build.py:pre_delete:tasklist",
-                    message="tasklist failed",
-                    data={"error": repr(e)},
-                )
-            deleted = False
-            for i in range(12):  # ~6 seconds total
-                try:
-                    exe_path.unlink()
-                    deleted = True
+                        try:
+                            tk = subprocess.run(
+                                ["taskkill", "/F", "/T", *sum([["/PID", str(pid)] for pid in running_pids], [])],
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT,
+                                text=True,
+                                encoding="utf-8",
+                                errors="replace",
+                            )
+                            _agent_debug_log(
+                                run_id="pre-fix",
+                                hypothesis_id="D",
+                                location="build.py:pre_delete:taskkill",
+                                message="taskkill result",
+                                data={"returncode": tk.returncode, "output": (tk.stdout or "")[:8000]},
+                            )
+                        except Exception as e:
+                            _agent_debug_log(
+                                run_id="pre-fix",
+                                hypothesis_id="D",
+                                location="build.py:pre_delete:taskkill",
+                                message="taskkill failed",
+                                data={"error": repr(e), "pids": running_pids},
+                            )
+                except Exception as e:
                     _agent_debug_log(
-                        project_root,
                         run_id="pre-fix",
-                        hypothesis_id="B",
-                        location="build.py:delete_loop",
-                        message="exe deleted",
-                        data={"attempt": i + 1, "exe_path": str(exe_path)},
+                        hypothesis_id="A",
+                        location="build.py:pre_delete:tasklist",
+                        message="tasklist failed",
+                        data={"error": repr(e)},
                     )
-                    break
-                except PermissionError as e:
+                deleted = False
+                for i in range(12):  # ~6 seconds total
+                    try:
+                        exe_path.unlink()
+                        deleted = True
+                        _agent_debug_log(
+                            run_id="pre-fix",
+                            hypothesis_id="B",
+                            location="build.py:delete_loop",
+                            message="exe deleted",
+                            data={"attempt": i + 1, "exe_path": str(exe_path)},
+                        )
+                        break
+                    except PermissionError as e:
+                        _agent_debug_log(
+                            run_id="pre-fix",
+                            hypothesis_id="B",
+                            location="build.py:delete_loop",
+                            message="PermissionError unlinking exe",
+                            data={
+                                "attempt": i + 1,
+                                "exe_path": str(exe_path),
+                                "winerror": getattr(e, "winerror", None),
+                                "errno": getattr(e, "errno", None),
+                                "strerror": getattr(e, "strerror", None),
+                            },
+                        )
+                        time.sleep(0.5)
+                    except OSError as e:
+                        _agent_debug_log(
+                            run_id="pre-fix",
+                            hypothesis_id="C",
+                            location="build.py:delete_loop",
+                            message="OSError unlinking exe",
+                            data={
+                                "attempt": i + 1,
+                                "exe_path": str(exe_path),
+                                "winerror": getattr(e, "winerror", None),
+                                "errno": getattr(e, "errno", None),
+                                "strerror": getattr(e, "strerror", None),
+                            },
+                        )
+                        time.sleep(0.5)
+                if not deleted and exe_path.exists():
                     _agent_debug_log(
-                        project_root,
                         run_id="pre-fix",
-                        hypothesis_id="B",
-                        location="build.py:delete_loop",
-                        message="PermissionError unlinking exe",
-                        data={
-                            "attempt": i + 1,
-                            "exe_path": str(exe_path),
-                            "winerror": getattr(e, "winerror", None),
-                            "errno": getattr(e, "errno", None),
-                            "strerror": getattr(e, "strerror", None),
-                        },
+                        hypothesis_id="A",
+                        location="build.py:pre_delete:failed",
+                        message="Could not delete exe after retries",
+                        data={"exe_path": str(exe_path)},
                     )
-                    time.sleep(0.5)
-                except OSError as e:
-                    _agent_debug_log(
-                        project_root,
-                        run_id="pre-fix",
-                        hypothesis_id="C",
-                        location="build.py:delete_loop",
-                        message="OSError unlinking exe",
-                        data={
-                            "attempt": i + 1,
-                            "exe_path": str(exe_path),
-                            "winerror": getattr(e, "winerror", None),
-                            "errno": getattr(e, "errno", None),
-                            "strerror": getattr(e, "strerror", None),
-                        },
+                    raise RuntimeError(
+                        f"Cannot overwrite '{exe_path}'. Close the running .exe (and try again)."
                     )
-                    time.sleep(0.5)
-            if not deleted and exe_path.exists():
-                _agent_debug_log(
-                    project_root,
-                    run_id="pre-fix",
-                    hypothesis_id="A",
-                    location="build.py:pre_delete:failed",
-                    message="Could not delete exe after retries",
-                    data={"exe_path": str(exe_path)},
-                )
-                raise RuntimeError(
-                    f"Cannot overwrite '{exe_path}'. Close the running .exe (and try again)."
-                )
 
         build_args = [
             str(vpy),
@@ -557,16 +814,15 @@ def main() -> int:
             str(spec_file),
         ]
 
-        _run(build_args, cwd=project_root, log_file=config.log_file)
+        _run(build_args, cwd=project_root, log_sink=sink)
 
         if config.onefile and not exe_path.exists():
             raise RuntimeError(f"Expected .exe not found: {exe_path}")
 
-        config.log_file.write_text(
-            config.log_file.read_text(encoding="utf-8", errors="ignore")
-            + f"\nBuild finished OK: {datetime.now().isoformat()}\nOutput: {exe_path}\n",
-            encoding="utf-8",
-        )
+        sink.write(f"\nBuild finished OK: {time.strftime('%Y-%m-%dT%H:%M:%S')}\nOutput: {exe_path}\n")
+
+        # Only after a successful build: a failed one may still want the previous venvs
+        _prune_venv_cache(venv_cache_root, (tools_venv_dir, build_venv_dir), log_sink=sink)
 
         print(f"\nDONE: {exe_path}")
         return 0
@@ -575,18 +831,25 @@ def main() -> int:
         keep_temp_effective = True
         msg = f"\nBUILD FAILED: {e}\nTemp kept at: {tmp_root}\nLog: {config.log_file}\n"
         print(msg)
-        config.log_file.write_text(
-            config.log_file.read_text(encoding="utf-8", errors="ignore")
-            + "\n"
-            + msg,
-            encoding="utf-8",
-        )
+        sink.write("\n" + msg)
         return 1
 
     finally:
+        sink.close()
+        _flush_agent_log(project_root)
         if not keep_temp_effective:
             try:
-                shutil.rmtree(tmp_root, ignore_errors=True)
+                import shutil
+                import threading
+
+                # Best-effort cleanup off the main thread: "DONE" is already printed, so main()
+                # returns right away. Non-daemon, so the interpreter still finishes the delete.
+                threading.Thread(
+                    target=shutil.rmtree,
+                    args=(tmp_root,),
+                    kwargs={"ignore_errors": True},
+                    name="build-tmp-cleanup",
+                ).start()
             except Exception:  # noqa: BLE001
                 # Best-effort cleanup
                 pass
@@ -19,24 +19,133 @@ Versão: 1.0.0
 Data: 2025-12-12
 """
 
+import ctypes
+import functools
 import logging
 import os
 import sys
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 
-# Importações específicas do Windows
+import ip_helper
+
+# Importações específicas do Windows (wmi/pythoncom são carregados sob demanda, ver _win_modules).
+# Fora do Windows o módulo continua importável (ex.: list_available_dns); só DNSManager exige o registro.
 try:
     import winreg
-    import wmi
-    import pythoncom
-    from winreg import HKEY_LOCAL_MACHINE, KEY_ALL_ACCESS, KEY_READ, REG_SZ, REG_DWORD
-except ImportError as e:
-    print("ERRO: Este módulo requer Python para Windows com pywin32 instalado.")
-    print("Execute: pip install pywin32 wmi")
-    sys.exit(1)
+except ImportError:
+    winreg = None
+
+# Constantes Win32 do registro (mesmos valores do módulo winreg)
+HKEY_LOCAL_MACHINE = 0x80000002
+KEY_QUERY_VALUE = 0x0001
+KEY_SET_VALUE = 0x0002
+KEY_ENUMERATE_SUB_KEYS = 0x0008
+KEY_NOTIFY = 0x0010
+KEY_WOW64_64KEY = 0x0100
+REG_SZ = 1
+REG_DWORD = 4
+
+
+# Caminhos base do registro onde as configurações de um adaptador podem estar
+NETWORK_REGISTRY_PATH = r"SYSTEM\CurrentControlSet\Services\Tcpip\Parameters\Interfaces"
+NETWORK_CLASS_REGISTRY_PATH = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e972-e325-11ce-bfc1-08002be10318}"
+_REGISTRY_PROBE_BASES = (NETWORK_REGISTRY_PATH, NETWORK_CLASS_REGISTRY_PATH)
+
+# Modelos dos caminhos candidatos, na ordem em que são testados
+_PATH_TEMPLATES = tuple(
+    template
+    for base in (b.replace('{', '{{').replace('}', '}}') for b in _REGISTRY_PROBE_BASES)
+    for template in (base + "\\{id}", base + "\\{{{id}}}", base + "\\{id4}")
+) + ("SYSTEM\\CurrentControlSet\\Control\\Class\\{{{id}}}",)
+
+# Direitos mínimos por operação; sempre a visão de 64 bits (sem redirecionador WoW64)
+_KEY_QUERY_ACCESS = KEY_QUERY_VALUE | KEY_WOW64_64KEY
+_KEY_WRITE_ACCESS = KEY_SET_VALUE | KEY_QUERY_VALUE | KEY_WOW64_64KEY
+_KEY_ENUMERATE_ACCESS = KEY_ENUMERATE_SUB_KEYS | KEY_QUERY_VALUE | KEY_WOW64_64KEY
+
+
+@functools.lru_cache(maxsize=64)
+def _registry_path_candidates(device_id: str) -> Tuple[str, ...]:
+    """Caminhos de registro candidatos para um adaptador, na ordem em que são testados."""
+    fields = {'id': device_id, 'id4': device_id.zfill(4)}
+    # Remove duplicados mantendo a ordem
+    return tuple(dict.fromkeys(template.format_map(fields) for template in _PATH_TEMPLATES))
+
+
+_logging_configured = False
+
+
+@functools.lru_cache(maxsize=None)
+def _win_modules():
+    """
+    Importa wmi e pythoncom apenas quando o fallback WMI é necessário.
+    
+    Returns:
+        Tuple: (módulo wmi, módulo pythoncom)
+    """
+    try:
+        import wmi
+        import pythoncom
+    except ImportError as e:
+        raise ImportError("O fallback WMI requer pywin32 instalado. Execute: pip install pywin32 wmi") from e
+    return wmi, pythoncom
+
+
+def _query_values(key, names: Tuple[str, ...]) -> Dict[str, Optional[Union[int, str]]]:
+    """Lê vários valores de uma chave já aberta; valores ausentes retornam None."""
+    values = {}
+    for name in names:
+        try:
+            values[name] = winreg.QueryValueEx(key, name)[0]
+        except FileNotFoundError:
+            values[name] = None
+    return values
+
+# RegNotifyChangeKeyValue: avisar só quando subchaves são criadas/removidas
+REG_NOTIFY_CHANGE_NAME = 0x00000001
+_INFINITE = 0xFFFFFFFF
+
+_notify_api = None
+
+
+def _load_notify_api():
+    """Resolve uma única vez as funções Win32 usadas pelo monitor de interfaces."""
+    global _notify_api
+    if _notify_api is None:
+        advapi32 = ctypes.WinDLL('advapi32')
+        kernel32 = ctypes.WinDLL('kernel32')
+        
+        advapi32.RegNotifyChangeKeyValue.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_ulong, ctypes.c_void_p, ctypes.c_int]
+        advapi32.RegNotifyChangeKeyValue.restype = ctypes.c_long
+        kernel32.CreateEventW.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_wchar_p]
+        kernel32.CreateEventW.restype = ctypes.c_void_p
+        kernel32.WaitForSingleObject.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+        kernel32.WaitForSingleObject.restype = ctypes.c_ulong
+        kernel32.SetEvent.argtypes = [ctypes.c_void_p]
+        kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+        
+        _notify_api = (advapi32.RegNotifyChangeKeyValue, kernel32.CreateEventW,
+                       kernel32.WaitForSingleObject, kernel32.SetEvent, kernel32.CloseHandle)
+    return _notify_api
+
+
+def _flush_resolver_cache() -> bool:
+    """
+    Limpa o cache do cliente DNS via dnsapi!DnsFlushResolverCache (sem subprocesso).
+    
+    Returns:
+        bool: True se o cache foi limpo
+    """
+    try:
+        return bool(ctypes.WinDLL('dnsapi').DnsFlushResolverCache())
+    except (AttributeError, OSError):
+        return False
 
 
 class DNSManager:
@@ -75,32 +184,122 @@ class DNSManager:
         }
     }
     
+    # Índice reverso: DNS primário -> nome do provedor
+    _DNS_BY_PRIMARY = {cfg['primary']: cfg['name'] for cfg in DNS_SERVERS.values()}
+    
+    # Tempo (segundos) em que a lista de adaptadores detectada é reutilizada
+    ADAPTER_CACHE_TTL = 5.0
+    
+    # Tempo (segundos) em que a enumeração das subchaves de Interfaces é reutilizada
+    INTERFACE_KEYS_TTL = 30.0
+    
+    # Máximo de threads para E/S de registro por adaptador
+    MAX_IO_WORKERS = 8
+    
+    _shared: Optional['DNSManager'] = None
+    _shared_lock = threading.Lock()
+    
+    @classmethod
+    def get_shared(cls) -> 'DNSManager':
+        """
+        Retorna uma instância compartilhada do gerenciador (criada sob demanda).
+        
+        Evita renegociar a conexão WMI a cada chamada das funções de conveniência.
+        
+        Returns:
+            DNSManager: Instância compartilhada
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+    
     def __init__(self, log_level: int = logging.INFO):
         """
         Inicializa o gerenciador de DNS.
         
         Args:
             log_level (int): Nível de logging (default: logging.INFO)
+            
+        Raises:
+            ImportError: Fora do Windows (módulo winreg indisponível)
         """
+        if winreg is None:
+            raise ImportError("DNSManager requer Python para Windows (módulo winreg)")
+        
         self._setup_logging(log_level)
         self.logger = logging.getLogger(__name__)
         self.logger.info("Inicializando DNSManager")
         
-        # Inicializar WMI
-        try:
-            pythoncom.CoInitialize()
-            self.wmi = wmi.WMI()
-            self.logger.info("WMI inicializado com sucesso")
-        except Exception as e:
-            self.logger.error(f"Erro ao inicializar WMI: {e}")
-            raise
+        # Enumeração via IP Helper; o WMI só é inicializado se for preciso (fallback)
+        self._adapter_reader = ip_helper.AdapterAddressesReader()
+        # Estado COM/WMI por thread: CoInitialize/CoUninitialize precisam ocorrer na mesma thread
+        self._com = threading.local()
         
         # Caminho do registro para configurações de rede
-        self.NETWORK_REGISTRY_PATH = r"SYSTEM\CurrentControlSet\Services\Tcpip\Parameters\Interfaces"
+        self.NETWORK_REGISTRY_PATH = NETWORK_REGISTRY_PATH
         self.BACKUP_FILE = "dns_backup.json"
         
+        # Cache da detecção de adaptadores (ver ADAPTER_CACHE_TTL)
+        self._adapter_cache: Optional[List[Dict]] = None
+        self._adapter_cache_ts = 0.0
+        
+        # GUID normalizado -> nome da subchave em NETWORK_REGISTRY_PATH (ver INTERFACE_KEYS_TTL)
+        self._interface_keys: Optional[Dict[str, str]] = None
+        self._interface_keys_ts = 0.0
+        
+        # Monitor de Interfaces que invalida os caches acima (iniciado na primeira detecção)
+        self._watcher: Optional[threading.Thread] = None
+        self._watch_event = None
+        self._watch_stop = threading.Event()
+        
+    @property
+    def wmi(self):
+        """Conexão WMI, criada sob demanda."""
+        connection = getattr(self._com, 'wmi', None)
+        if connection is None:
+            try:
+                wmi_module, pythoncom = _win_modules()
+                if not getattr(self._com, 'initialized', False):
+                    pythoncom.CoInitialize()
+                    self._com.initialized = True
+                connection = wmi_module.WMI()
+                self._com.wmi = connection
+                self.logger.info("WMI inicializado com sucesso")
+            except Exception as e:
+                self.logger.error(f"Erro ao inicializar WMI: {e}")
+                raise
+        return connection
+    
+    def close(self) -> None:
+        """Encerra o monitor de interfaces e libera a conexão WMI e o COM da thread atual."""
+        self._watch_stop.set()
+        event = self._watch_event
+        if event is not None:
+            _, _, _, set_event, close_handle = _load_notify_api()
+            # Acorda o monitor e só fecha o evento depois que ele deixou de esperar nele
+            set_event(event)
+            if self._watcher is not None:
+                self._watcher.join()
+            self._watch_event = None
+            close_handle(event)
+        self._com.wmi = None
+        if getattr(self._com, 'initialized', False):
+            self._com.initialized = False
+            _win_modules()[1].CoUninitialize()
+    
+    def __enter__(self) -> 'DNSManager':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     def _setup_logging(self, log_level: int) -> None:
-        """Configura o sistema de logging."""
+        """Configura o sistema de logging (apenas na primeira instância)."""
+        global _logging_configured
+        if _logging_configured:
+            return
+        _logging_configured = True
         logging.basicConfig(
             level=log_level,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -117,114 +316,217 @@ class DNSManager:
         Returns:
             List[Dict]: Lista de adaptadores com informações detalhadas
         """
+        # Leitura única: o monitor de interfaces pode zerar o cache a qualquer momento
+        cached = self._adapter_cache
+        if cached is not None and time.monotonic() - self._adapter_cache_ts < self.ADAPTER_CACHE_TTL:
+            return list(cached)
+        
         self.logger.info("Iniciando detecção de adaptadores de rede")
-        adapters = []
+        self._start_interface_watcher()
         
         try:
-            # Buscar adaptadores via WMI
-            for nic in self.wmi.Win32_NetworkAdapter():
-                if nic.NetConnectionID and nic.NetConnectionStatus in [1, 2]:  # Conectado ou desconectado
-                    adapter_info = {
-                        'name': nic.NetConnectionID,
-                        'device_id': nic.DeviceID,
-                        'adapter_type': nic.AdapterType,
-                        'mac_address': nic.MACAddress,
-                        'speed': nic.Speed,
-                        'status': 'Conectado' if nic.NetConnectionStatus == 2 else 'Desconectado',
-                        'manufacturer': nic.Manufacturer,
-                        'description': nic.Description,
-                        'registry_path': self._get_adapter_registry_path(nic.NetConnectionID, nic.DeviceID)
-                    }
-                    adapters.append(adapter_info)
-                    self.logger.info(f"Adaptador detectado: {nic.NetConnectionID}")
+            try:
+                adapters = self._enum_adapters_iphlpapi()
+            except OSError as e:
+                self.logger.warning(f"GetAdaptersAddresses indisponível, usando WMI: {e}")
+                adapters = []
+            
+            if not adapters:
+                adapters = self._enum_adapters_wmi()
             
             self.logger.info(f"Total de adaptadores detectados: {len(adapters)}")
-            return adapters
+            self._adapter_cache = adapters
+            self._adapter_cache_ts = time.monotonic()
+            return list(adapters)
             
         except Exception as e:
             self.logger.error(f"Erro ao detectar adaptadores: {e}")
             raise
     
-    def _get_adapter_registry_path(self, adapter_name: str, device_id: str) -> Optional[str]:
+    def _enum_adapters_iphlpapi(self) -> List[Dict]:
         """
-        Obtém o caminho do registro para um adaptador específico usando múltiplas estratégias.
+        Enumera adaptadores via IP Helper (GetAdaptersAddresses), sem COM/WMI.
         
-        Args:
-            adapter_name (str): Nome do adaptador
-            device_id (str): ID do dispositivo do adaptador
+        Returns:
+            List[Dict]: Adaptadores no mesmo formato de detect_network_adapters
+        """
+        adapters = []
+        for entry in self._adapter_reader.read():
+            # Loopback e túneis não têm configuração de DNS própria (e não aparecem no WMI)
+            if entry['if_type'] in (ip_helper.IF_TYPE_SOFTWARE_LOOPBACK, ip_helper.IF_TYPE_TUNNEL):
+                continue
+            if entry['oper_status'] not in (ip_helper.IF_OPER_STATUS_UP, ip_helper.IF_OPER_STATUS_DORMANT):
+                continue
+            # Só adaptadores com IP habilitado têm DNS a configurar
+            if not (entry['ipv4_enabled'] or entry['ipv6_enabled']):
+                continue
             
+            adapter_info = {
+                'name': entry['friendly_name'],
+                'device_id': entry['adapter_name'],
+                'adapter_type': ip_helper.IF_TYPE_NAMES.get(entry['if_type'], str(entry['if_type'])),
+                'mac_address': entry['mac_address'] or None,
+                'speed': entry['transmit_link_speed'],
+                'status': 'Conectado' if entry['oper_status'] == ip_helper.IF_OPER_STATUS_UP else 'Desconectado',
+                'manufacturer': None,
+                'description': entry['description'],
+                'ip_enabled': True,
+                'registry_path': self._get_adapter_registry_path(entry['adapter_name'])
+            }
+            adapters.append(adapter_info)
+            self.logger.debug("Adaptador detectado: %s", entry['friendly_name'])
+        return adapters
+    
+    def _enum_adapters_wmi(self) -> List[Dict]:
+        """
+        Enumera adaptadores via WMI (Win32_NetworkAdapter); usado como fallback.
+        
         Returns:
-            Optional[str]: Caminho do registro ou None se não encontrado
+            List[Dict]: Adaptadores no mesmo formato de detect_network_adapters
         """
-        self.logger.info(f"Procurando caminho do registro para adaptador: {adapter_name} (ID: {device_id})")
+        adapters = []
+        # Uma única consulta para saber quais adaptadores têm IP habilitado
+        ip_enabled_ids = {str(cfg.Index) for cfg in self.wmi.Win32_NetworkAdapterConfiguration(IPEnabled=True)}
         
-        # Estratégia 1: Tentar encontrar via WMI e mapear para registro
+        for nic in self.wmi.Win32_NetworkAdapter():
+            if nic.DeviceID not in ip_enabled_ids:
+                continue
+            if nic.NetConnectionID and nic.NetConnectionStatus in [1, 2]:  # Conectado ou desconectado
+                adapter_info = {
+                    'name': nic.NetConnectionID,
+                    'device_id': nic.DeviceID,
+                    'adapter_type': nic.AdapterType,
+                    'mac_address': nic.MACAddress,
+                    'speed': nic.Speed,
+                    'status': 'Conectado' if nic.NetConnectionStatus == 2 else 'Desconectado',
+                    'manufacturer': nic.Manufacturer,
+                    'description': nic.Description,
+                    'ip_enabled': True,
+                    'registry_path': self._get_adapter_registry_path(nic.DeviceID)
+                }
+                adapters.append(adapter_info)
+                self.logger.debug("Adaptador detectado: %s", nic.NetConnectionID)
+        return adapters
+    
+    def invalidate_adapters(self) -> None:
+        """Descarta a lista de adaptadores em cache (usar após alterar a rede)."""
+        self._adapter_cache = None
+        self._adapter_cache_ts = 0.0
+        self._interface_keys = None
+    
+    def _start_interface_watcher(self) -> None:
+        """Inicia (uma vez) a thread que observa criação/remoção de interfaces no registro."""
+        if self._watcher is not None or self._watch_stop.is_set():
+            return
+        
+        try:
+            create_event = _load_notify_api()[1]
+        except (AttributeError, OSError):
+            return
+        
+        event = create_event(None, False, False, None)
+        if not event:
+            return
+        
+        self._watch_event = event
+        self._watcher = threading.Thread(
+            target=self._watch_interfaces, args=(event,), name="dns-interface-watcher", daemon=True
+        )
+        self._watcher.start()
+    
+    def _watch_interfaces(self, event) -> None:
+        """
+        Aguarda alterações em NETWORK_REGISTRY_PATH e descarta os caches quando ocorrem.
+        
+        O evento pertence ao gerenciador: quem o fecha é close(), depois do join desta thread.
+        """
+        reg_notify, _, wait_for, _, _ = _load_notify_api()
         try:
-            # Buscar adaptadores e tentar encontrar correspondência
-            for nic in self.wmi.Win32_NetworkAdapter():
-                if nic.NetConnectionID == adapter_name and nic.DeviceID == device_id:
-                    # Tentar diferentes caminhos baseados no tipo de adaptador
-                    base_paths = [
-                        r"SYSTEM\CurrentControlSet\Services\Tcpip\Parameters\Interfaces",
-                        r"SYSTEM\CurrentControlSet\Control\Class\{4d36e972-e325-11ce-bfc1-08002be10318}"
-                    ]
+            with winreg.OpenKey(HKEY_LOCAL_MACHINE, NETWORK_REGISTRY_PATH, 0, KEY_NOTIFY | KEY_WOW64_64KEY) as key:
+                while not self._watch_stop.is_set():
+                    ret = reg_notify(key.handle, True, REG_NOTIFY_CHANGE_NAME, event, True)
+                    if ret != 0:
+                        self.logger.warning(f"RegNotifyChangeKeyValue falhou com código {ret}")
+                        break
                     
-                    for base_path in base_paths:
-                        # Tentar com device_id direto
-                        test_path = f"{base_path}\\{device_id}"
-                        try:
-                            with winreg.OpenKey(HKEY_LOCAL_MACHINE, test_path, 0, winreg.KEY_READ):
-                                self.logger.info(f"Caminho encontrado: {test_path}")
-                                return test_path
-                        except:
-                            pass
-                        
-                        # Tentar com device_id entre chaves
-                        test_path = f"{base_path}\\{{{device_id}}}"
-                        try:
-                            with winreg.OpenKey(HKEY_LOCAL_MACHINE, test_path, 0, winreg.KEY_READ):
-                                self.logger.info(f"Caminho encontrado: {test_path}")
-                                return test_path
-                        except:
-                            pass
-                        
-                        # Tentar com device_id zeropad
-                        padded_id = device_id.zfill(4)
-                        test_path = f"{base_path}\\{padded_id}"
-                        try:
-                            with winreg.OpenKey(HKEY_LOCAL_MACHINE, test_path, 0, winreg.KEY_READ):
-                                self.logger.info(f"Caminho encontrado: {test_path}")
-                                return test_path
-                        except:
-                            pass
-        except Exception as e:
-            self.logger.warning(f"Erro ao buscar caminho via WMI: {e}")
+                    wait_for(event, _INFINITE)
+                    if self._watch_stop.is_set():
+                        break
+                    
+                    self.logger.debug("Interfaces alteradas no registro; cache de adaptadores descartado")
+                    self.invalidate_adapters()
+        except OSError as e:
+            self.logger.warning(f"Monitor de interfaces indisponível: {e}")
+    
+    @staticmethod
+    def _normalize_guid(value: str) -> str:
+        return value.strip().strip('{}').lower()
+    
+    def _get_interface_keys(self) -> Dict[str, str]:
+        """
+        Enumera uma única vez as subchaves de NETWORK_REGISTRY_PATH.
         
-        # Estratégia 2: Tentar caminhos comuns baseados no nome do adaptador
-        common_paths = [
-            f"{self.NETWORK_REGISTRY_PATH}\\{device_id}",
-            f"{self.NETWORK_REGISTRY_PATH}\\{{{device_id}}}",
-            f"SYSTEM\\CurrentControlSet\\Control\\Class\\{{{device_id}}}"
-        ]
+        Returns:
+            Dict[str, str]: GUID normalizado (minúsculo, sem chaves) -> nome da subchave
+        """
+        # Leitura única: o monitor de interfaces pode zerar o cache a qualquer momento
+        cached = self._interface_keys
+        if cached is not None and time.monotonic() - self._interface_keys_ts < self.INTERFACE_KEYS_TTL:
+            return cached
         
-        for path in common_paths:
+        interface_keys = {}
+        try:
+            with winreg.OpenKey(HKEY_LOCAL_MACHINE, NETWORK_REGISTRY_PATH, 0, _KEY_ENUMERATE_ACCESS) as key:
+                subkey_count = winreg.QueryInfoKey(key)[0]
+                for index in range(subkey_count):
+                    subkey = winreg.EnumKey(key, index)
+                    interface_keys[self._normalize_guid(subkey)] = subkey
+        except FileNotFoundError:
+            self.logger.warning(f"Chave de interfaces não encontrada: {NETWORK_REGISTRY_PATH}")
+        
+        self._interface_keys = interface_keys
+        self._interface_keys_ts = time.monotonic()
+        return interface_keys
+    
+    def _get_adapter_registry_path(self, device_id: str) -> Optional[str]:
+        """
+        Obtém o caminho do registro para um adaptador.
+        
+        GUIDs são resolvidos contra a enumeração de Interfaces; IDs numéricos
+        (fallback WMI) continuam testando os caminhos candidatos.
+        
+        Args:
+            device_id (str): ID do dispositivo do adaptador
+            
+        Returns:
+            Optional[str]: Caminho do registro ou None se não encontrado
+        """
+        self.logger.debug("Procurando caminho do registro para adaptador ID: %s", device_id)
+        
+        subkey = self._get_interface_keys().get(self._normalize_guid(device_id))
+        if subkey:
+            path = NETWORK_REGISTRY_PATH + "\\" + subkey
+            self.logger.debug("Caminho encontrado: %s", path)
+            return path
+        
+        for path in _registry_path_candidates(device_id):
             try:
-                with winreg.OpenKey(HKEY_LOCAL_MACHINE, path, 0, winreg.KEY_READ):
-                    self.logger.info(f"Caminho comum encontrado: {path}")
+                with winreg.OpenKey(HKEY_LOCAL_MACHINE, path, 0, _KEY_QUERY_ACCESS):
+                    self.logger.debug("Caminho encontrado: %s", path)
                     return path
-            except:
+            except FileNotFoundError:
                 continue
         
-        self.logger.warning(f"Nenhum caminho de registro encontrado para {adapter_name}")
+        self.logger.warning(f"Nenhum caminho de registro encontrado para o adaptador ID {device_id}")
         return None
     
-    def _backup_current_dns(self, adapter_name: str, registry_path: str) -> Dict:
+    def _backup_current_dns(self, adapter_name: str, key) -> Dict:
         """
         Faz backup das configurações DNS atuais do adaptador.
         
         Args:
             adapter_name (str): Nome do adaptador
-            registry_path (str): Caminho do registro do adaptador
+            key: Chave do registro do adaptador já aberta (com KEY_QUERY_VALUE)
             
         Returns:
             Dict: Configurações DNS atuais
@@ -237,33 +539,100 @@ class DNSManager:
         }
         
         try:
-            with winreg.OpenKey(HKEY_LOCAL_MACHINE, registry_path, 0, KEY_READ) as key:
-                try:
-                    # Verificar DNS primário
-                    primary_dns, _ = winreg.QueryValueEx(key, "NameServer")
-                    backup['dns_servers']['primary'] = primary_dns
-                except FileNotFoundError:
-                    backup['dns_servers']['primary'] = None
-                
-                try:
-                    # Verificar DNS secundário
-                    secondary_dns, _ = winreg.QueryValueEx(key, "DHCPNameServer")
-                    backup['dns_servers']['secondary'] = secondary_dns
-                except FileNotFoundError:
-                    backup['dns_servers']['secondary'] = None
-                
-                try:
-                    # Verificar se DHCP está habilitado
-                    dhcp_enabled, _ = winreg.QueryValueEx(key, "EnableDHCP")
-                    backup['dhcp_enabled'] = bool(dhcp_enabled)
-                except FileNotFoundError:
-                    backup['dhcp_enabled'] = False
+            values = _query_values(key, ("NameServer", "DHCPNameServer", "EnableDHCP"))
+            backup['dns_servers']['primary'] = values["NameServer"]
+            backup['dns_servers']['secondary'] = values["DHCPNameServer"]
+            backup['dhcp_enabled'] = bool(values["EnableDHCP"])
                     
         except Exception as e:
             self.logger.warning(f"Não foi possível fazer backup do adaptador {adapter_name}: {e}")
             
         return backup
     
+    def _map_adapters(self, func, items: List) -> List:
+        """
+        Aplica `func` a cada item em paralelo (E/S de registro libera o GIL), mantendo a ordem.
+        
+        Args:
+            func: Função chamada com um item por vez
+            items (List): Itens a processar (adaptadores, backups, ...)
+            
+        Returns:
+            List: Resultados na mesma ordem de `items`
+        """
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.MAX_IO_WORKERS, len(items))) as pool:
+            return list(pool.map(func, items))
+    
+    @staticmethod
+    def _open_adapter_key(registry_path: str, write: bool = False):
+        """
+        Abre a chave do adaptador com os direitos mínimos para a operação.
+        
+        Args:
+            registry_path (str): Caminho do registro do adaptador
+            write (bool): Se True, abre também para escrita
+            
+        Returns:
+            Chave do registro (usar com `with`)
+        """
+        access = _KEY_WRITE_ACCESS if write else _KEY_QUERY_ACCESS
+        return winreg.OpenKey(HKEY_LOCAL_MACHINE, registry_path, 0, access)
+    
+    def _apply_registry_batch(self, registry_path: str, values: Dict[str, Tuple[int, Union[int, str]]], key=None) -> None:
+        """
+        Grava um conjunto de valores na chave do adaptador com uma única abertura e um único flush.
+        
+        Args:
+            registry_path (str): Caminho do registro do adaptador
+            values (Dict): Mapeamento nome -> (tipo REG_*, dado); dado None remove o valor
+            key: Chave já aberta com KEY_SET_VALUE (opcional); se None, a chave é aberta aqui
+        """
+        if key is None:
+            with self._open_adapter_key(registry_path, write=True) as key:
+                self._apply_registry_batch(registry_path, values, key)
+            return
+        
+        for name, (value_type, data) in values.items():
+            if data is None:
+                try:
+                    winreg.DeleteValue(key, name)
+                except FileNotFoundError:
+                    pass
+            else:
+                winreg.SetValueEx(key, name, 0, value_type, data)
+        winreg.FlushKey(key)
+    
+    def _set_name_servers(self, adapter: Dict, name_servers: str, values: Dict) -> Dict:
+        """
+        Aplica a lista de servidores via SetInterfaceDnsSettings quando disponível.
+        
+        Args:
+            adapter (Dict): Adaptador de destino
+            name_servers (str): Servidores separados por vírgula ("" = DHCP)
+            values (Dict): Valores de registro planejados para o adaptador
+            
+        Returns:
+            Dict: Valores que ainda precisam ser gravados no registro (sem NameServer se a API foi usada)
+        """
+        try:
+            applied = ip_helper.set_interface_dns_servers(adapter['device_id'], name_servers)
+        except OSError as e:
+            self.logger.warning(f"SetInterfaceDnsSettings falhou para {adapter['name']}, usando o registro: {e}")
+            return values
+        
+        if not applied:
+            return values
+        return {name: value for name, value in values.items() if name != "NameServer"}
+    
+    def _notify_dns_change(self) -> None:
+        """Faz o cliente DNS descartar respostas obtidas com os servidores anteriores."""
+        if _flush_resolver_cache():
+            self.logger.info("Cache do resolvedor DNS limpo")
+        else:
+            self.logger.warning("Não foi possível limpar o cache do resolvedor DNS")
+    
     def _save_backup(self, backup_data: List[Dict]) -> bool:
         """
         Salva o backup das configurações DNS em arquivo JSON.
@@ -274,9 +643,13 @@ class DNSManager:
         Returns:
             bool: True se salvo com sucesso
         """
+        tmp_file = self.BACKUP_FILE + ".tmp"
         try:
-            with open(self.BACKUP_FILE, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2, ensure_ascii=False)
+            # Grava em arquivo temporário e troca atomicamente: uma falha no meio
+            # da escrita não corrompe o backup anterior
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(backup_data, separators=(',', ':'), ensure_ascii=False))
+            os.replace(tmp_file, self.BACKUP_FILE)
             self.logger.info(f"Backup salvo em: {self.BACKUP_FILE}")
             return True
         except Exception as e:
@@ -317,61 +690,90 @@ class DNSManager:
         if dns_type not in self.DNS_SERVERS and dns_type != 'auto':
             raise ValueError(f"Tipo de DNS '{dns_type}' não suportado. Use: {list(self.DNS_SERVERS.keys())}")
         
+        if dns_type == 'auto':
+            # Restaurar configuração automática (DHCP)
+            name_servers = ""
+            values = {
+                "EnableDHCP": (REG_DWORD, 1),
+                "NameServer": (REG_SZ, name_servers),
+            }
+        else:
+            # Configurar DNS específico com DHCP desabilitado; o Windows lê
+            # primário e secundário da mesma lista separada por vírgula
+            dns_config = self.DNS_SERVERS[dns_type]
+            name_servers = ','.join(filter(None, (dns_config['primary'], dns_config['secondary'])))
+            values = {
+                "EnableDHCP": (REG_DWORD, 0),
+                "NameServer": (REG_SZ, name_servers),
+                "DhcpNameServer": (REG_SZ, None),
+                "DomainNameServer": (REG_SZ, None),
+            }
+        wanted_servers = name_servers.split(',') if name_servers else []
+        
         try:
             adapters = self.detect_network_adapters()
             success_count = 0
+            unchanged_count = 0
             total_count = 0
             backup_data = []
+            pending = []
             
-            # Fazer backup das configurações atuais
+            # Leitura com direitos de consulta: uma chamada sem mudanças não exige escrita (nem admin)
             for adapter in adapters:
                 if adapter_name and adapter['name'] != adapter_name:
                     continue
-                    
-                backup = self._backup_current_dns(adapter['name'], adapter['registry_path'])
+                
+                total_count += 1
+                
+                try:
+                    with self._open_adapter_key(adapter['registry_path']) as key:
+                        backup = self._backup_current_dns(adapter['name'], key)
+                except Exception as e:
+                    self.logger.error(f"Erro ao configurar DNS para {adapter['name']}: {e}")
+                    continue
+                
                 backup_data.append(backup)
+                
+                # Nada a gravar se o adaptador já está na configuração pedida
+                current_servers = (backup['dns_servers']['primary'] or '').replace(',', ' ').split()
+                if backup['dhcp_enabled'] == (dns_type == 'auto') and current_servers == wanted_servers:
+                    self.logger.debug("DNS já configurado para: %s", adapter['name'])
+                    unchanged_count += 1
+                    continue
+                
+                pending.append(adapter)
             
-            # Salvar backup
-            if backup_data:
+            # Salvar backup antes de qualquer escrita (e não sobrescrevê-lo se nada mudar)
+            if backup_data and pending:
                 self._save_backup(backup_data)
             
-            # Configurar DNS
-            for adapter in adapters:
-                if adapter_name and adapter['name'] != adapter_name:
-                    continue
-                    
-                total_count += 1
-                
+            def _configure(adapter) -> bool:
                 try:
-                    registry_path = adapter['registry_path']
+                    # A chave é aberta para escrita só aqui, para os adaptadores que mudam
+                    self._apply_registry_batch(
+                        adapter['registry_path'], self._set_name_servers(adapter, name_servers, values)
+                    )
                     
-                    # Abrir a chave do registro com permissão de escrita
-                    with winreg.OpenKey(HKEY_LOCAL_MACHINE, registry_path, 0, KEY_ALL_ACCESS) as key:
-                        if dns_type == 'auto':
-                            # Restaurar configuração automática (DHCP)
-                            winreg.SetValueEx(key, "EnableDHCP", 0, REG_DWORD, 1)
-                            winreg.SetValueEx(key, "NameServer", 0, REG_SZ, "")
-                            self.logger.info(f"DHCP habilitado para: {adapter['name']}")
-                        else:
-                            # Configurar DNS específico
-                            dns_config = self.DNS_SERVERS[dns_type]
-                            
-                            # Desabilitar DHCP para DNS manual
-                            winreg.SetValueEx(key, "EnableDHCP", 0, REG_DWORD, 0)
-                            
-                            # Configurar DNS primário
-                            winreg.SetValueEx(key, "NameServer", 0, REG_SZ, dns_config['primary'])
-                            
-                            # Configurar DNS secundário (se disponível)
-                            if dns_config['secondary']:
-                                winreg.SetValueEx(key, "DomainNameServer", 0, REG_SZ, dns_config['secondary'])
-                            
-                            self.logger.info(f"DNS {dns_config['name']} configurado para: {adapter['name']}")
-                    
-                    success_count += 1
+                    if dns_type == 'auto':
+                        self.logger.info(f"DHCP habilitado para: {adapter['name']}")
+                    else:
+                        self.logger.info(f"DNS {dns_config['name']} configurado para: {adapter['name']}")
+                    return True
                     
                 except Exception as e:
                     self.logger.error(f"Erro ao configurar DNS para {adapter['name']}: {e}")
+                    return False
+            
+            # Configurar DNS
+            changed_count = sum(self._map_adapters(_configure, pending))
+            
+            success_count = changed_count + unchanged_count
+            
+            # Próxima resolução de caminho reenumera as interfaces
+            self._interface_keys = None
+            
+            if changed_count:
+                self._notify_dns_change()
             
             self.logger.info(f"Operação concluída: {success_count}/{total_count} adaptadores configurados")
             return success_count > 0
@@ -402,49 +804,61 @@ class DNSManager:
             success_count = 0
             total_count = 0
             
+            # Detectar adaptadores uma única vez e indexar por nome
+            adapters_by_name = {adapter['name']: adapter for adapter in self.detect_network_adapters()}
+            
+            to_restore = []
             for backup in backup_data:
                 if adapter_name and backup['adapter_name'] != adapter_name:
                     continue
                     
                 total_count += 1
                 
+                # Encontrar o adaptador atual
+                current_adapter = adapters_by_name.get(backup['adapter_name'])
+                
+                if not current_adapter:
+                    self.logger.warning(f"Adaptador {backup['adapter_name']} não encontrado para restauração")
+                    continue
+                
+                to_restore.append((backup, current_adapter))
+            
+            def _restore(item) -> bool:
+                backup, current_adapter = item
                 try:
-                    # Encontrar o adaptador atual
-                    adapters = self.detect_network_adapters()
-                    current_adapter = None
-                    
-                    for adapter in adapters:
-                        if adapter['name'] == backup['adapter_name']:
-                            current_adapter = adapter
-                            break
-                    
-                    if not current_adapter:
-                        self.logger.warning(f"Adaptador {backup['adapter_name']} não encontrado para restauração")
-                        continue
+                    # Restaurar configurações
+                    if backup['dhcp_enabled']:
+                        # Restaurar DHCP
+                        values = {
+                            "EnableDHCP": (REG_DWORD, 1),
+                            "NameServer": (REG_SZ, ""),
+                        }
+                    else:
+                        # Restaurar DNS manual (NameServer já contém a lista completa)
+                        values = {
+                            "EnableDHCP": (REG_DWORD, 0),
+                            "DomainNameServer": (REG_SZ, None),
+                        }
+                        
+                        if backup['dns_servers']['primary']:
+                            values["NameServer"] = (REG_SZ, backup['dns_servers']['primary'])
                     
-                    registry_path = current_adapter['registry_path']
+                    if "NameServer" in values:
+                        values = self._set_name_servers(current_adapter, values["NameServer"][1], values)
                     
-                    # Restaurar configurações
-                    with winreg.OpenKey(HKEY_LOCAL_MACHINE, registry_path, 0, KEY_ALL_ACCESS) as key:
-                        if backup['dhcp_enabled']:
-                            # Restaurar DHCP
-                            winreg.SetValueEx(key, "EnableDHCP", 0, REG_DWORD, 1)
-                            winreg.SetValueEx(key, "NameServer", 0, REG_SZ, "")
-                        else:
-                            # Restaurar DNS manual
-                            winreg.SetValueEx(key, "EnableDHCP", 0, REG_DWORD, 0)
-                            
-                            if backup['dns_servers']['primary']:
-                                winreg.SetValueEx(key, "NameServer", 0, REG_SZ, backup['dns_servers']['primary'])
-                            
-                            if backup['dns_servers']['secondary']:
-                                winreg.SetValueEx(key, "DomainNameServer", 0, REG_SZ, backup['dns_servers']['secondary'])
+                    self._apply_registry_batch(current_adapter['registry_path'], values)
                     
                     self.logger.info(f"Backup restaurado para: {backup['adapter_name']}")
-                    success_count += 1
+                    return True
                     
                 except Exception as e:
                     self.logger.error(f"Erro ao restaurar backup para {backup['adapter_name']}: {e}")
+                    return False
+            
+            success_count = sum(self._map_adapters(_restore, to_restore))
+            
+            if success_count:
+                self._notify_dns_change()
             
             self.logger.info(f"Restauração concluída: {success_count}/{total_count} adaptadores restaurados")
             return success_count > 0
@@ -453,6 +867,60 @@ class DNSManager:
             self.logger.error(f"Erro ao restaurar backup: {e}")
             raise
     
+    def _read_adapter_status(self, adapter: Dict) -> Dict:
+        """
+        Lê do registro o status DNS de um adaptador.
+        
+        Args:
+            adapter (Dict): Adaptador retornado por detect_network_adapters
+            
+        Returns:
+            Dict: Status DNS do adaptador
+        """
+        adapter_status = {
+            'name': adapter['name'],
+            'device_id': adapter['device_id'],
+            'dns_status': 'unknown',
+            'primary_dns': None,
+            'secondary_dns': None,
+            'dhcp_enabled': False,
+            'dns_type': None
+        }
+        
+        try:
+            registry_path = adapter['registry_path']
+            
+            # Uma abertura da chave e uma leitura por valor
+            with self._open_adapter_key(registry_path) as key:
+                values = _query_values(key, ("EnableDHCP", "NameServer"))
+            
+            dhcp_enabled = values["EnableDHCP"]
+            if dhcp_enabled is None:
+                adapter_status['dns_status'] = 'not_configured'
+            elif dhcp_enabled:
+                adapter_status['dhcp_enabled'] = True
+                adapter_status['dns_status'] = 'dhcp'
+                adapter_status['dns_type'] = 'Automático (DHCP)'
+            else:
+                adapter_status['dns_status'] = 'manual'
+                
+                # NameServer guarda a lista completa ("primário,secundário")
+                name_server = values["NameServer"]
+                if name_server is not None:
+                    servers = name_server.replace(',', ' ').split()
+                    primary_dns = servers[0] if servers else None
+                    adapter_status['primary_dns'] = primary_dns
+                    adapter_status['secondary_dns'] = servers[1] if len(servers) > 1 else None
+                    
+                    # Identificar tipo de DNS
+                    adapter_status['dns_type'] = self._DNS_BY_PRIMARY.get(primary_dns, 'DNS Personalizado')
+                    
+        except Exception as e:
+            self.logger.warning(f"Não foi possível verificar status DNS do adaptador {adapter['name']}: {e}")
+            adapter_status['dns_status'] = 'error'
+        
+        return adapter_status
+    
     def check_dns_status(self, adapter_name: Optional[str] = None) -> Dict:
         """
         Verifica o status atual das configurações DNS.
@@ -476,68 +944,13 @@ class DNSManager:
         }
         
         try:
-            adapters = self.detect_network_adapters()
+            adapters = [
+                adapter for adapter in self.detect_network_adapters()
+                if not adapter_name or adapter['name'] == adapter_name
+            ]
             
-            for adapter in adapters:
-                if adapter_name and adapter['name'] != adapter_name:
-                    continue
-                    
-                adapter_status = {
-                    'name': adapter['name'],
-                    'device_id': adapter['device_id'],
-                    'dns_status': 'unknown',
-                    'primary_dns': None,
-                    'secondary_dns': None,
-                    'dhcp_enabled': False,
-                    'dns_type': None
-                }
-                
-                try:
-                    registry_path = adapter['registry_path']
-                    
-                    with winreg.OpenKey(HKEY_LOCAL_MACHINE, registry_path, 0, KEY_READ) as key:
-                        try:
-                            # Verificar DHCP
-                            dhcp_enabled, _ = winreg.QueryValueEx(key, "EnableDHCP")
-                            adapter_status['dhcp_enabled'] = bool(dhcp_enabled)
-                            
-                            if dhcp_enabled:
-                                adapter_status['dns_status'] = 'dhcp'
-                                adapter_status['dns_type'] = 'Automático (DHCP)'
-                            else:
-                                adapter_status['dns_status'] = 'manual'
-                                
-                                # Verificar DNS primário
-                                try:
-                                    primary_dns, _ = winreg.QueryValueEx(key, "NameServer")
-                                    adapter_status['primary_dns'] = primary_dns
-                                    
-                                    # Identificar tipo de DNS
-                                    for dns_key, dns_config in self.DNS_SERVERS.items():
-                                        if primary_dns == dns_config['primary']:
-                                            adapter_status['dns_type'] = dns_config['name']
-                                            break
-                                    
-                                    if not adapter_status['dns_type']:
-                                        adapter_status['dns_type'] = 'DNS Personalizado'
-                                        
-                                except FileNotFoundError:
-                                    adapter_status['primary_dns'] = None
-                                
-                                # Verificar DNS secundário
-                                try:
-                                    secondary_dns, _ = winreg.QueryValueEx(key, "DomainNameServer")
-                                    adapter_status['secondary_dns'] = secondary_dns
-                                except FileNotFoundError:
-                                    adapter_status['secondary_dns'] = None
-                                    
-                        except FileNotFoundError:
-                            adapter_status['dns_status'] = 'not_configured'
-                            
-                except Exception as e:
-                    self.logger.warning(f"Não foi possível verificar status DNS do adaptador {adapter['name']}: {e}")
-                    adapter_status['dns_status'] = 'error'
-                
+            # Leituras de registro em paralelo; o resumo é montado na ordem original
+            for adapter, adapter_status in zip(adapters, self._map_adapters(self._read_adapter_status, adapters)):
                 status_info['adapters'][adapter['name']] = adapter_status
                 
                 # Atualizar resumo
@@ -621,55 +1034,47 @@ class DNSManager:
             self.logger.error(f"Erro ao listar adaptadores: {e}")
             raise
     
-    def __del__(self):
-        """Limpeza ao destruir o objeto."""
-        try:
-            pythoncom.CoUninitialize()
-        except:
-            pass
-
 
 # Funções de conveniência para uso direto
 def set_cloudflare_dns(adapter_name: Optional[str] = None):
     """Configura DNS Cloudflare para todos os adaptadores ou adaptador específico."""
-    manager = DNSManager()
+    manager = DNSManager.get_shared()
     return manager.set_cloudflare_dns(adapter_name)
 
 
 def set_google_dns(adapter_name: Optional[str] = None):
     """Configura DNS Google para todos os adaptadores ou adaptador específico."""
-    manager = DNSManager()
+    manager = DNSManager.get_shared()
     return manager.set_google_dns(adapter_name)
 
 
 def set_auto_dns(adapter_name: Optional[str] = None):
     """Restaura DNS automático (DHCP) para todos os adaptadores ou adaptador específico."""
-    manager = DNSManager()
+    manager = DNSManager.get_shared()
     return manager.set_auto_dns(adapter_name)
 
 
 def check_dns_status(adapter_name: Optional[str] = None):
     """Verifica o status DNS de todos os adaptadores ou adaptador específico."""
-    manager = DNSManager()
+    manager = DNSManager.get_shared()
     return manager.check_dns_status(adapter_name)
 
 
 def list_network_adapters():
     """Lista todos os adaptadores de rede disponíveis."""
-    manager = DNSManager()
+    manager = DNSManager.get_shared()
     return manager.list_network_adapters()
 
 
 def restore_dns_backup(adapter_name: Optional[str] = None):
     """Restaura as configurações DNS do backup."""
-    manager = DNSManager()
+    manager = DNSManager.get_shared()
     return manager.restore_dns_backup(adapter_name)
 
 
 def list_available_dns():
     """Lista todos os tipos de DNS disponíveis."""
-    manager = DNSManager()
-    return manager.list_available_dns()
+    return DNSManager.DNS_SERVERS.copy()
 
 
 # Exemplo de uso
@@ -678,45 +1083,44 @@ if __name__ == "__main__":
     print()
     
     try:
-        # Criar instância do gerenciador
-        manager = DNSManager()
-        
-        # Listar adaptadores disponíveis
-        print("1. Adaptadores de Rede Disponíveis:")
-        adapters = manager.list_network_adapters()
-        for i, adapter in enumerate(adapters, 1):
-            print(f"   {i}. {adapter}")
-        print()
-        
-        # Verificar status atual
-        print("2. Status Atual das Configurações DNS:")
-        status = manager.check_dns_status()
-        for adapter_name, adapter_status in status['adapters'].items():
-            print(f"   {adapter_name}:")
-            print(f"     Status: {adapter_status['dns_status']}")
-            print(f"     Tipo: {adapter_status['dns_type']}")
-            print(f"     DNS Primário: {adapter_status['primary_dns']}")
-            print(f"     DNS Secundário: {adapter_status['secondary_dns']}")
-            print(f"     DHCP: {'Habilitado' if adapter_status['dhcp_enabled'] else 'Desabilitado'}")
-        print()
-        
-        # Configurar DNS Cloudflare
-        print("3. Configurando DNS Cloudflare...")
-        success = manager.set_cloudflare_dns()
-        if success:
-            print("   [OK] DNS Cloudflare configurado com sucesso!")
-        else:
-            print("   [ERRO] Falha ao configurar DNS Cloudflare")
-        print()
-        
-        # Verificar novo status
-        print("4. Novo Status (após configuração Cloudflare):")
-        new_status = manager.check_dns_status()
-        for adapter_name, adapter_status in new_status['adapters'].items():
-            print(f"   {adapter_name}: {adapter_status['dns_type']}")
-        print()
-        
-        print("Operação concluída!")
+        # Criar instância do gerenciador (COM liberado ao sair do bloco)
+        with DNSManager() as manager:
+            # Listar adaptadores disponíveis
+            print("1. Adaptadores de Rede Disponíveis:")
+            adapters = manager.list_network_adapters()
+            for i, adapter in enumerate(adapters, 1):
+                print(f"   {i}. {adapter}")
+            print()
+            
+            # Verificar status atual
+            print("2. Status Atual das Configurações DNS:")
+            status = manager.check_dns_status()
+            for adapter_name, adapter_status in status['adapters'].items():
+                print(f"   {adapter_name}:")
+                print(f"     Status: {adapter_status['dns_status']}")
+                print(f"     Tipo: {adapter_status['dns_type']}")
+                print(f"     DNS Primário: {adapter_status['primary_dns']}")
+                print(f"     DNS Secundário: {adapter_status['secondary_dns']}")
+                print(f"     DHCP: {'Habilitado' if adapter_status['dhcp_enabled'] else 'Desabilitado'}")
+            print()
+            
+            # Configurar DNS Cloudflare
+            print("3. Configurando DNS Cloudflare...")
+            success = manager.set_cloudflare_dns()
+            if success:
+                print("   [OK] DNS Cloudflare configurado com sucesso!")
+            else:
+                print("   [ERRO] Falha ao configurar DNS Cloudflare")
+            print()
+            
+            # Verificar novo status
+            print("4. Novo Status (após configuração Cloudflare):")
+            new_status = manager.check_dns_status()
+            for adapter_name, adapter_status in new_status['adapters'].items():
+                print(f"   {adapter_name}: {adapter_status['dns_type']}")
+            print()
+            
+            print("Operação concluída!")
         
     except Exception as e:
         print(f"Erro durante a execução: {e}")
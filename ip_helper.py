@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Módulo de Acesso à API IP Helper do Windows
+===========================================
+
+Enumeração de adaptadores de rede via `GetAdaptersAddresses` e das interfaces
+IP via `GetIpInterfaceTable` (iphlpapi.dll) usando ctypes, sem passar por
+COM/WMI nem por netsh. Compartilhado pelos módulos de automação que precisam
+listar adaptadores rapidamente.
+
+Autor: Sistema de Automação
+Versão: 1.0.0
+Data: 2025-12-12
+"""
+
+import ctypes
+import threading
+import types
+import uuid
+from ctypes import (
+    POINTER, Structure, c_char_p, c_int, c_size_t, c_uint32, c_uint64, c_ulong, c_ubyte, c_ushort,
+    c_void_p, c_wchar_p,
+)
+from typing import Dict, List
+
+# Famílias de endereço
+AF_UNSPEC = 0
+AF_INET = 2
+
+# Flags de GetAdaptersAddresses: pulamos tudo que não é usado na enumeração
+GAA_FLAG_SKIP_UNICAST = 0x0001
+GAA_FLAG_SKIP_ANYCAST = 0x0002
+GAA_FLAG_SKIP_MULTICAST = 0x0004
+GAA_FLAG_SKIP_DNS_SERVER = 0x0008
+GAA_FLAG_SKIP_DNS_INFO = 0x0800
+GAA_FLAGS_ENUMERATE_ONLY = (
+    GAA_FLAG_SKIP_DNS_INFO
+    | GAA_FLAG_SKIP_UNICAST
+    | GAA_FLAG_SKIP_ANYCAST
+    | GAA_FLAG_SKIP_MULTICAST
+    | GAA_FLAG_SKIP_DNS_SERVER
+)
+
+# Códigos de retorno
+ERROR_SUCCESS = 0
+ERROR_BUFFER_OVERFLOW = 111
+ERROR_NO_DATA = 232
+
+# IP_ADAPTER_ADDRESSES.Flags
+IP_ADAPTER_IPV4_ENABLED = 0x0080
+IP_ADAPTER_IPV6_ENABLED = 0x0100
+
+# Tipos de interface (IfType) e estados operacionais (OperStatus)
+IF_TYPE_ETHERNET_CSMACD = 6
+IF_TYPE_SOFTWARE_LOOPBACK = 24
+IF_TYPE_IEEE80211 = 71
+IF_TYPE_TUNNEL = 131
+IF_OPER_STATUS_UP = 1
+IF_OPER_STATUS_DORMANT = 5
+
+IF_TYPE_NAMES = {
+    IF_TYPE_ETHERNET_CSMACD: 'Ethernet 802.3',
+    IF_TYPE_IEEE80211: 'Wireless',
+    IF_TYPE_SOFTWARE_LOOPBACK: 'Loopback',
+    IF_TYPE_TUNNEL: 'Tunnel',
+}
+
+# Tamanho inicial recomendado pela documentação da Microsoft
+DEFAULT_BUFFER_SIZE = 15 * 1024
+
+# Tamanho máximo (em caracteres, sem o terminador) do alias de uma interface
+IF_MAX_STRING_SIZE = 256
+
+# SetInterfaceDnsSettings (Windows 10 2004+)
+DNS_INTERFACE_SETTINGS_VERSION1 = 1
+DNS_SETTING_IPV6 = 0x0001
+DNS_SETTING_NAMESERVER = 0x0002
+
+
+class IP_ADAPTER_ADDRESSES(Structure):
+    """Prefixo de IP_ADAPTER_ADDRESSES_LH com os campos usados aqui (até ReceiveLinkSpeed)."""
+
+
+IP_ADAPTER_ADDRESSES._fields_ = [
+    ("Length", c_ulong),
+    ("IfIndex", c_ulong),
+    ("Next", POINTER(IP_ADAPTER_ADDRESSES)),
+    ("AdapterName", c_char_p),
+    ("FirstUnicastAddress", c_void_p),
+    ("FirstAnycastAddress", c_void_p),
+    ("FirstMulticastAddress", c_void_p),
+    ("FirstDnsServerAddress", c_void_p),
+    ("DnsSuffix", c_wchar_p),
+    ("Description", c_wchar_p),
+    ("FriendlyName", c_wchar_p),
+    ("PhysicalAddress", c_ubyte * 8),
+    ("PhysicalAddressLength", c_ulong),
+    ("Flags", c_ulong),
+    ("Mtu", c_ulong),
+    ("IfType", c_ulong),
+    ("OperStatus", c_int),
+    ("Ipv6IfIndex", c_ulong),
+    ("ZoneIndices", c_ulong * 16),
+    ("FirstPrefix", c_void_p),
+    ("TransmitLinkSpeed", c_uint64),
+    ("ReceiveLinkSpeed", c_uint64),
+]
+
+
+class MIB_IPINTERFACE_ROW(Structure):
+    _fields_ = [
+        ("Family", c_ushort),
+        ("InterfaceLuid", c_uint64),
+        ("InterfaceIndex", c_ulong),
+        ("MaxReassemblySize", c_ulong),
+        ("InterfaceIdentifier", c_uint64),
+        ("MinRouterAdvertisementInterval", c_ulong),
+        ("MaxRouterAdvertisementInterval", c_ulong),
+        ("AdvertisingEnabled", c_ubyte),
+        ("ForwardingEnabled", c_ubyte),
+        ("WeakHostSend", c_ubyte),
+        ("WeakHostReceive", c_ubyte),
+        ("UseAutomaticMetric", c_ubyte),
+        ("UseNeighborUnreachabilityDetection", c_ubyte),
+        ("ManagedAddressConfigurationSupported", c_ubyte),
+        ("OtherStatefulConfigurationSupported", c_ubyte),
+        ("AdvertiseDefaultRoute", c_ubyte),
+        ("RouterDiscoveryBehavior", c_int),
+        ("DadTransmits", c_ulong),
+        ("BaseReachableTime", c_ulong),
+        ("RetransmitTime", c_ulong),
+        ("PathMtuDiscoveryTimeout", c_ulong),
+        ("LinkLocalAddressBehavior", c_int),
+        ("LinkLocalAddressTimeout", c_ulong),
+        ("ZoneIndices", c_ulong * 16),
+        ("SitePrefixLength", c_ulong),
+        ("Metric", c_ulong),
+        ("NlMtu", c_ulong),
+        ("Connected", c_ubyte),
+        ("SupportsWakeUpPatterns", c_ubyte),
+        ("SupportsNeighborDiscovery", c_ubyte),
+        ("SupportsRouterDiscovery", c_ubyte),
+        ("ReachableTime", c_ulong),
+        ("TransmitOffload", c_ubyte),
+        ("ReceiveOffload", c_ubyte),
+        ("DisableDefaultRoutes", c_ubyte),
+    ]
+
+
+class MIB_IPINTERFACE_TABLE(Structure):
+    """Cabeçalho da tabela; as linhas seguem em `Table` (array de tamanho variável)."""
+    _fields_ = [
+        ("NumEntries", c_ulong),
+        ("Table", MIB_IPINTERFACE_ROW * 1),
+    ]
+
+
+class GUID(Structure):
+    _fields_ = [
+        ("Data1", c_uint32),
+        ("Data2", c_ushort),
+        ("Data3", c_ushort),
+        ("Data4", c_ubyte * 8),
+    ]
+
+
+class DNS_INTERFACE_SETTINGS(Structure):
+    _fields_ = [
+        ("Version", c_ulong),
+        ("Flags", c_uint64),
+        ("Domain", c_wchar_p),
+        ("NameServer", c_wchar_p),
+        ("SearchList", c_wchar_p),
+        ("RegistrationEnabled", c_ulong),
+        ("RegisterAdapterName", c_ulong),
+        ("EnableLLMNR", c_ulong),
+        ("QueryAdapterName", c_ulong),
+        ("ProfileNameServer", c_wchar_p),
+    ]
+
+
+_get_adapters_addresses = None
+_set_interface_dns_settings = None
+_ip_interface_api = None
+
+
+def _load_get_adapters_addresses():
+    """Resolve iphlpapi!GetAdaptersAddresses uma única vez (OSError fora do Windows)."""
+    global _get_adapters_addresses
+    if _get_adapters_addresses is None:
+        if not hasattr(ctypes, 'WinDLL'):
+            raise OSError("iphlpapi.dll só está disponível no Windows")
+        func = ctypes.WinDLL('iphlpapi').GetAdaptersAddresses
+        func.argtypes = [c_ulong, c_ulong, c_void_p, c_void_p, POINTER(c_ulong)]
+        func.restype = c_ulong
+        _get_adapters_addresses = func
+    return _get_adapters_addresses
+
+
+def _load_set_interface_dns_settings():
+    """Resolve iphlpapi!SetInterfaceDnsSettings; None se o Windows for anterior ao 10 2004."""
+    global _set_interface_dns_settings
+    if _set_interface_dns_settings is None:
+        if not hasattr(ctypes, 'WinDLL'):
+            return None
+        try:
+            func = ctypes.WinDLL('iphlpapi').SetInterfaceDnsSettings
+        except AttributeError:
+            return None
+        func.argtypes = [GUID, POINTER(DNS_INTERFACE_SETTINGS)]
+        func.restype = c_ulong
+        _set_interface_dns_settings = func
+    return _set_interface_dns_settings
+
+
+def _load_ip_interface_api():
+    """
+    Resolve as funções de interface IP do iphlpapi uma única vez (OSError fora do Windows).
+    """
+    global _ip_interface_api
+    if _ip_interface_api is None:
+        if not hasattr(ctypes, 'WinDLL'):
+            raise OSError("iphlpapi.dll só está disponível no Windows")
+        iphlpapi = ctypes.WinDLL('iphlpapi')
+        
+        def bind(name, argtypes, restype=c_ulong):
+            func = getattr(iphlpapi, name)
+            func.argtypes = argtypes
+            func.restype = restype
+            return func
+        
+        _ip_interface_api = types.SimpleNamespace(
+            get_table=bind('GetIpInterfaceTable', [c_ushort, POINTER(POINTER(MIB_IPINTERFACE_TABLE))]),
+            free_table=bind('FreeMibTable', [c_void_p], None),
+            get_entry=bind('GetIpInterfaceEntry', [POINTER(MIB_IPINTERFACE_ROW)]),
+            set_entry=bind('SetIpInterfaceEntry', [POINTER(MIB_IPINTERFACE_ROW)]),
+            luid_to_alias=bind('ConvertInterfaceLuidToAlias', [POINTER(c_uint64), c_wchar_p, c_size_t]),
+            alias_to_luid=bind('ConvertInterfaceAliasToLuid', [c_wchar_p, POINTER(c_uint64)]),
+            luid_to_guid=bind('ConvertInterfaceLuidToGuid', [POINTER(c_uint64), POINTER(GUID)]),
+        )
+    return _ip_interface_api
+
+
+def get_ip_interfaces(family: int = AF_INET) -> List[Dict]:
+    """
+    Lista as interfaces IP (as "subinterfaces" do netsh) com MTU e estado.
+    
+    Args:
+        family (int): Família de endereço (default: AF_INET)
+    
+    Returns:
+        List[Dict]: Um dicionário por interface (name, mtu, connected, if_index, if_type)
+    
+    Raises:
+        OSError: Se a API não estiver disponível ou retornar erro
+    """
+    api = _load_ip_interface_api()
+    
+    table = POINTER(MIB_IPINTERFACE_TABLE)()
+    ret = api.get_table(family, ctypes.byref(table))
+    if ret != ERROR_SUCCESS:
+        raise OSError(ret, f"GetIpInterfaceTable falhou com código {ret}")
+    
+    try:
+        count = table.contents.NumEntries
+        rows = ctypes.cast(
+            ctypes.addressof(table.contents.Table), POINTER(MIB_IPINTERFACE_ROW * count)
+        ).contents
+        alias = ctypes.create_unicode_buffer(IF_MAX_STRING_SIZE + 1)
+        
+        interfaces = []
+        for row in rows:
+            luid = c_uint64(row.InterfaceLuid)
+            if api.luid_to_alias(ctypes.byref(luid), alias, len(alias)) != ERROR_SUCCESS:
+                continue
+            interfaces.append({
+                'name': alias.value,
+                'mtu': row.NlMtu,
+                'connected': bool(row.Connected),
+                'if_index': row.InterfaceIndex,
+                # NET_LUID: o IfType ocupa os 16 bits mais altos
+                'if_type': row.InterfaceLuid >> 48,
+            })
+        return interfaces
+    finally:
+        api.free_table(table)
+
+
+def _alias_to_luid(api, alias: str) -> c_uint64:
+    luid = c_uint64()
+    ret = api.alias_to_luid(alias, ctypes.byref(luid))
+    if ret != ERROR_SUCCESS:
+        raise OSError(ret, f"ConvertInterfaceAliasToLuid falhou com código {ret}: {alias}")
+    return luid
+
+
+def set_ip_interface_mtu(alias: str, mtu: int, family: int = AF_INET) -> None:
+    """
+    Altera o MTU IP (NlMtu) de uma interface em execução, sem passar pelo netsh.
+    
+    Args:
+        alias (str): Nome da interface (ex.: "Ethernet")
+        mtu (int): Novo MTU
+        family (int): Família de endereço (default: AF_INET)
+    
+    Raises:
+        OSError: Se a API não estiver disponível, a interface não existir ou a alteração falhar
+    """
+    api = _load_ip_interface_api()
+    
+    row = MIB_IPINTERFACE_ROW()
+    row.Family = family
+    row.InterfaceLuid = _alias_to_luid(api, alias).value
+    ret = api.get_entry(ctypes.byref(row))
+    if ret != ERROR_SUCCESS:
+        raise OSError(ret, f"GetIpInterfaceEntry falhou com código {ret}: {alias}")
+    
+    row.NlMtu = mtu
+    # Exigido pela API para IPv4: o valor lido não pode ser devolvido
+    row.SitePrefixLength = 0
+    ret = api.set_entry(ctypes.byref(row))
+    if ret != ERROR_SUCCESS:
+        raise OSError(ret, f"SetIpInterfaceEntry falhou com código {ret}: {alias}")
+
+
+def get_interface_guid(alias: str) -> str:
+    """
+    Converte o nome de uma interface no GUID usado nas chaves de registro do Tcpip.
+    
+    Args:
+        alias (str): Nome da interface (ex.: "Ethernet")
+    
+    Returns:
+        str: GUID no formato "{xxxxxxxx-...}"
+    
+    Raises:
+        OSError: Se a API não estiver disponível ou a interface não existir
+    """
+    api = _load_ip_interface_api()
+    luid = _alias_to_luid(api, alias)
+    guid = GUID()
+    ret = api.luid_to_guid(ctypes.byref(luid), ctypes.byref(guid))
+    if ret != ERROR_SUCCESS:
+        raise OSError(ret, f"ConvertInterfaceLuidToGuid falhou com código {ret}: {alias}")
+    return f"{{{uuid.UUID(bytes_le=bytes(guid))}}}"
+
+
+def set_interface_dns_servers(adapter_name: str, name_servers: str, ipv6: bool = False) -> bool:
+    """
+    Define os servidores DNS de uma interface pelo serviço de DNS do Windows.
+    
+    Args:
+        adapter_name (str): GUID do adaptador (AdapterName de GetAdaptersAddresses)
+        name_servers (str): Servidores separados por vírgula; vazio volta ao DHCP
+        ipv6 (bool): Se True, altera a lista IPv6 em vez da IPv4
+    
+    Returns:
+        bool: False se a API não existir neste Windows ou o ID não for um GUID
+    
+    Raises:
+        OSError: Se a API retornar erro
+    """
+    set_dns = _load_set_interface_dns_settings()
+    if set_dns is None:
+        return False
+    
+    try:
+        guid = GUID.from_buffer_copy(uuid.UUID(adapter_name.strip('{}')).bytes_le)
+    except ValueError:
+        return False
+    
+    settings = DNS_INTERFACE_SETTINGS()
+    settings.Version = DNS_INTERFACE_SETTINGS_VERSION1
+    settings.Flags = DNS_SETTING_NAMESERVER | (DNS_SETTING_IPV6 if ipv6 else 0)
+    settings.NameServer = name_servers
+    
+    ret = set_dns(guid, ctypes.byref(settings))
+    if ret != ERROR_SUCCESS:
+        raise OSError(ret, f"SetInterfaceDnsSettings falhou com código {ret}")
+    return True
+
+
+def _format_mac(entry: IP_ADAPTER_ADDRESSES) -> str:
+    length = min(entry.PhysicalAddressLength, len(entry.PhysicalAddress))
+    return ':'.join(f"{b:02X}" for b in entry.PhysicalAddress[:length])
+
+
+class AdapterAddressesReader:
+    """
+    Leitor de `GetAdaptersAddresses` que lembra o tamanho de buffer necessário.
+
+    A primeira chamada usa DEFAULT_BUFFER_SIZE; se o Windows pedir mais espaço
+    (ERROR_BUFFER_OVERFLOW), o tamanho informado é guardado e reutilizado, de
+    modo que as próximas enumerações normalmente saem em uma única chamada.
+    O próprio buffer também é mantido entre chamadas e só é realocado quando
+    precisa crescer; o lock serializa as leituras que o compartilham.
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self._buffer = None
+        self._lock = threading.Lock()
+
+    def read(self, flags: int = GAA_FLAGS_ENUMERATE_ONLY, family: int = AF_UNSPEC) -> List[Dict]:
+        """
+        Enumera os adaptadores de rede.
+
+        Args:
+            flags (int): Flags GAA_FLAG_* (default: apenas enumeração)
+            family (int): Família de endereço (default: AF_UNSPEC)
+
+        Returns:
+            List[Dict]: Um dicionário por adaptador
+
+        Raises:
+            OSError: Se a API não estiver disponível ou retornar erro
+        """
+        get_adapters_addresses = _load_get_adapters_addresses()
+
+        with self._lock:
+            for _ in range(3):
+                if self._buffer is None or len(self._buffer) < self.buffer_size:
+                    self._buffer = ctypes.create_string_buffer(self.buffer_size)
+                size = c_ulong(len(self._buffer))
+                ret = get_adapters_addresses(family, flags, None, self._buffer, ctypes.byref(size))
+                if ret == ERROR_BUFFER_OVERFLOW:
+                    # Guarda o tamanho pedido para as próximas chamadas
+                    self.buffer_size = size.value
+                    continue
+                if ret == ERROR_NO_DATA:
+                    return []
+                if ret != ERROR_SUCCESS:
+                    raise OSError(ret, f"GetAdaptersAddresses falhou com código {ret}")
+                # _parse copia tudo para objetos Python, então o buffer pode ser reutilizado
+                return self._parse(self._buffer)
+
+        raise OSError(ERROR_BUFFER_OVERFLOW, "GetAdaptersAddresses: buffer insuficiente após novas tentativas")
+
+    @staticmethod
+    def _parse(buffer) -> List[Dict]:
+        adapters = []
+        node = ctypes.cast(buffer, POINTER(IP_ADAPTER_ADDRESSES))
+        while node:
+            entry = node.contents
+            adapters.append({
+                'adapter_name': (entry.AdapterName or b'').decode('ascii', 'replace'),
+                'friendly_name': entry.FriendlyName,
+                'description': entry.Description,
+                'mac_address': _format_mac(entry),
+                'if_index': entry.IfIndex,
+                'if_type': entry.IfType,
+                'oper_status': entry.OperStatus,
+                'mtu': entry.Mtu,
+                'ipv4_enabled': bool(entry.Flags & IP_ADAPTER_IPV4_ENABLED),
+                'ipv6_enabled': bool(entry.Flags & IP_ADAPTER_IPV6_ENABLED),
+                'transmit_link_speed': entry.TransmitLinkSpeed,
+            })
+            node = entry.Next
+        return adapters
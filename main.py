@@ -27,26 +27,104 @@ Versão: 2.0.0 - Focado em Casino/Nano Trade
 Data: 2025-12-12
 """
 
+import atexit
 import logging
 import os
+import queue
+import select
 import sys
+import threading
 import time
 import ctypes
 import traceback
-import importlib
 import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import cached_property
+from importlib.util import find_spec
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
 
+# Log de depuração do executável: desligado, a menos que TRADING_OPT_DEBUG=1
+_DEBUG_ENABLED = os.environ.get("TRADING_OPT_DEBUG", "") == "1"
+
+_LOG_QUEUE: "queue.SimpleQueue[object]" = queue.SimpleQueue()
+_LOG_STOP = object()
+_LOG_WORKER: Optional[threading.Thread] = None
+_LOG_WORKER_LOCK = threading.Lock()
+
+
+def _debug_log_path() -> Path:
+    exe_path = Path(getattr(sys, "executable", "")).resolve()
+    project_root = exe_path.parent.parent if exe_path.parent.name.lower() == "dist" else exe_path.parent
+    return project_root / ".cursor" / "debug.log"
+
+
+_LOG_PATH: Optional[Path] = _debug_log_path() if _DEBUG_ENABLED else None
+
+
+def _log_worker() -> None:
+    """Drena _LOG_QUEUE mantendo o arquivo aberto e gravando as linhas em lote."""
+    try:
+        log_path = _LOG_PATH
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        fh = log_path.open("a", encoding="utf-8", buffering=1 << 16)
+    except Exception:
+        fh = None
+
+    while True:
+        batch = [_LOG_QUEUE.get()]
+        while True:
+            try:
+                batch.append(_LOG_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+
+        stop = _LOG_STOP in batch
+        if fh is not None:
+            try:
+                fh.writelines(line for line in batch if line is not _LOG_STOP)
+                fh.flush()
+            except Exception:
+                pass
+        if stop:
+            break
+
+    if fh is not None:
+        try:
+            fh.close()
+        except Exception:
+            pass
+
+
+def _stop_log_worker() -> None:
+    """Grava o que ainda está na fila antes de o processo terminar."""
+    worker = _LOG_WORKER
+    if worker is not None and worker.is_alive():
+        _LOG_QUEUE.put(_LOG_STOP)
+        worker.join(timeout=2.0)
+
+
+def _ensure_log_worker() -> None:
+    global _LOG_WORKER
+    if _LOG_WORKER is not None:
+        return
+    with _LOG_WORKER_LOCK:
+        if _LOG_WORKER is None:
+            worker = threading.Thread(target=_log_worker, name="debug-log-writer", daemon=True)
+            worker.start()
+            atexit.register(_stop_log_worker)
+            _LOG_WORKER = worker
+
+
 def _agent_debug_log_runtime(*, run_id: str, hypothesis_id: str, location: str, message: str, data: dict) -> None:
+    if not _DEBUG_ENABLED:
+        return
     # region agent log
     try:
-        exe_path = Path(getattr(sys, "executable", "")).resolve()
-        project_root = exe_path.parent.parent if exe_path.parent.name.lower() == "dist" else exe_path.parent
-        log_path = project_root / ".cursor" / "debug.log"
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        log_path.open("a", encoding="utf-8").write(
+        _ensure_log_worker()
+        _LOG_QUEUE.put(
             json.dumps(
                 {
                     "sessionId": "debug-session",
@@ -58,6 +136,8 @@ def _agent_debug_log_runtime(*, run_id: str, hypothesis_id: str, location: str,
                     "timestamp": int(time.time() * 1000),
                 },
                 ensure_ascii=False,
+                separators=(",", ":"),
+                default=str,
             )
             + "\n"
         )
@@ -85,6 +165,10 @@ def _configure_console_output() -> None:
     Mantém o programa vivo mesmo com emojis/acentos.
     """
     for stream in (sys.stdout, sys.stderr):
+        encoding = getattr(stream, "encoding", None) or ""
+        if encoding.lower().replace("-", "") == "utf8":
+            # Já está em UTF-8: nada a reconfigurar
+            continue
         try:
             # Python 3.7+ (TextIOWrapper)
             stream.reconfigure(encoding="utf-8", errors="replace")
@@ -92,6 +176,84 @@ def _configure_console_output() -> None:
             # Se não suportar, seguimos; prints podem ser substituídos em alguns ambientes.
             pass
 
+    encoding = (getattr(sys.stdout, "encoding", None) or "").lower()
+    if not encoding.startswith("utf"):
+        _use_ascii_banners()
+
+
+# Emojis dos textos fixos -> marcadores ASCII (consoles que não ficaram em UTF-8)
+_EMOJI_TABLE = str.maketrans({
+    "🎰": "[*]",
+    "🌐": "[DNS]",
+    "📡": "[LSO]",
+    "🔧": "[MTU]",
+    "⚡": "[PWR]",
+    "🔄": "[RESET]",
+    "🔒": "[SSL]",
+    "🚀": "[SYS]",
+    "🔨": "[REP]",
+    "⏱": "[TCP]",
+    "🎯": "[>]",
+    "💰": "[$]",
+    "💡": "[i]",
+    "📋": "[=]",
+    "✅": "[OK]",
+    "❌": "[X]",
+    "❓": "[?]",
+    "📝": "[>>]",
+    "⏰": "[T]",
+    "🔥": "[!!]",
+    "🎊": "[**]",
+    "📊": "[#]",
+    "⚠": "[!]",
+    "•": "-",
+    "\ufe0f": None,
+})
+
+
+def _use_ascii_banners() -> None:
+    """Troca, uma única vez, os emojis dos textos pré-montados por marcadores ASCII."""
+    global _MAIN_MENU_TEXT, _ADMIN_WARNING_TEXT, _STATUS_ADMIN, _STATUS_NO_ADMIN
+    global _ALL_FIXES_HEADER, _ALL_FIXES_FOOTER, _ALL_FIXES_STATUS_OK, _ALL_FIXES_STATUS_PARTIAL
+    _MAIN_MENU_TEXT = _MAIN_MENU_TEXT.translate(_EMOJI_TABLE)
+    _ADMIN_WARNING_TEXT = _ADMIN_WARNING_TEXT.translate(_EMOJI_TABLE)
+    _STATUS_ADMIN = _STATUS_ADMIN.translate(_EMOJI_TABLE)
+    _STATUS_NO_ADMIN = _STATUS_NO_ADMIN.translate(_EMOJI_TABLE)
+    _ALL_FIXES_HEADER = _ALL_FIXES_HEADER.translate(_EMOJI_TABLE)
+    _ALL_FIXES_FOOTER = _ALL_FIXES_FOOTER.translate(_EMOJI_TABLE)
+    _ALL_FIXES_STATUS_OK = _ALL_FIXES_STATUS_OK.translate(_EMOJI_TABLE)
+    _ALL_FIXES_STATUS_PARTIAL = _ALL_FIXES_STATUS_PARTIAL.translate(_EMOJI_TABLE)
+    for detail in _OPTION_DETAILS.values():
+        detail["rendered"] = detail["rendered"].translate(_EMOJI_TABLE)
+        detail["prompt"] = detail["prompt"].translate(_EMOJI_TABLE)
+
+
+# (módulo, classe) de cada gerenciador; a classe vira um global de mesmo nome
+_MANAGERS: tuple[tuple[str, str], ...] = (
+    ("dns_automation", "DNSManager"),
+    ("lso_automation", "LSOManager"),
+    ("mtu_automation", "MTUManager"),
+    ("network_adapter_automation", "NetworkAdapterManager"),
+    ("network_reset_automation", "NetworkResetManager"),
+    ("ssl_automation", "SSLManager"),
+    ("system_automation", "SystemAutomationManager"),
+    ("system_repair_automation", "SystemRepairManager"),
+    ("tcp_timeout_automation", "TCPTimeoutManager"),
+)
+
+# Gerenciadores que não puderam ser importados (atualizado por _attempt_import_managers)
+_MISSING_MANAGERS: tuple[str, ...] = tuple(attr_name for _, attr_name in _MANAGERS)
+
+
+def _import_manager(entry: tuple[str, str]):
+    """Importa um gerenciador; retorna (classe, None) ou (None, exceção)."""
+    module_name, attr_name = entry
+    try:
+        module = __import__(module_name, fromlist=(attr_name,))
+        return getattr(module, attr_name), None
+    except Exception as e:
+        return None, e
+
 
 def _attempt_import_managers() -> list[str]:
     """
@@ -99,46 +261,39 @@ def _attempt_import_managers() -> list[str]:
 
     Retorna uma lista de erros (strings) se algo falhar.
     """
-    global DNSManager
-    global LSOManager
-    global MTUManager
-    global NetworkAdapterManager
-    global NetworkResetManager
-    global SSLManager
-    global SystemAutomationManager
-    global SystemRepairManager
-    global TCPTimeoutManager
     global _MANAGER_IMPORT_ERRORS
+    global _MISSING_MANAGERS
 
     errors: list[str] = []
 
-    _agent_debug_log_runtime(
-        run_id="import-debug",
-        hypothesis_id="H2",
-        location="main.py:_attempt_import_managers",
-        message="Starting manager imports",
-        data={
-            "cwd": os.getcwd(),
-            "sys_executable": getattr(sys, "executable", None),
-            "has_meipass": hasattr(sys, "_MEIPASS"),
-            "meipass": getattr(sys, "_MEIPASS", None),
-            "sys_path_head": list(sys.path[:8]),
-        },
-    )
+    if _DEBUG_ENABLED:
+        _agent_debug_log_runtime(
+            run_id="import-debug",
+            hypothesis_id="H2",
+            location="main.py:_attempt_import_managers",
+            message="Starting manager imports",
+            data={
+                "cwd": os.getcwd(),
+                "sys_executable": getattr(sys, "executable", None),
+                "has_meipass": hasattr(sys, "_MEIPASS"),
+                "meipass": getattr(sys, "_MEIPASS", None),
+                "sys_path_head": list(sys.path[:8]),
+            },
+        )
 
-    def _import_attr(module_name: str, attr_name: str):
-        try:
-            _agent_debug_log_runtime(
-                run_id="import-debug",
-                hypothesis_id="H1",
-                location="main.py:_attempt_import_managers:_import_attr",
-                message="Import attempt",
-                data={"module": module_name, "attr": attr_name},
-            )
-            module = importlib.import_module(module_name)
-            return getattr(module, attr_name)
-        except Exception as e:
+    # Imports independentes em paralelo (sobrepõe a leitura de disco); os globais
+    # são atribuídos depois, nesta thread
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(_import_manager, _MANAGERS))
+
+    namespace = globals()
+    for (module_name, attr_name), (manager_cls, e) in zip(_MANAGERS, results):
+        namespace[attr_name] = manager_cls
+        if e is not None:
             errors.append(f"{module_name}.{attr_name}: {e}")
+            if not _DEBUG_ENABLED:
+                continue
+
             try:
                 meipass = Path(getattr(sys, "_MEIPASS", "")) if hasattr(sys, "_MEIPASS") else None
                 in_meipass = (meipass / f"{module_name}.py").exists() if meipass else None
@@ -148,7 +303,7 @@ def _attempt_import_managers() -> list[str]:
             _agent_debug_log_runtime(
                 run_id="import-debug",
                 hypothesis_id="H1",
-                location="main.py:_attempt_import_managers:_import_attr",
+                location="main.py:_attempt_import_managers",
                 message="Import failed",
                 data={
                     "module": module_name,
@@ -158,19 +313,11 @@ def _attempt_import_managers() -> list[str]:
                     "in_meipass_py": in_meipass,
                 },
             )
-            return None
-
-    DNSManager = _import_attr("dns_automation", "DNSManager")
-    LSOManager = _import_attr("lso_automation", "LSOManager")
-    MTUManager = _import_attr("mtu_automation", "MTUManager")
-    NetworkAdapterManager = _import_attr("network_adapter_automation", "NetworkAdapterManager")
-    NetworkResetManager = _import_attr("network_reset_automation", "NetworkResetManager")
-    SSLManager = _import_attr("ssl_automation", "SSLManager")
-    SystemAutomationManager = _import_attr("system_automation", "SystemAutomationManager")
-    SystemRepairManager = _import_attr("system_repair_automation", "SystemRepairManager")
-    TCPTimeoutManager = _import_attr("tcp_timeout_automation", "TCPTimeoutManager")
 
     _MANAGER_IMPORT_ERRORS = errors
+    _MISSING_MANAGERS = tuple(
+        attr_name for (_, attr_name), (manager_cls, _) in zip(_MANAGERS, results) if manager_cls is None
+    )
     _agent_debug_log_runtime(
         run_id="import-debug",
         hypothesis_id="H1",
@@ -181,129 +328,30 @@ def _attempt_import_managers() -> list[str]:
     return errors
 
 
-class TradingOptimizerOrchestrator:
-    """
-    Orquestrador Principal para Otimização de Trading
-    
-    Esta classe gerencia a execução de todos os módulos de otimização,
-    focando especificamente em melhorar a performance para trading
-    profissional (casino e nano trade).
-    
-    OBJETIVO: Eliminar gargalos de rede que causam perdas financeiras
-    em operações de alta frequência e volatilidade extrema.
-    """
-    
-    def __init__(self):
-        """Inicializa o orquestrador focado em trading."""
-        self._setup_logging()
-        self.logger = logging.getLogger(__name__)
-        self.logger.info("Inicializando TradingOptimizerOrchestrator")
-        
-        # Verificar privilégios de administrador
-        self.is_admin = self._check_admin_privileges()
-        
-        # Inicializar todos os gerenciadores
-        self._initialize_managers()
-        
-    def _setup_logging(self) -> None:
-        """Configura o sistema de logging centralizado."""
-        log_file = Path("automation.log")
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler(log_file, encoding='utf-8')
-            ]
-        )
-        
-    def _check_admin_privileges(self) -> bool:
-        """
-        Verifica se o script está sendo executado com privilégios de administrador.
-        
-        Returns:
-            bool: True se está rodando como administrador
-        """
-        try:
-            return ctypes.windll.shell32.IsUserAnAdmin()
-        except:
-            return False
-            
-    def _initialize_managers(self) -> None:
-        """Inicializa todos os gerenciadores de automação."""
-        try:
-            self.logger.info("Inicializando gerenciadores de automação...")
+def _not_admin() -> bool:
+    return False
 
-            missing = []
-            for name, cls in [
-                ("DNSManager", DNSManager),
-                ("LSOManager", LSOManager),
-                ("MTUManager", MTUManager),
-                ("NetworkAdapterManager", NetworkAdapterManager),
-                ("NetworkResetManager", NetworkResetManager),
-                ("SSLManager", SSLManager),
-                ("SystemAutomationManager", SystemAutomationManager),
-                ("SystemRepairManager", SystemRepairManager),
-                ("TCPTimeoutManager", TCPTimeoutManager),
-            ]:
-                if cls is None:
-                    missing.append(name)
-
-            if missing:
-                details = "; ".join(_MANAGER_IMPORT_ERRORS) if _MANAGER_IMPORT_ERRORS else "Sem detalhes adicionais."
-                raise RuntimeError(
-                    "Módulos de automação não carregados. "
-                    f"Faltando: {', '.join(missing)}. "
-                    f"Detalhes: {details}"
-                )
-            
-            self.dns_manager = DNSManager()
-            self.lso_manager = LSOManager()
-            self.mtu_manager = MTUManager()
-            self.adapter_manager = NetworkAdapterManager()
-            self.reset_manager = NetworkResetManager()
-            self.ssl_manager = SSLManager()
-            self.system_manager = SystemAutomationManager()
-            self.repair_manager = SystemRepairManager()
-            self.tcp_manager = TCPTimeoutManager()
-            
-            self.logger.info("Todos os gerenciadores inicializados com sucesso")
-            
-        except Exception as e:
-            self.logger.error(f"Erro ao inicializar gerenciadores: {e}")
-            raise
-            
-    def display_admin_warning(self) -> None:
-        """Exibe aviso sobre privilégios de administrador."""
-        if not self.is_admin:
-            print("\n" + "="*60)
-            print("⚠️  AVISO: PRIVILÉGIOS DE ADMINISTRADOR NECESSÁRIOS")
-            print("="*60)
-            print("Este script requer privilégios de administrador para funcionar")
-            print("corretamente. Algumas operações podem falhar sem essas permissões.")
-            print("\nPara executar como administrador:")
-            print("1. Clique com o botão direito no arquivo main.py")
-            print("2. Selecione 'Executar como administrador'")
-            print("3. Ou abra o Prompt de Comando como administrador")
-            print("   e execute: python main.py")
-            print("="*60)
-            time.sleep(3)
-            
-    def show_option_details(self, option: str) -> bool:
-        """
-        Mostra detalhes explicativos da opção escolhida pelo usuário.
-        
-        Args:
-            option (str): Número da opção escolhida
-            
-        Returns:
-            bool: True se o usuário confirmar a execução, False se cancelar
-        """
-        details = {
-            "1": {
-                "title": "🌐 CONFIGURAR DNS CLOUDFLARE",
-                "description": """
+
+# Verificação de administrador resolvida uma única vez: shell32!IsUserAnAdmin no
+# Windows, euid 0 nos demais sistemas
+if sys.platform == "win32":
+    try:
+        _IsUserAnAdmin = ctypes.WinDLL("shell32", use_last_error=True).IsUserAnAdmin
+        _IsUserAnAdmin.argtypes = []
+        _IsUserAnAdmin.restype = ctypes.c_int
+        _admin_check = _IsUserAnAdmin
+    except Exception:
+        _admin_check = _not_admin
+else:
+    def _admin_check() -> bool:
+        return os.geteuid() == 0
+
+
+# Textos explicativos de cada opção do menu (ver show_option_details)
+_OPTION_DETAILS: dict[str, dict[str, str]] = {
+    "1": {
+        "title": "🌐 CONFIGURAR DNS CLOUDFLARE",
+        "description": """
 🎯 OBJETIVO: Alterar servidores DNS para Cloudflare (1.1.1.1 / 1.0.0.1)
 
 🔧 O QUE SERÁ FEITO NO SEU PC:
@@ -320,12 +368,12 @@ class TradingOptimizerOrchestrator:
 • Evita timeouts em transações críticas
 
 ⚡ IMPACTO: Imediato - melhora perceptível na velocidade de conexão
-                """,
-                "confirmation": "Deseja configurar DNS Cloudflare para otimizar sua conexão?"
-            },
-            "2": {
-                "title": "📡 DESATIVAR LARGE SEND OFFLOAD (LSO)",
-                "description": """
+        """,
+        "confirmation": "Deseja configurar DNS Cloudflare para otimizar sua conexão?"
+    },
+    "2": {
+        "title": "📡 DESATIVAR LARGE SEND OFFLOAD (LSO)",
+        "description": """
 🎯 OBJETIVO: Desativar offload de segmentação de pacotes na placa de rede
 
 🔧 O QUE SERÁ FEITO NO SEU PC:
@@ -342,12 +390,12 @@ class TradingOptimizerOrchestrator:
 • Estabiliza conexão durante picos de movimento do mercado
 
 ⚡ IMPACTO: Médio prazo - effectiveness aumenta após reinicialização
-                """,
-                "confirmation": "Deseja desativar LSO para reduzir latência de rede?"
-            },
-            "3": {
-                "title": "🔧 AJUSTAR MTU PARA 1450",
-                "description": """
+        """,
+        "confirmation": "Deseja desativar LSO para reduzir latência de rede?"
+    },
+    "3": {
+        "title": "🔧 AJUSTAR MTU PARA 1450",
+        "description": """
 🎯 OBJETIVO: Otimizar tamanho de pacotes para máxima eficiência
 
 🔧 O QUE SERÁ FEITO NO SEU PC:
@@ -364,12 +412,12 @@ class TradingOptimizerOrchestrator:
 • Crucial para estratégias de scalping e nano trading
 
 ⚡ IMPACTO: Imediato - otimização instantânea de pacotes
-                """,
-                "confirmation": "Deseja ajustar MTU para 1450 para otimizar pacotes?"
-            },
-            "4": {
-                "title": "⚡ DESATIVAR ECONOMIA DE ENERGIA DOS ADAPTADORES",
-                "description": """
+        """,
+        "confirmation": "Deseja ajustar MTU para 1450 para otimizar pacotes?"
+    },
+    "4": {
+        "title": "⚡ DESATIVAR ECONOMIA DE ENERGIA DOS ADAPTADORES",
+        "description": """
 🎯 OBJETIVO: Manter adaptadores de rede sempre em máxima performance
 
 🔧 O QUE SERÁ FEITO NO SEU PC:
@@ -386,12 +434,12 @@ class TradingOptimizerOrchestrator:
 • Crucial para robôs que operam continuamente
 
 ⚡ IMPACTO: Imediato - eliminará wake-up delays permanentemente
-                """,
-                "confirmation": "Deseja desativar economia de energia para performance máxima?"
-            },
-            "5": {
-                "title": "🔄 RESET COMPLETO DE REDE",
-                "description": """
+        """,
+        "confirmation": "Deseja desativar economia de energia para performance máxima?"
+    },
+    "5": {
+        "title": "🔄 RESET COMPLETO DE REDE",
+        "description": """
 🎯 OBJETIVO: Reinicializar completamente a stack de rede do Windows
 
 🔧 O QUE SERÁ FEITO NO SEU PC:
@@ -409,12 +457,12 @@ class TradingOptimizerOrchestrator:
 • Essencial quando há problemas persistentes de conexão
 
 ⚡ IMPACTO: Médio - pode requerir reconexão a redes WiFi
-                """,
-                "confirmation": "⚠️ ATENÇÃO: Isso pode interrumper conexões ativas. Continuar?"
-            },
-            "6": {
-                "title": "🔒 LIMPAR CACHE SSL/TLS",
-                "description": """
+        """,
+        "confirmation": "⚠️ ATENÇÃO: Isso pode interrumper conexões ativas. Continuar?"
+    },
+    "6": {
+        "title": "🔒 LIMPAR CACHE SSL/TLS",
+        "description": """
 🎯 OBJETIVO: Remover certificados SSL/TLS corrompidos ou expirados
 
 🔧 O QUE SERÁ FEITO NO SEU PC:
@@ -431,12 +479,12 @@ class TradingOptimizerOrchestrator:
 • Melhora reliability de APIs de trading
 
 ⚡ IMPACTO: Imediato - resolve problemas SSL/TLS existentes
-                """,
-                "confirmation": "Deseja limpar cache SSL/TLS para resolver problemas de conexão?"
-            },
-            "7": {
-                "title": "🚀 OTIMIZAR SISTEMA (Windows Update, apps bandeja)",
-                "description": """
+        """,
+        "confirmation": "Deseja limpar cache SSL/TLS para resolver problemas de conexão?"
+    },
+    "7": {
+        "title": "🚀 OTIMIZAR SISTEMA (Windows Update, apps bandeja)",
+        "description": """
 🎯 OBJETIVO: Remover processos que interferem com performance de trading
 
 🔧 O QUE SERÁ FEITO NO SEU PC:
@@ -454,12 +502,12 @@ class TradingOptimizerOrchestrator:
 • Previne travamentos durante alta volatilidade
 
 ⚡ IMPACTO: Gradual - melhoria progressiva na performance do sistema
-                """,
-                "confirmation": "Deseja otimizar o sistema para liberar recursos para trading?"
-            },
-            "8": {
-                "title": "🔨 REPARAR SISTEMA (CHKDSK, SFC, DISM)",
-                "description": """
+        """,
+        "confirmation": "Deseja otimizar o sistema para liberar recursos para trading?"
+    },
+    "8": {
+        "title": "🔨 REPARAR SISTEMA (CHKDSK, SFC, DISM)",
+        "description": """
 🎯 OBJETIVO: Corrigir arquivos corrompidos do sistema Windows
 
 🔧 O QUE SERÁ FEITO NO SEU PC:
@@ -476,12 +524,12 @@ class TradingOptimizerOrchestrator:
 • Garante reliability máxima do sistema
 
 ⚡ IMPACTO: Demorado - pode levar 30-60 minutos para completar
-                """,
-                "confirmation": "⚠️ ATENÇÃO: Esta operação pode demorar até 1 hora. Continuar?"
-            },
-            "9": {
-                "title": "⏱️ AJUSTAR TIMEOUT TCP",
-                "description": """
+        """,
+        "confirmation": "⚠️ ATENÇÃO: Esta operação pode demorar até 1 hora. Continuar?"
+    },
+    "9": {
+        "title": "⏱️ AJUSTAR TIMEOUT TCP",
+        "description": """
 🎯 OBJETIVO: Otimizar tempos de timeout para trading de alta velocidade
 
 🔧 O QUE SERÁ FEITO NO SEU PC:
@@ -498,12 +546,12 @@ class TradingOptimizerOrchestrator:
 • Crucial para arbitagem e scalping
 
 ⚡ IMPACTO: Imediato - otimização instantânea de timeouts
-                """,
-                "confirmation": "Deseja ajustar timeout TCP para operações mais rápidas?"
-            },
-            "10": {
-                "title": "🎯 EXECUTAR TODAS AS CORREÇÕES EM SEQUÊNCIA",
-                "description": """
+        """,
+        "confirmation": "Deseja ajustar timeout TCP para operações mais rápidas?"
+    },
+    "10": {
+        "title": "🎯 EXECUTAR TODAS AS CORREÇÕES EM SEQUÊNCIA",
+        "description": """
 🎯 OBJETIVO: Aplicar todas as otimizações para performance máxima
 
 🔧 O QUE SERÁ FEITO NO SEU PC:
@@ -520,345 +568,610 @@ class TradingOptimizerOrchestrator:
 • Base sólida para operações financeiras críticas
 
 ⚡ IMPACTO: Completo - transformação total da performance de rede
-                """,
-                "confirmation": "🎯 ATENÇÃO: Esta operação executará TODAS as otimizações (pode demorar). Continuar?"
-            }
-        }
+        """,
+        "confirmation": "🎯 ATENÇÃO: Esta operação executará TODAS as otimizações (pode demorar). Continuar?"
+    }
+}
+
+# Cada tela de detalhes e seu prompt de confirmação já montados em strings únicas
+for _detail in _OPTION_DETAILS.values():
+    _detail["rendered"] = "\n".join([
+        "",
+        "=" * 80,
+        _detail["title"],
+        "=" * 80,
+        _detail["description"],
+        "=" * 80,
+    ]) + "\n"
+    _detail["prompt"] = f"\n❓ {_detail['confirmation']}\n\n📝 Digite 's' para SIM ou 'n' para NÃO: "
+del _detail
+
+_ADMIN_WARNING_TEXT = "\n".join([
+    "",
+    "=" * 60,
+    "⚠️  AVISO: PRIVILÉGIOS DE ADMINISTRADOR NECESSÁRIOS",
+    "=" * 60,
+    "Este script requer privilégios de administrador para funcionar",
+    "corretamente. Algumas operações podem falhar sem essas permissões.",
+    "",
+    "Para executar como administrador:",
+    "1. Clique com o botão direito no arquivo main.py",
+    "2. Selecione 'Executar como administrador'",
+    "3. Ou abra o Prompt de Comando como administrador",
+    "   e execute: python main.py",
+    "=" * 60,
+]) + "\n"
+
+_STATUS_ADMIN = "✅ Status: Executando com privilégios de administrador"
+_STATUS_NO_ADMIN = "⚠️  Status: Executando sem privilégios de administrador"
+
+_MAIN_MENU_TEXT = "\n".join([
+    "",
+    "=" * 70,
+    "🎰 SISTEMA DE OTIMIZAÇÃO PARA TRADING - CASINO & NANO TRADE",
+    "=" * 70,
+    "Este sistema otimiza especificamente para aplicações de trading,",
+    "resolvendo instabilidades de rede no Windows que afetam",
+    "operações financeiras críticas.",
+    "=" * 70,
+    "{status}",
+    "",
+    "📋 MENU DE OPÇÕES:",
+    "-" * 50,
+    "1.  🌐 Configurar DNS (Cloudflare: 1.1.1.1 / 1.0.0.1)",
+    "2.  📡 Desativar Large Send Offload (LSO)",
+    "3.  🔧 Ajustar MTU para 1450",
+    "4.  ⚡ Desativar economia de energia dos adaptadores",
+    "5.  🔄 Executar reset completo de rede",
+    "6.  🔒 Limpar cache SSL/TLS",
+    "7.  🚀 Otimizar sistema (Windows Update, apps bandeja)",
+    "8.  🔨 Reparar sistema (CHKDSK, SFC, DISM)",
+    "9.  ⏱️  Ajustar timeout TCP",
+    "10. 🎯 Executar TODAS as correções em sequência",
+    "-" * 50,
+    "0.  ❌ Sair",
+    "=" * 70,
+    "",
+    "💡 DICA: Digite o número da opção para ver detalhes completos!",
+    "=" * 70,
+]) + "\n"
+
+# Passos individuais do menu (opções 1-9), executados por _run_step
+_RUNNERS: dict[str, dict] = {
+    "1": {
+        "manager": "dns_manager",
+        "method": "set_cloudflare_dns",
+        "args": (),
+        "intro": (
+            "\n🌐 Configurando DNS Cloudflare para Otimização de Trading...",
+            "🎯 Definindo servidores DNS mais rápidos do mundo",
+        ),
+        "success": (
+            "✅ DNS configurado com sucesso para Cloudflare",
+            "💰 VANTAGEM: Latência reduzida em 15-50ms para operações de trading",
+        ),
+        "failure": (
+            "❌ Falha ao configurar DNS",
+            "💸 IMPACTO: Latência maior pode causar perdas em operações de nano trade",
+        ),
+        "log_success": "DNS configurado para Cloudflare",
+        "log_failure": "Falha ao configurar DNS para Cloudflare",
+        "error": "❌ Erro ao configurar DNS",
+        "log_error": "Erro na configuração DNS",
+    },
+    "2": {
+        "manager": "lso_manager",
+        "method": "disable_lso",
+        "args": (),
+        "intro": (
+            "\n📡 Desativando Large Send Offload (LSO) para Trading...",
+            "🎯 Eliminando delays de segmentação de pacotes",
+        ),
+        "success": (
+            "✅ LSO desativado com sucesso",
+            "💰 VANTAGEM: Elimina delays de 5-20ms em operações de alta frequência",
+            "🎯 PERFEITO PARA: Scalping, Arbitragem, Nano Trading",
+        ),
+        "failure": (
+            "❌ Falha ao desativar LSO",
+            "💸 IMPACTO: Pode causar micro-delays em momentos críticos do mercado",
+        ),
+        "log_success": "LSO desativado para todos os adaptadores",
+        "log_failure": "Falha ao desativar LSO",
+        "error": "❌ Erro ao desativar LSO",
+        "log_error": "Erro na desativação LSO",
+    },
+    "3": {
+        "manager": "mtu_manager",
+        "method": "set_mtu_for_all_interfaces",
+        "args": (1450,),
+        "intro": (
+            "\n🔧 Ajustando MTU para 1450 - Otimização de Pacotes...",
+            "🎯 Eliminando fragmentação que causa delays em trading",
+        ),
+        "success": (
+            "✅ MTU ajustado para 1450 com sucesso",
+            "💰 VANTAGEM: Throughput melhorado em 3%, sem fragmentação",
+            "🎯 CRUCIAL PARA: Conexões estables com brokers 24/7",
+        ),
+        "failure": (
+            "❌ Falha ao ajustar MTU",
+            "💸 IMPACTO: Pacotes fragmentados podem causar delays em ordens",
+        ),
+        "log_success": "MTU ajustado para 1450 em todas as interfaces",
+        "log_failure": "Falha ao ajustar MTU",
+        "error": "❌ Erro ao ajustar MTU",
+        "log_error": "Erro no ajuste MTU",
+    },
+    "4": {
+        "manager": "adapter_manager",
+        "method": "disable_power_saving",
+        "args": (),
+        "intro": (
+            "\n⚡ Desativando Economia de Energia para Trading 24/7...",
+            "🎯 Adaptadores sempre prontos para ação",
+        ),
+        "success": (
+            "✅ Economia de energia desativada com sucesso",
+            "💰 VANTAGEM: Elimina wake-up delays de 50-200ms",
+            "🎯 CRUCIAL PARA: Robôs de trading que operam 24/7",
+        ),
+        "failure": (
+            "❌ Falha ao desativar economia de energia",
+            "💸 IMPACTO: Pode causar desconexões durante alta volatilidade",
+        ),
+        "log_success": "Economia de energia desativada para todos os adaptadores",
+        "log_failure": "Falha ao desativar economia de energia",
+        "error": "❌ Erro ao desativar economia de energia",
+        "log_error": "Erro na desativação de economia de energia",
+    },
+    "5": {
+        "manager": "reset_manager",
+        "method": "full_network_reset",
+        "args": (),
+        "intro": (
+            "\n🔄 Executando Reset Completo de Rede...",
+            "🎯 Eliminando problemas de conectividade acumulados",
+            "⚠️  ATENÇÃO: Esta operação pode interrumpir conexões ativas!",
+        ),
+        "success": (
+            "✅ Reset de rede executado com sucesso",
+            "💰 VANTAGEM: Elimina problemas que causam desconexões em trading",
+            "🎯 RECOMENDADO: Quando há problemas persistentes de conexão",
+        ),
+        "failure": (
+            "❌ Falha no reset de rede",
+            "💸 IMPACTO: Problemas de conectividade podem continuar afetando trading",
+        ),
+        "log_success": "Reset completo de rede executado",
+        "log_failure": "Falha no reset completo de rede",
+        "error": "❌ Erro no reset de rede",
+        "log_error": "Erro no reset de rede",
+    },
+    "6": {
+        "manager": "ssl_manager",
+        "method": "full_ssl_cleanup",
+        "args": (),
+        "intro": (
+            "\n🔒 Limpando Cache SSL/TLS - Segurança Otimizada...",
+            "🎯 Eliminando certificados corrompidos que causam falhas",
+        ),
+        "success": (
+            "✅ Cache SSL/TLS limpo com sucesso",
+            "💰 VANTAGEM: Elimina erros de conexão com plataformas de trading",
+            "🎯 CRUCIAL PARA: Conexões seguras 24/7 com brokers",
+        ),
+        "failure": (
+            "❌ Falha na limpeza SSL/TLS",
+            "💸 IMPACTO: Pode causar 'certificate errors' durante volatilidade",
+        ),
+        "log_success": "Limpeza completa SSL/TLS executada",
+        "log_failure": "Falha na limpeza SSL/TLS",
+        "error": "❌ Erro na limpeza SSL/TLS",
+        "log_error": "Erro na limpeza SSL/TLS",
+    },
+    "7": {
+        "manager": "system_manager",
+        "method": "full_system_optimization",
+        "args": (),
+        "intro": (
+            "\n🚀 Otimizando Sistema para Performance Máxima...",
+            "🎯 Liberando recursos para trading e eliminando distrações",
+        ),
+        "success": (
+            "✅ Sistema otimizado com sucesso",
+            "💰 VANTAGEM: Mais RAM e CPU disponíveis para robôs de trading",
+            "🎯 RESULTADO: Performance consistente sem travamentos",
+        ),
+        "failure": (
+            "❌ Falha na otimização do sistema",
+            "💸 IMPACTO: Recursos limitados podem afetar performance de trading",
+        ),
+        "log_success": "Otimização completa do sistema executada",
+        "log_failure": "Falha na otimização do sistema",
+        "error": "❌ Erro na otimização do sistema",
+        "log_error": "Erro na otimização do sistema",
+    },
+    "8": {
+        "manager": "repair_manager",
+        "method": "full_system_repair",
+        "args": (),
+        "intro": (
+            "\n🔨 Reparando Sistema - Garantia de Estabilidade...",
+            "🎯 Corrigindo problemas que podem causar crashes em trading",
+            "⚠️  ATENÇÃO: Esta operação pode demorar vários minutos!",
+        ),
+        "success": (
+            "✅ Reparo do sistema executado com sucesso",
+            "💰 VANTAGEM: Elimina crashes que podem causar perdas em trading",
+            "🎯 RESULTADO: Sistema estável para operações 24/7",
+        ),
+        "failure": (
+            "❌ Falha no reparo do sistema",
+            "💸 IMPACTO: Problemas não resolvidos podem causar instabilidade",
+        ),
+        "log_success": "Reparo completo do sistema executado",
+        "log_failure": "Falha no reparo do sistema",
+        "error": "❌ Erro no reparo do sistema",
+        "log_error": "Erro no reparo do sistema",
+    },
+    "9": {
+        "manager": "tcp_manager",
+        "method": "configure_tcp_timeout",
+        "args": (),
+        "intro": (
+            "\n⏱️  Configurando Timeout TCP para Alta Velocidade...",
+            "🎯 Otimizando para nano segundo e scalping",
+        ),
+        "success": (
+            "✅ Timeout TCP configurado com sucesso",
+            "💰 VANTAGEM: Reconexão 5x mais rápida em caso de falhas",
+            "🎯 CRUCIAL PARA: Arbitragem e operações de nano milissegundo",
+        ),
+        "failure": (
+            "❌ Falha na configuração de timeout TCP",
+            "💸 IMPACTO: Timeout lento pode causar perdas em situações críticas",
+        ),
+        "log_success": "Configuração de timeout TCP executada",
+        "log_failure": "Falha na configuração de timeout TCP",
+        "error": "❌ Erro na configuração de timeout TCP",
+        "log_error": "Erro na configuração de timeout TCP",
+    },
+}
+
+
+# Passos de run_all_fixes, na ordem de exibição:
+# nome -> (opção do menu, ícone, benefício, passos que precisam terminar antes).
+# O reset vem sozinho; os ajustes de rede são independentes entre si e rodam em
+# paralelo; otimização e reparo do sistema fecham em série.
+_NETWORK_FIXES = ("Limpeza SSL/TLS", "Configuração DNS", "Desativação LSO",
+                  "Ajuste MTU", "Economia de Energia", "Timeout TCP")
+_ALL_FIXES: dict[str, tuple[str, str, str, tuple[str, ...]]] = {
+    "Reset de Rede": ("5", "🔄", "Eliminando problemas de conectividade que causam desconexões", ()),
+    "Limpeza SSL/TLS": ("6", "🔒", "Garantindo conexões seguras sem falhas durante volatilidade", ("Reset de Rede",)),
+    "Configuração DNS": ("1", "🌐", "Reduzindo latência em 15-50ms para execução mais rápida", ("Reset de Rede",)),
+    "Desativação LSO": ("2", "📡", "Eliminando micro-delays em operações de alta frequência", ("Reset de Rede",)),
+    "Ajuste MTU": ("3", "🔧", "Otimizando pacotes para máximo throughput", ("Reset de Rede",)),
+    "Economia de Energia": ("4", "⚡", "Eliminando wake-up delays de adaptadores", ("Reset de Rede",)),
+    "Timeout TCP": ("9", "⏱️", "Reconexão ultra-rápida para trading sem interrupções", ("Reset de Rede",)),
+    "Otimização Sistema": ("7", "🚀", "Liberando RAM/CPU para robôs de trading", _NETWORK_FIXES),
+    "Reparo Sistema": ("8", "🔨", "Garantindo estabilidade total do sistema", ("Otimização Sistema",)),
+}
+
+
+# Banners de run_all_fixes, montados uma vez (cada um sai em uma única escrita)
+_ALL_FIXES_HEADER = "\n".join([
+    "",
+    "🎯 EXECUTANDO OTIMIZAÇÃO COMPLETA PARA TRADING",
+    "=" * 80,
+    "🚀 TRANSFORMAÇÃO TOTAL: Sistema otimizado para máxima performance",
+    "💰 INVESTIMENTO: Algumas centenas de milissegundos que podem",
+    "    salvar milhares em perdas durante volatilidade extrema",
+    "⏰ DURAÇÃO ESTIMADA: 15-45 minutos",
+    "=" * 80,
+    "🎯 RESULTADO ESPERADO: Conexão de nível profissional para trading",
+    "=" * 80,
+    "",
+    "💡 DICA: Mantenha este terminal aberto durante todo o processo!",
+    "🔥 APÓS CONCLUIR: Seu PC estará otimizado para trading profissional",
+]) + "\n"
+
+_ALL_FIXES_STATUS_OK = "\n".join([
+    "🎯 STATUS: SISTEMA OTIMIZADO PARA TRADING PROFISSIONAL!",
+    "💰 PRÓXIMOS PASSOS: Reinicie seu PC para máximo benefício",
+    "🚀 PERFORMANCE: Aguarde melhoria significativa na latência",
+])
+_ALL_FIXES_STATUS_PARTIAL = "\n".join([
+    "⚠️  STATUS: Otimização parcial - alguns problemas detectados",
+    "💡 RECOMENDAÇÃO: Execute novamente para completar todas as otimizações",
+])
+
+_ALL_FIXES_FOOTER = "\n".join([
+    "",
+    "=" * 80,
+    "🎊 EXECUÇÃO COMPLETA FINALIZADA!",
+    "=" * 80,
+    "📊 RESUMO DA TRANSFORMAÇÃO:",
+    "✅ Otimizações bem-sucedidas: {ok}/{total}",
+    "⚠️  Otimizações com problemas: {failed}/{total}",
+    "=" * 80,
+    "{status}",
+    "=" * 80,
+]) + "\n"
+
+
+class TradingOptimizerOrchestrator:
+    """
+    Orquestrador Principal para Otimização de Trading
+    
+    Esta classe gerencia a execução de todos os módulos de otimização,
+    focando especificamente em melhorar a performance para trading
+    profissional (casino e nano trade).
+    
+    OBJETIVO: Eliminar gargalos de rede que causam perdas financeiras
+    em operações de alta frequência e volatilidade extrema.
+    """
+    
+    # Opção do menu -> (método, argumentos), resolvido só quando escolhida
+    _MENU_ACTIONS = {
+        **{key: ("_run_step", (key,)) for key in _RUNNERS},
+        "10": ("run_all_fixes", ()),
+    }
+    
+    def __init__(self):
+        """Inicializa o orquestrador focado em trading."""
+        self._setup_logging()
+        self.logger = logging.getLogger(__name__)
+        self.logger.info("Inicializando TradingOptimizerOrchestrator")
         
-        if option not in details:
-            return False
-            
-        detail = details[option]
-        print(f"\n{'='*80}")
-        print(detail["title"])
-        print('='*80)
-        print(detail["description"])
-        print('='*80)
+        # Verificar privilégios de administrador
+        self.is_admin = self._check_admin_privileges()
         
-        print(f"\n❓ {detail['confirmation']}")
-        response = _safe_readline("\n📝 Digite 's' para SIM ou 'n' para NÃO: ", on_keyboard_interrupt="return_empty").strip().lower()
-        if response == "":
-            print("\n\n⚠️ Operação cancelada pelo usuário.")
-            return False
-        return response in ['s', 'sim', 'y', 'yes']
-
-    def display_main_menu(self) -> None:
-        """Exibe o menu principal."""
-        print("\n" + "="*70)
-        print("🎰 SISTEMA DE OTIMIZAÇÃO PARA TRADING - CASINO & NANO TRADE")
-        print("="*70)
-        print("Este sistema otimiza especificamente para aplicações de trading,")
-        print("resolvendo instabilidades de rede no Windows que afetam")
-        print("operações financeiras críticas.")
-        print("="*70)
+        # Inicializar todos os gerenciadores
+        self._initialize_managers()
         
-        if self.is_admin:
-            print("✅ Status: Executando com privilégios de administrador")
-        else:
-            print("⚠️  Status: Executando sem privilégios de administrador")
-            
-        print("\n📋 MENU DE OPÇÕES:")
-        print("-" * 50)
-        print("1.  🌐 Configurar DNS (Cloudflare: 1.1.1.1 / 1.0.0.1)")
-        print("2.  📡 Desativar Large Send Offload (LSO)")
-        print("3.  🔧 Ajustar MTU para 1450")
-        print("4.  ⚡ Desativar economia de energia dos adaptadores")
-        print("5.  🔄 Executar reset completo de rede")
-        print("6.  🔒 Limpar cache SSL/TLS")
-        print("7.  🚀 Otimizar sistema (Windows Update, apps bandeja)")
-        print("8.  🔨 Reparar sistema (CHKDSK, SFC, DISM)")
-        print("9.  ⏱️  Ajustar timeout TCP")
-        print("10. 🎯 Executar TODAS as correções em sequência")
-        print("-" * 50)
-        print("0.  ❌ Sair")
-        print("="*70)
-        print("\n💡 DICA: Digite o número da opção para ver detalhes completos!")
-        print("="*70)
+        # Serializa a saída quando vários passos rodam em paralelo
+        self._print_lock = threading.Lock()
         
-    def run_dns_configuration(self) -> bool:
-        """Executa a configuração de DNS Cloudflare."""
-        print("\n🌐 Configurando DNS Cloudflare para Otimização de Trading...")
-        print("🎯 Definindo servidores DNS mais rápidos do mundo")
-        try:
-            success = self.dns_manager.set_cloudflare_dns()
-            if success:
-                print("✅ DNS configurado com sucesso para Cloudflare")
-                print("💰 VANTAGEM: Latência reduzida em 15-50ms para operações de trading")
-                self.logger.info("DNS configurado para Cloudflare")
-                return True
-            else:
-                print("❌ Falha ao configurar DNS")
-                print("💸 IMPACTO: Latência maior pode causar perdas em operações de nano trade")
-                self.logger.error("Falha ao configurar DNS para Cloudflare")
-                return False
-        except Exception as e:
-            print(f"❌ Erro ao configurar DNS: {e}")
-            self.logger.error(f"Erro na configuração DNS: {e}")
-            return False
+    def _setup_logging(self) -> None:
+        """Configura o sistema de logging centralizado."""
+        # basicConfig não faz nada se a raiz já tem handlers (ex.: nova tentativa do
+        # main); nesse caso não abrimos outro arquivo, que travaria a rotação no Windows
+        if logging.getLogger().handlers:
+            return
+        
+        log_file = Path("automation.log")
+        
+        # Arquivo rotativo com gravação em lote: os registros ficam em memória até
+        # juntar 256, surgir um ERROR ou o processo terminar
+        file_handler = RotatingFileHandler(log_file, maxBytes=2_000_000, backupCount=3, encoding='utf-8', delay=True)
+        memory_handler = MemoryHandler(256, flushLevel=logging.ERROR, target=file_handler)
+        atexit.register(memory_handler.flush)
+        
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.StreamHandler(sys.stdout),
+                memory_handler
+            ]
+        )
+        
+    def _check_admin_privileges(self) -> bool:
+        """
+        Verifica se o script está sendo executado com privilégios de administrador.
+        
+        Returns:
+            bool: True se está rodando como administrador
+        """
+        return bool(_admin_check())
             
-    def run_lso_disable(self) -> bool:
-        """Executa a desativação do LSO."""
-        print("\n📡 Desativando Large Send Offload (LSO) para Trading...")
-        print("🎯 Eliminando delays de segmentação de pacotes")
+    def _initialize_managers(self) -> None:
+        """Inicializa todos os gerenciadores de automação."""
         try:
-            success = self.lso_manager.disable_lso()
-            if success:
-                print("✅ LSO desativado com sucesso")
-                print("💰 VANTAGEM: Elimina delays de 5-20ms em operações de alta frequência")
-                print("🎯 PERFEITO PARA: Scalping, Arbitragem, Nano Trading")
-                self.logger.info("LSO desativado para todos os adaptadores")
-                return True
-            else:
-                print("❌ Falha ao desativar LSO")
-                print("💸 IMPACTO: Pode causar micro-delays em momentos críticos do mercado")
-                self.logger.error("Falha ao desativar LSO")
-                return False
-        except Exception as e:
-            print(f"❌ Erro ao desativar LSO: {e}")
-            self.logger.error(f"Erro na desativação LSO: {e}")
-            return False
+            self.logger.info("Inicializando gerenciadores de automação...")
+
+            if _MISSING_MANAGERS:
+                details = "; ".join(_MANAGER_IMPORT_ERRORS) if _MANAGER_IMPORT_ERRORS else "Sem detalhes adicionais."
+                raise RuntimeError(
+                    "Módulos de automação não carregados. "
+                    f"Faltando: {', '.join(_MISSING_MANAGERS)}. "
+                    f"Detalhes: {details}"
+                )
             
-    def run_mtu_adjustment(self) -> bool:
-        """Executa o ajuste de MTU."""
-        print("\n🔧 Ajustando MTU para 1450 - Otimização de Pacotes...")
-        print("🎯 Eliminando fragmentação que causa delays em trading")
-        try:
-            success = self.mtu_manager.set_mtu_all_interfaces(1450)
-            if success:
-                print("✅ MTU ajustado para 1450 com sucesso")
-                print("💰 VANTAGEM: Throughput melhorado em 3%, sem fragmentação")
-                print("🎯 CRUCIAL PARA: Conexões estables com brokers 24/7")
-                self.logger.info("MTU ajustado para 1450 em todas as interfaces")
-                return True
-            else:
-                print("❌ Falha ao ajustar MTU")
-                print("💸 IMPACTO: Pacotes fragmentados podem causar delays em ordens")
-                self.logger.error("Falha ao ajustar MTU")
-                return False
-        except Exception as e:
-            print(f"❌ Erro ao ajustar MTU: {e}")
-            self.logger.error(f"Erro no ajuste MTU: {e}")
-            return False
+            # Os gerenciadores são instanciados sob demanda (ver propriedades abaixo)
+            self.logger.info("Todos os gerenciadores disponíveis")
             
-    def run_adapter_power_disable(self) -> bool:
-        """Executa a desativação da economia de energia dos adaptadores."""
-        print("\n⚡ Desativando Economia de Energia para Trading 24/7...")
-        print("🎯 Adaptadores sempre prontos para ação")
-        try:
-            success = self.adapter_manager.disable_power_saving()
-            if success:
-                print("✅ Economia de energia desativada com sucesso")
-                print("💰 VANTAGEM: Elimina wake-up delays de 50-200ms")
-                print("🎯 CRUCIAL PARA: Robôs de trading que operam 24/7")
-                self.logger.info("Economia de energia desativada para todos os adaptadores")
-                return True
-            else:
-                print("❌ Falha ao desativar economia de energia")
-                print("💸 IMPACTO: Pode causar desconexões durante alta volatilidade")
-                self.logger.error("Falha ao desativar economia de energia")
-                return False
         except Exception as e:
-            print(f"❌ Erro ao desativar economia de energia: {e}")
-            self.logger.error(f"Erro na desativação de economia de energia: {e}")
-            return False
+            self.logger.error(f"Erro ao inicializar gerenciadores: {e}")
+            raise
+    
+    @cached_property
+    def dns_manager(self):
+        return DNSManager()
+    
+    @cached_property
+    def lso_manager(self):
+        return LSOManager()
+    
+    @cached_property
+    def mtu_manager(self):
+        return MTUManager()
+    
+    @cached_property
+    def adapter_manager(self):
+        return NetworkAdapterManager()
+    
+    @cached_property
+    def reset_manager(self):
+        return NetworkResetManager()
+    
+    @cached_property
+    def ssl_manager(self):
+        return SSLManager()
+    
+    @cached_property
+    def system_manager(self):
+        return SystemAutomationManager()
+    
+    @cached_property
+    def repair_manager(self):
+        return SystemRepairManager()
+    
+    @cached_property
+    def tcp_manager(self):
+        return TCPTimeoutManager()
             
-    def run_network_reset(self) -> bool:
-        """Executa o reset completo de rede."""
-        print("\n🔄 Executando Reset Completo de Rede...")
-        print("🎯 Eliminando problemas de conectividade acumulados")
-        print("⚠️  ATENÇÃO: Esta operação pode interrumpir conexões ativas!")
-        try:
-            success = self.reset_manager.full_network_reset()
-            if success:
-                print("✅ Reset de rede executado com sucesso")
-                print("💰 VANTAGEM: Elimina problemas que causam desconexões em trading")
-                print("🎯 RECOMENDADO: Quando há problemas persistentes de conexão")
-                self.logger.info("Reset completo de rede executado")
-                return True
-            else:
-                print("❌ Falha no reset de rede")
-                print("💸 IMPACTO: Problemas de conectividade podem continuar afetando trading")
-                self.logger.error("Falha no reset completo de rede")
-                return False
-        except Exception as e:
-            print(f"❌ Erro no reset de rede: {e}")
-            self.logger.error(f"Erro no reset de rede: {e}")
-            return False
+    def display_admin_warning(self) -> None:
+        """Exibe aviso sobre privilégios de administrador."""
+        if not self.is_admin:
+            sys.stdout.write(_ADMIN_WARNING_TEXT)
             
-    def run_ssl_cleanup(self) -> bool:
-        """Executa a limpeza completa do SSL/TLS."""
-        print("\n🔒 Limpando Cache SSL/TLS - Segurança Otimizada...")
-        print("🎯 Eliminando certificados corrompidos que causam falhas")
-        try:
-            success = self.ssl_manager.full_ssl_cleanup()
-            if success:
-                print("✅ Cache SSL/TLS limpo com sucesso")
-                print("💰 VANTAGEM: Elimina erros de conexão com plataformas de trading")
-                print("🎯 CRUCIAL PARA: Conexões seguras 24/7 com brokers")
-                self.logger.info("Limpeza completa SSL/TLS executada")
-                return True
-            else:
-                print("❌ Falha na limpeza SSL/TLS")
-                print("💸 IMPACTO: Pode causar 'certificate errors' durante volatilidade")
-                self.logger.error("Falha na limpeza SSL/TLS")
-                return False
-        except Exception as e:
-            print(f"❌ Erro na limpeza SSL/TLS: {e}")
-            self.logger.error(f"Erro na limpeza SSL/TLS: {e}")
+            # Execuções automatizadas podem pular a pausa
+            if os.environ.get("TRADING_OPT_NO_PAUSE"):
+                return
+            for remaining in range(3, 0, -1):
+                sys.stdout.write(f"\r   Continuando em {remaining}s...")
+                sys.stdout.flush()
+                time.sleep(1)
+            sys.stdout.write("\n")
+            
+    def show_option_details(self, option: str) -> bool:
+        """
+        Mostra detalhes explicativos da opção escolhida pelo usuário.
+        
+        Args:
+            option (str): Número da opção escolhida
+            
+        Returns:
+            bool: True se o usuário confirmar a execução, False se cancelar
+        """
+        detail = _OPTION_DETAILS.get(option)
+        if detail is None:
             return False
             
-    def run_system_optimization(self) -> bool:
-        """Executa a otimização completa do sistema."""
-        print("\n🚀 Otimizando Sistema para Performance Máxima...")
-        print("🎯 Liberando recursos para trading e eliminando distrações")
-        try:
-            success = self.system_manager.full_system_optimization()
-            if success:
-                print("✅ Sistema otimizado com sucesso")
-                print("💰 VANTAGEM: Mais RAM e CPU disponíveis para robôs de trading")
-                print("🎯 RESULTADO: Performance consistente sem travamentos")
-                self.logger.info("Otimização completa do sistema executada")
-                return True
-            else:
-                print("❌ Falha na otimização do sistema")
-                print("💸 IMPACTO: Recursos limitados podem afetar performance de trading")
-                self.logger.error("Falha na otimização do sistema")
-                return False
-        except Exception as e:
-            print(f"❌ Erro na otimização do sistema: {e}")
-            self.logger.error(f"Erro na otimização do sistema: {e}")
+        sys.stdout.write(detail["rendered"])
+        response = _safe_readline(detail["prompt"], on_keyboard_interrupt="return_empty").strip().lower()
+        if response == "":
+            print("\n\n⚠️ Operação cancelada pelo usuário.")
             return False
+        return response in ['s', 'sim', 'y', 'yes']
+
+    def display_main_menu(self) -> None:
+        """Exibe o menu principal."""
+        sys.stdout.write(_MAIN_MENU_TEXT.format(status=_STATUS_ADMIN if self.is_admin else _STATUS_NO_ADMIN))
+        
+    def _emit(self, *lines: str) -> None:
+        """Imprime um bloco de linhas de uma vez, sem intercalar com outras threads."""
+        text = "\n".join(lines) + "\n"
+        with self._print_lock:
+            sys.stdout.write(text)
+            sys.stdout.flush()
             
-    def run_system_repair(self) -> bool:
-        """Executa o reparo completo do sistema."""
-        print("\n🔨 Reparando Sistema - Garantia de Estabilidade...")
-        print("🎯 Corrigindo problemas que podem causar crashes em trading")
-        print("⚠️  ATENÇÃO: Esta operação pode demorar vários minutos!")
+    def _new_manager(self, name: str):
+        """Cria uma instância nova (fora do cache) do gerenciador exposto pela propriedade `name`."""
+        return getattr(type(self), name).func(self)
+    
+    @staticmethod
+    def _release_manager(manager) -> None:
+        """Libera os recursos de um gerenciador na thread atual (a mesma que o criou)."""
+        close = getattr(manager, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception:
+                pass
+    
+    def _run_step(self, key: str, fresh: bool = False) -> bool:
+        """
+        Executa um passo do menu (opções 1-9) descrito em _RUNNERS.
+        
+        Args:
+            key (str): Opção do menu
+            fresh (bool): Usa um gerenciador próprio, criado e liberado nesta thread,
+                          em vez da instância em cache do orquestrador
+            
+        Returns:
+            bool: True se o gerenciador reportou sucesso
+        """
+        step = _RUNNERS[key]
+        self._emit(*step["intro"])
+        manager = None
         try:
-            success = self.repair_manager.full_system_repair()
-            if success:
-                print("✅ Reparo do sistema executado com sucesso")
-                print("💰 VANTAGEM: Elimina crashes que podem causar perdas em trading")
-                print("🎯 RESULTADO: Sistema estável para operações 24/7")
-                self.logger.info("Reparo completo do sistema executado")
+            manager = self._new_manager(step["manager"]) if fresh else getattr(self, step["manager"])
+            action = getattr(manager, step["method"])
+            if action(*step["args"]):
+                self._emit(*step["success"])
+                self.logger.info(step["log_success"])
                 return True
-            else:
-                print("❌ Falha no reparo do sistema")
-                print("💸 IMPACTO: Problemas não resolvidos podem causar instabilidade")
-                self.logger.error("Falha no reparo do sistema")
-                return False
+            self._emit(*step["failure"])
+            self.logger.error(step["log_failure"])
+            return False
         except Exception as e:
-            print(f"❌ Erro no reparo do sistema: {e}")
-            self.logger.error(f"Erro no reparo do sistema: {e}")
+            self._emit(f"{step['error']}: {e}")
+            self.logger.error(f"{step['log_error']}: {e}")
             return False
+        finally:
+            if fresh and manager is not None:
+                self._release_manager(manager)
             
-    def run_tcp_timeout_config(self) -> bool:
-        """Executa a configuração de timeout TCP."""
-        print("\n⏱️  Configurando Timeout TCP para Alta Velocidade...")
-        print("🎯 Otimizando para nano segundo e scalping")
+    def _run_fix(self, number: int, total: int, fix_name: str, key: str, icon: str, benefit: str) -> bool:
+        """Executa um passo de run_all_fixes com cabeçalho e resultado próprios."""
+        self._emit(
+            f"\n{'='*80}",
+            f"[{number}/{total}] {icon} EXECUTANDO: {fix_name}",
+            f"💰 BENEFÍCIO: {benefit}",
+            f"{'='*80}",
+        )
+        
         try:
-            success = self.tcp_manager.configure_tcp_timeout()
-            if success:
-                print("✅ Timeout TCP configurado com sucesso")
-                print("💰 VANTAGEM: Reconexão 5x mais rápida em caso de falhas")
-                print("🎯 CRUCIAL PARA: Arbitragem e operações de nano milissegundo")
-                self.logger.info("Configuração de timeout TCP executada")
+            # Os gerenciadores guardam objetos COM da thread que os criou: cada passo usa
+            # uma instância própria, criada e descartada nesta thread de trabalho
+            if self._run_step(key, fresh=True):
+                self._emit(f"✅ {icon} CONCLUÍDO: {fix_name} - Performance melhorada!")
                 return True
-            else:
-                print("❌ Falha na configuração de timeout TCP")
-                print("💸 IMPACTO: Timeout lento pode causar perdas em situações críticas")
-                self.logger.error("Falha na configuração de timeout TCP")
-                return False
+            self._emit(f"⚠️  FALHOU: {fix_name} - Continuando com próximas otimizações...")
         except Exception as e:
-            print(f"❌ Erro na configuração de timeout TCP: {e}")
-            self.logger.error(f"Erro na configuração de timeout TCP: {e}")
-            return False
-            
-    def run_all_fixes(self) -> bool:
-        """Executa todas as correções em sequência otimizada para trading."""
-        print("\n🎯 EXECUTANDO OTIMIZAÇÃO COMPLETA PARA TRADING")
-        print("="*80)
-        print("🚀 TRANSFORMAÇÃO TOTAL: Sistema otimizado para máxima performance")
-        print("💰 INVESTIMENTO: Algumas centenas de milissegundos que podem")
-        print("    salvar milhares em perdas durante volatilidade extrema")
-        print("⏰ DURAÇÃO ESTIMADA: 15-45 minutos")
-        print("="*80)
-        print("🎯 RESULTADO ESPERADO: Conexão de nível profissional para trading")
-        print("="*80)
+            self._emit(f"❌ ERRO: {fix_name} - {e}")
+            self.logger.error("Erro em '%s': %s\n%s", fix_name, e, traceback.format_exc())
+        return False
         
-        # Ordem otimizada para trading: problemas primeiro, depois otimizações
-        fixes = [
-            ("Reset de Rede", self.run_network_reset, "🔄"),
-            ("Limpeza SSL/TLS", self.run_ssl_cleanup, "🔒"),
-            ("Configuração DNS", self.run_dns_configuration, "🌐"),
-            ("Desativação LSO", self.run_lso_disable, "📡"),
-            ("Ajuste MTU", self.run_mtu_adjustment, "🔧"),
-            ("Economia de Energia", self.run_adapter_power_disable, "⚡"),
-            ("Timeout TCP", self.run_tcp_timeout_config, "⏱️"),
-            ("Otimização Sistema", self.run_system_optimization, "🚀"),
-            ("Reparo Sistema", self.run_system_repair, "🔨")
-        ]
+    def run_all_fixes(self) -> bool:
+        """Executa todas as correções, em paralelo onde os passos são independentes."""
+        sys.stdout.write(_ALL_FIXES_HEADER)
+        sys.stdout.flush()
         
         success_count = 0
-        total_fixes = len(fixes)
+        total_fixes = len(_ALL_FIXES)
         
-        print("\n💡 DICA: Mantenha este terminal aberto durante todo o processo!")
-        print("🔥 APÓS CONCLUIR: Seu PC estará otimizado para trading profissional")
+        numbers = {fix_name: i for i, fix_name in enumerate(_ALL_FIXES, 1)}
+        pending = dict(_ALL_FIXES)
+        running = {}
+        finished = set()
         
-        for i, (fix_name, fix_function, icon) in enumerate(fixes, 1):
-            print(f"\n{'='*80}")
-            print(f"[{i}/{total_fixes}] {icon} EXECUTANDO: {fix_name}")
-            print("💰 BENEFÍCIO: ", end="")
-            
-            # Adicionar contexto específico para cada otimização
-            if "Reset" in fix_name:
-                print("Eliminando problemas de conectividade que causam desconexões")
-            elif "SSL" in fix_name:
-                print("Garantindo conexões seguras sem falhas durante volatilidade")
-            elif "DNS" in fix_name:
-                print("Reduzindo latência em 15-50ms para execução mais rápida")
-            elif "LSO" in fix_name:
-                print("Eliminando micro-delays em operações de alta frequência")
-            elif "MTU" in fix_name:
-                print("Otimizando pacotes para máximo throughput")
-            elif "Energia" in fix_name:
-                print("Eliminando wake-up delays de adaptadores")
-            elif "TCP" in fix_name:
-                print("Reconexão ultra-rápida para trading sem interrupções")
-            elif "Otimização" in fix_name:
-                print("Liberando RAM/CPU para robôs de trading")
-            elif "Reparo" in fix_name:
-                print("Garantindo estabilidade total do sistema")
-                
-            print(f"{'='*80}")
-            
-            try:
-                if fix_function():
-                    success_count += 1
-                    print(f"✅ {icon} CONCLUÍDO: {fix_name} - Performance melhorada!")
-                else:
-                    print(f"⚠️  FALHOU: {fix_name} - Continuando com próximas otimizações...")
-            except Exception as e:
-                print(f"❌ ERRO: {fix_name} - {e}")
-                self.logger.error("Erro em '%s': %s\n%s", fix_name, e, traceback.format_exc())
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            while pending or running:
+                # Dispara todo passo cujas dependências já terminaram
+                for fix_name, (key, icon, benefit, deps) in list(pending.items()):
+                    if finished.issuperset(deps):
+                        del pending[fix_name]
+                        future = executor.submit(
+                            self._run_fix, numbers[fix_name], total_fixes, fix_name, key, icon, benefit
+                        )
+                        running[future] = fix_name
+                        
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    fix_name = running.pop(future)
+                    finished.add(fix_name)
+                    if future.result():
+                        success_count += 1
                 
-        print("\n" + "="*80)
-        print("🎊 EXECUÇÃO COMPLETA FINALIZADA!")
-        print("="*80)
-        print(f"📊 RESUMO DA TRANSFORMAÇÃO:")
-        print(f"✅ Otimizações bem-sucedidas: {success_count}/{total_fixes}")
-        print(f"⚠️  Otimizações com problemas: {total_fixes - success_count}/{total_fixes}")
-        print("="*80)
-        
-        if success_count >= total_fixes * 0.8:  # 80% de sucesso
-            print("🎯 STATUS: SISTEMA OTIMIZADO PARA TRADING PROFISSIONAL!")
-            print("💰 PRÓXIMOS PASSOS: Reinicie seu PC para máximo benefício")
-            print("🚀 PERFORMANCE: Aguarde melhoria significativa na latência")
-        else:
-            print("⚠️  STATUS: Otimização parcial - alguns problemas detectados")
-            print("💡 RECOMENDAÇÃO: Execute novamente para completar todas as otimizações")
-            
-        print("="*80)
+        status = _ALL_FIXES_STATUS_OK if success_count >= total_fixes * 0.8 else _ALL_FIXES_STATUS_PARTIAL  # 80% de sucesso
+        sys.stdout.write(_ALL_FIXES_FOOTER.format(
+            ok=success_count, failed=total_fixes - success_count, total=total_fixes, status=status,
+        ))
+        sys.stdout.flush()
         
         return success_count == total_fixes
         
@@ -877,32 +1190,14 @@ class TradingOptimizerOrchestrator:
                     print("\n👋 Saindo do sistema de otimização para trading...")
                     self.logger.info("Usuário saiu do sistema")
                     break
-                elif choice in ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"]:
+                elif choice in self._MENU_ACTIONS:
                     # Mostrar detalhes da opção escolhida
                     confirmed = self.show_option_details(choice)
                     
                     if confirmed:
                         # Executar a função correspondente
-                        if choice == "1":
-                            self.run_dns_configuration()
-                        elif choice == "2":
-                            self.run_lso_disable()
-                        elif choice == "3":
-                            self.run_mtu_adjustment()
-                        elif choice == "4":
-                            self.run_adapter_power_disable()
-                        elif choice == "5":
-                            self.run_network_reset()
-                        elif choice == "6":
-                            self.run_ssl_cleanup()
-                        elif choice == "7":
-                            self.run_system_optimization()
-                        elif choice == "8":
-                            self.run_system_repair()
-                        elif choice == "9":
-                            self.run_tcp_timeout_config()
-                        elif choice == "10":
-                            self.run_all_fixes()
+                        method_name, args = self._MENU_ACTIONS[choice]
+                        getattr(self, method_name)(*args)
                     else:
                         print("\n❌ Operação cancelada pelo usuário.")
                 else:
@@ -925,16 +1220,19 @@ class TradingOptimizerOrchestrator:
                 _safe_pause("\n⏸️  Pressione ENTER para continuar...")
 
 
+# Dependências já confirmadas nesta execução (evita refazer a checagem a cada tentativa)
+_DEPS_OK = False
+
+
 def check_dependencies() -> bool:
     """Verifica se as dependências necessárias estão instaladas."""
-    required_modules = ['winreg', 'wmi', 'pythoncom', 'psutil']
-    missing_modules = []
+    global _DEPS_OK
+    if _DEPS_OK:
+        return True
     
-    for module in required_modules:
-        try:
-            __import__(module)
-        except ImportError:
-            missing_modules.append(module)
+    # find_spec só localiza o módulo, sem executar o código de importação
+    required_modules = ['winreg', 'wmi', 'pythoncom', 'psutil']
+    missing_modules = [module for module in required_modules if find_spec(module) is None]
     
     if missing_modules:
         print("❌ DEPENDÊNCIAS FALTANDO:")
@@ -948,6 +1246,7 @@ def check_dependencies() -> bool:
         print("\nE execute: pip install -r requirements.txt")
         return False
     
+    _DEPS_OK = True
     return True
 
 
@@ -958,6 +1257,38 @@ def _safe_pause(prompt: str) -> None:
     _safe_readline(prompt)
 
 
+# Espera por entrada nova no stdin depois de um EOF, resolvida uma única vez por
+# plataforma. Num terminal, dorme até chegar algo para ler; num pipe/arquivo já
+# esgotado nada mais virá, então só dorme por um intervalo longo.
+_STDIN_EOF_SLEEP = 60.0
+
+if sys.platform == "win32":
+    _STD_INPUT_HANDLE = -10
+    _CONSOLE_WAIT_MS = 5000
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _GetStdHandle = _kernel32.GetStdHandle
+    _GetStdHandle.argtypes = [ctypes.c_ulong]
+    _GetStdHandle.restype = ctypes.c_void_p
+    _WaitForSingleObject = _kernel32.WaitForSingleObject
+    _WaitForSingleObject.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+    _WaitForSingleObject.restype = ctypes.c_ulong
+
+    def _wait_for_stdin() -> None:
+        if not sys.stdin.isatty():
+            time.sleep(_STDIN_EOF_SLEEP)
+            return
+        # O handle do console fica sinalizado quando há eventos de entrada; o
+        # timeout só existe para o Ctrl+C ser atendido entre as esperas
+        _WaitForSingleObject(_GetStdHandle(_STD_INPUT_HANDLE & 0xFFFFFFFF), _CONSOLE_WAIT_MS)
+else:
+    def _wait_for_stdin() -> None:
+        if not sys.stdin.isatty():
+            time.sleep(_STDIN_EOF_SLEEP)
+            return
+        select.select([sys.stdin], [], [])
+
+
 def _safe_readline(prompt: str, on_keyboard_interrupt: str = "ignore") -> str:
     """
     Leitura segura para ambientes onde `input()` pode gerar EOFError.
@@ -986,7 +1317,7 @@ def _safe_readline(prompt: str, on_keyboard_interrupt: str = "ignore") -> str:
             line = sys.stdin.readline()
             if line == "":
                 # stdin fechado (EOF). Mantém vivo sem repetir o prompt.
-                time.sleep(1)
+                _wait_for_stdin()
                 continue
 
             return line.rstrip("\r\n")
@@ -1006,7 +1337,14 @@ def _safe_readline(prompt: str, on_keyboard_interrupt: str = "ignore") -> str:
             continue
 
 
-def _print_exception_block(title: str, e: BaseException) -> None:
+def _print_exception_block(title: str, e: BaseException) -> str:
+    """
+    Exibe o erro com o traceback completo.
+    
+    Returns:
+        str: Traceback formatado, para reaproveitar no log sem formatar de novo
+    """
+    details = "".join(traceback.format_exception(type(e), e, e.__traceback__))
     print("\n" + "=" * 80)
     print(f"❌ {title}")
     print("=" * 80)
@@ -1014,8 +1352,9 @@ def _print_exception_block(title: str, e: BaseException) -> None:
     print(f"Mensagem: {e}")
     print("\n📌 Detalhes técnicos (traceback):")
     print("-" * 80)
-    print("".join(traceback.format_exception(type(e), e, e.__traceback__)))
+    print(details)
     print("-" * 80)
+    return details
 
 
 def _prompt_restart_computer() -> None:
@@ -1062,28 +1401,29 @@ def main():
     print("🎰 Iniciando Sistema de Otimização para Trading...")
     print("🎯 Otimizado especificamente para Casino e Nano Trade")
     
-    # Mantém o programa vivo/reexecutável mesmo se algo falhar.
+    # Mantém o programa vivo/reexecutável mesmo se algo falhar: um único laço
+    # trata qualquer exceção, inclusive Ctrl+C e sys.exit acidentais.
     while True:
-        # Verificar dependências (permite retry sem fechar)
-        if not check_dependencies():
-            print("\n⚠️  Sem dependências, não é possível executar as automações agora.")
-            print("📌 Corrija as dependências e pressione ENTER para tentar novamente.")
-            _safe_pause("\n⏸️  Pressione ENTER para REVERIFICAR dependências...")
-            continue
+        try:
+            # Verificar dependências (permite retry sem fechar)
+            if not check_dependencies():
+                print("\n⚠️  Sem dependências, não é possível executar as automações agora.")
+                print("📌 Corrija as dependências e pressione ENTER para tentar novamente.")
+                _safe_pause("\n⏸️  Pressione ENTER para REVERIFICAR dependências...")
+                continue
 
-        # Tentar importar módulos de automação (permite retry sem fechar)
-        import_errors = _attempt_import_managers()
-        if import_errors:
-            print("\n❌ Não foi possível carregar alguns módulos de automação.")
-            print("📌 Detalhes:")
-            for err in import_errors:
-                print(f" - {err}")
-            print("\n✅ O programa NÃO será fechado.")
-            print("📌 Corrija os arquivos/módulos e pressione ENTER para tentar novamente.")
-            _safe_pause("\n⏸️  Pressione ENTER para TENTAR importar novamente...")
-            continue
+            # Tentar importar módulos de automação (permite retry sem fechar)
+            import_errors = _attempt_import_managers()
+            if import_errors:
+                print("\n❌ Não foi possível carregar alguns módulos de automação.")
+                print("📌 Detalhes:")
+                for err in import_errors:
+                    print(f" - {err}")
+                print("\n✅ O programa NÃO será fechado.")
+                print("📌 Corrija os arquivos/módulos e pressione ENTER para tentar novamente.")
+                _safe_pause("\n⏸️  Pressione ENTER para TENTAR importar novamente...")
+                continue
 
-        try:
             # Criar e executar o otimizador de trading
             orchestrator = TradingOptimizerOrchestrator()
             orchestrator.run()
@@ -1093,27 +1433,18 @@ def main():
             _safe_pause("\n⏸️  Pressione ENTER para finalizar (a janela permanecerá aberta até você pressionar)...")
             return
 
+        except KeyboardInterrupt:
+            print("\n\n⚠️  Interrupção detectada (Ctrl+C). O programa continuará.")
+            logging.info("Interrupção do usuário (Ctrl+C) ignorada para manter o programa aberto")
         except SystemExit as e:
             # Captura qualquer sys.exit acidental em módulos e mantém vivo.
-            _print_exception_block("SystemExit capturado (o programa não será fechado)", e)
-            logging.error("SystemExit capturado: %s\n%s", e, traceback.format_exc())
-            _safe_pause("\n⏸️  Pressione ENTER para continuar...")
-            continue
-        except Exception as e:
-            _print_exception_block("ERRO CRÍTICO (o programa continuará)", e)
-            logging.error("Erro crítico na execução: %s\n%s", e, traceback.format_exc())
-            _safe_pause("\n⏸️  Pressione ENTER para continuar...")
-            continue
-        
+            details = _print_exception_block("SystemExit capturado (o programa não será fechado)", e)
+            logging.error("SystemExit capturado: %s\n%s", e, details)
+        except BaseException as e:
+            details = _print_exception_block("ERRO CRÍTICO (o programa continuará)", e)
+            logging.error("Erro crítico na execução: %s\n%s", e, details)
+        _safe_pause("\n⏸️  Pressione ENTER para continuar...")
+
 
 if __name__ == "__main__":
-    _configure_console_output()
-    # Camada extra de segurança: nunca fechar por exceção não tratada.
-    while True:
-        try:
-            main()
-            break
-        except BaseException as e:
-            _print_exception_block("ERRO NÃO TRATADO NO NÍVEL MAIS ALTO (mantendo aberto)", e)
-            logging.error("Erro não tratado no topo: %s\n%s", e, traceback.format_exc())
-            _safe_pause("\n⏸️  Pressione ENTER para tentar novamente...")
\ No newline at end of file
+    main()
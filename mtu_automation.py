@@ -21,27 +21,87 @@ Versão: 1.0.0
 Data: 2025-12-12
 """
 
+import atexit
 import logging
 import os
+import re
 import sys
 import subprocess
 import json
+import tempfile
+import threading
+import time
+from collections import Counter
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import ip_helper
 
 # Importações específicas do Windows
 try:
     import ctypes
     import wmi
     import pythoncom
-    from winreg import HKEY_LOCAL_MACHINE, KEY_ALL_ACCESS, REG_DWORD, REG_SZ
+    from winreg import (
+        HKEY_LOCAL_MACHINE, KEY_ALL_ACCESS, KEY_QUERY_VALUE, KEY_SET_VALUE, REG_DWORD, REG_SZ,
+        DeleteValue, OpenKey, QueryValueEx, SetValueEx,
+    )
 except ImportError as e:
     print("ERRO: Este módulo requer Python para Windows com pywin32 instalado.")
     print("Execute: pip install pywin32 wmi")
     sys.exit(1)
 
 
+# Parâmetros TCP/IP por interface (o valor MTU daqui é aplicado na inicialização)
+TCPIP_INTERFACES_PATH = r"SYSTEM\CurrentControlSet\Services\Tcpip\Parameters\Interfaces"
+
+# Linha de `netsh interface ipv4 show subinterface(s)`:
+#   MTU  MediaSenseState  Bytes In  Bytes Out  Interface
+# MediaSenseState é numérico (1 = conectado), então o padrão não depende do idioma
+_SUBINTERFACE_RE = re.compile(r'^\s*(\d+)\s+(\d+)\s+\d+\s+\d+\s+(\S.*?)\s*$', re.M)
+_MEDIA_SENSE_CONNECTED = '1'
+
+# A saída do netsh não traz o tipo da interface; a de loopback se identifica pelo nome
+_LOOPBACK_NAME_RE = re.compile(r'loopback', re.I)
+
+# Interfaces que nunca recebem ajuste de MTU (não são enlaces reais)
+_SKIPPED_IF_TYPES = (ip_helper.IF_TYPE_SOFTWARE_LOOPBACK, ip_helper.IF_TYPE_TUNNEL)
+
+# Processos filhos (netsh) sem alocar janela de console
+_CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+
+# Threads que já chamaram CoInitialize (ver _ensure_com_initialized)
+_com_state = threading.local()
+
+
+def _ensure_com_initialized() -> None:
+    """
+    Chama CoInitialize uma única vez por thread, mesmo com vários MTUManager.
+    
+    O CoUninitialize da thread principal fica para o encerramento do processo
+    (atexit), quando nenhuma conexão WMI criada nela está mais em uso.
+    """
+    if getattr(_com_state, 'initialized', False):
+        return
+    pythoncom.CoInitialize()
+    _com_state.initialized = True
+    if threading.current_thread() is threading.main_thread():
+        atexit.register(pythoncom.CoUninitialize)
+
+
+@lru_cache(maxsize=1)
+def _is_user_admin() -> bool:
+    """shell32!IsUserAnAdmin consultado uma única vez (o privilégio não muda durante o processo)."""
+    try:
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except Exception:
+        return False
+
+
 class MTUManager:
     """
     Gerenciador de Ajuste de MTU para Automação
@@ -63,6 +123,31 @@ class MTUManager:
     MIN_MTU = 576
     MAX_MTU = 9000
     
+    # Tempo (segundos) em que a lista de interfaces detectada é reutilizada
+    INTERFACE_CACHE_TTL = 5.0
+    
+    # Máximo de threads para chamadas netsh por interface
+    MAX_IO_WORKERS = 8
+    
+    _shared: Optional['MTUManager'] = None
+    _shared_lock = threading.Lock()
+    
+    @classmethod
+    def get_shared(cls) -> 'MTUManager':
+        """
+        Retorna uma instância compartilhada do gerenciador (criada sob demanda).
+        
+        Evita renegociar a conexão WMI a cada chamada das funções de conveniência;
+        a instância vive até o fim do processo.
+        
+        Returns:
+            MTUManager: Instância compartilhada
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+    
     def __init__(self, log_level: int = logging.INFO):
         """
         Inicializa o gerenciador de MTU.
@@ -78,10 +163,10 @@ class MTUManager:
         if not self._is_admin():
             self.logger.warning("Este módulo requer privilégios de administrador para funcionar corretamente")
         
-        # Inicializar WMI
+        # Inicializar WMI (sem pré-carregar o esquema de todas as classes)
         try:
-            pythoncom.CoInitialize()
-            self.wmi = wmi.WMI()
+            _ensure_com_initialized()
+            self.wmi = wmi.WMI(find_classes=False)
             self.logger.info("WMI inicializado com sucesso")
         except Exception as e:
             self.logger.error(f"Erro ao inicializar WMI: {e}")
@@ -90,6 +175,16 @@ class MTUManager:
         # Arquivo de backup para MTUs originais
         self.backup_file = Path("mtu_backup.json")
         
+        # Último backup gravado por esta instância (evita reler o arquivo na restauração)
+        self._last_backup: Optional[Dict] = None
+        
+        # Enumeração de adaptadores via IP Helper (o WMI fica como fallback)
+        self._adapter_reader = ip_helper.AdapterAddressesReader()
+        
+        # Cache da detecção de interfaces (ver INTERFACE_CACHE_TTL)
+        self._iface_cache: Optional[List[Dict]] = None
+        self._iface_cache_ts = 0.0
+        
     def _setup_logging(self, log_level: int) -> None:
         """Configura o sistema de logging."""
         logging.basicConfig(
@@ -108,29 +203,28 @@ class MTUManager:
         Returns:
             bool: True se está rodando como administrador
         """
-        try:
-            return ctypes.windll.shell32.IsUserAnAdmin()
-        except:
-            return False
+        return _is_user_admin()
     
-    def _execute_command(self, command: str, timeout: int = 30) -> Tuple[bool, str, str]:
+    def _execute_command(self, command: List[str], timeout: int = 30) -> Tuple[bool, str, str]:
         """
         Executa um comando do sistema e retorna o resultado.
         
         Args:
-            command (str): Comando a ser executado
+            command (List[str]): Programa e argumentos (executado sem cmd.exe)
             timeout (int): Tempo máximo de espera em segundos (default: 30)
             
         Returns:
             Tuple[bool, str, str]: (sucesso, stdout, stderr)
         """
-        self.logger.info(f"Executando comando: {command}")
+        command_line = subprocess.list2cmdline(command)
+        self.logger.info(f"Executando comando: {command_line}")
         
         try:
-            # Executar o comando
+            # Executar o programa diretamente, sem shell nem janela de console
             result = subprocess.run(
                 command,
-                shell=True,
+                shell=False,
+                creationflags=_CREATE_NO_WINDOW,
                 capture_output=True,
                 text=True,
                 timeout=timeout,
@@ -139,27 +233,147 @@ class MTUManager:
             )
             
             # Logar a saída
-            if result.stdout:
-                self.logger.debug(f"STDOUT: {result.stdout}")
-            if result.stderr:
-                self.logger.debug(f"STDERR: {result.stderr}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                if result.stdout:
+                    self.logger.debug("STDOUT: %s", result.stdout)
+                if result.stderr:
+                    self.logger.debug("STDERR: %s", result.stderr)
             
             # Verificar sucesso
             success = result.returncode == 0
             if success:
-                self.logger.info(f"Comando executado com sucesso: {command}")
+                self.logger.info(f"Comando executado com sucesso: {command_line}")
             else:
-                self.logger.warning(f"Comando falhou ({result.returncode}): {command}")
+                self.logger.warning(f"Comando falhou ({result.returncode}): {command_line}")
             
             return success, result.stdout, result.stderr
             
         except subprocess.TimeoutExpired:
-            self.logger.error(f"Comando expirou após {timeout} segundos: {command}")
+            self.logger.error(f"Comando expirou após {timeout} segundos: {command_line}")
             return False, "", f"Timeout após {timeout} segundos"
         except Exception as e:
-            self.logger.error(f"Erro ao executar comando '{command}': {e}")
+            self.logger.error(f"Erro ao executar comando '{command_line}': {e}")
             return False, "", str(e)
     
+    def _detect_interfaces_native(self) -> List[Dict]:
+        """
+        Lista as interfaces IPv4 via GetIpInterfaceTable (mesmos dados do netsh).
+        
+        Returns:
+            List[Dict]: Interfaces no formato de detect_network_interfaces
+            
+        Raises:
+            OSError: Se a API não estiver disponível ou retornar erro
+        """
+        interfaces = []
+        interfaces_append = interfaces.append
+        log_info = self.logger.info
+        for entry in ip_helper.get_ip_interfaces(ip_helper.AF_INET):
+            if entry['if_type'] in _SKIPPED_IF_TYPES:
+                continue
+            status = 'connected' if entry['connected'] else 'disconnected'
+            interfaces_append({
+                'name': entry['name'],
+                'mtu': entry['mtu'],
+                'status': status,
+                'type': 'iphlpapi'
+            })
+            log_info("Interface detectada: %s (MTU: %d, Status: %s)", entry['name'], entry['mtu'], status)
+        return interfaces
+    
+    def _detect_interfaces_netsh(self) -> List[Dict]:
+        """
+        Lista as interfaces IPv4 a partir da saída de `netsh interface ipv4 show subinterfaces`.
+        
+        Returns:
+            List[Dict]: Interfaces no formato de detect_network_interfaces
+        """
+        interfaces = []
+        
+        success, stdout, stderr = self._execute_command(['netsh', 'interface', 'ipv4', 'show', 'subinterfaces'], 15)
+        
+        if success:
+            interfaces_append = interfaces.append
+            log_info = self.logger.info
+            for match in _SUBINTERFACE_RE.finditer(stdout):
+                interface_name = match.group(3)
+                if _LOOPBACK_NAME_RE.search(interface_name):
+                    continue
+                mtu = int(match.group(1))
+                status = 'connected' if match.group(2) == _MEDIA_SENSE_CONNECTED else 'disconnected'
+                
+                interfaces_append({
+                    'name': interface_name,
+                    'mtu': mtu,
+                    'status': status,
+                    'type': 'netsh'
+                })
+                log_info("Interface detectada: %s (MTU: %d, Status: %s)", interface_name, mtu, status)
+        return interfaces
+    
+    def _connected_adapters_native(self) -> List[Dict]:
+        """
+        Lista os adaptadores conectados via GetAdaptersAddresses (sem COM/WMI).
+        
+        Returns:
+            List[Dict]: Adaptadores no formato de detect_network_interfaces
+            
+        Raises:
+            OSError: Se a API não estiver disponível ou retornar erro
+        """
+        return [
+            {
+                'name': adapter['friendly_name'],
+                'mtu': adapter['mtu'],  # MTU do enlace, não o da interface IPv4
+                'status': 'connected',
+                'type': 'adapter',
+                'adapter_name': adapter['adapter_name'],
+                'description': adapter['description']
+            }
+            for adapter in self._adapter_reader.read()
+            if adapter['oper_status'] == ip_helper.IF_OPER_STATUS_UP and adapter['friendly_name']
+            and adapter['if_type'] not in _SKIPPED_IF_TYPES
+        ]
+    
+    def _connected_adapters_wmi(self) -> List[Dict]:
+        """
+        Lista os adaptadores conectados via WMI (fallback de _connected_adapters_native).
+        
+        Returns:
+            List[Dict]: Adaptadores no formato de detect_network_interfaces
+        """
+        return [
+            {
+                'name': nic.NetConnectionID,
+                'mtu': 1500,  # Valor padrão se não conseguir detectar
+                'status': 'connected',
+                'type': 'wmi',
+                'device_id': nic.DeviceID,
+                'description': nic.Description
+            }
+            # Só as colunas usadas (SELECT NetConnectionID, DeviceID, Description ...)
+            for nic in self.wmi.Win32_NetworkAdapter(
+                ['NetConnectionID', 'DeviceID', 'Description'], NetConnectionStatus=2
+            )
+            if nic.NetConnectionID
+        ]
+    
+    def _detect_ip_interfaces(self) -> List[Dict]:
+        """Tabela de interfaces IPv4 direto do IP Helper; netsh só como fallback."""
+        try:
+            return self._detect_interfaces_native()
+        except OSError as e:
+            self.logger.warning(f"IP Helper indisponível ({e}), usando netsh")
+            return self._detect_interfaces_netsh()
+    
+    def _connected_adapters(self) -> List[Dict]:
+        """Adaptadores conectados via GetAdaptersAddresses; WMI só como fallback."""
+        try:
+            return self._connected_adapters_native()
+        except OSError as e:
+            self.logger.warning(f"GetAdaptersAddresses indisponível ({e}), usando WMI")
+            return self._connected_adapters_wmi()
+    
     def detect_network_interfaces(self) -> List[Dict]:
         """
         Detecta todas as interfaces de rede disponíveis no sistema.
@@ -167,60 +381,71 @@ class MTUManager:
         Returns:
             List[Dict]: Lista de interfaces com informações detalhadas
         """
+        if self._iface_cache is not None and time.monotonic() - self._iface_cache_ts < self.INTERFACE_CACHE_TTL:
+            return list(self._iface_cache)
+        
         self.logger.info("Iniciando detecção de interfaces de rede")
-        interfaces = []
         
         try:
-            # Obter interfaces via netsh
-            success, stdout, stderr = self._execute_command('netsh interface ipv4 show subinterfaces', 15)
+            # As duas passagens são independentes: a tabela IPv4 (que pode cair no netsh)
+            # roda em outra thread enquanto os adaptadores são lidos nesta, que é a dona
+            # da conexão WMI (objetos COM não podem ser usados fora da thread que os criou)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                interfaces_future = executor.submit(self._detect_ip_interfaces)
+                adapters = self._connected_adapters()
+                interfaces = interfaces_future.result()
             
-            if success:
-                lines = stdout.split('\n')
-                for line in lines:
-                    # Parse das linhas que contêm informações de interface
-                    if 'connected' in line.lower() or 'disconnected' in line.lower():
-                        parts = line.split()
-                        if len(parts) >= 4:
-                            interface_name = ' '.join(parts[:-2])  # Nome pode ter espaços
-                            try:
-                                mtu = int(parts[-2])
-                                status = parts[-1]
-                                
-                                interface_info = {
-                                    'name': interface_name.strip(),
-                                    'mtu': mtu,
-                                    'status': status,
-                                    'type': 'netsh'
-                                }
-                                interfaces.append(interface_info)
-                                self.logger.info(f"Interface detectada: {interface_name} (MTU: {mtu}, Status: {status})")
-                            except (ValueError, IndexError):
-                                continue
-            
-            # Complementar com informações do WMI
-            for nic in self.wmi.Win32_NetworkAdapter(NetConnectionStatus=2):
-                if nic.NetConnectionID:
-                    # Verificar se já existe na lista
-                    existing = next((i for i in interfaces if i['name'] == nic.NetConnectionID), None)
-                    if not existing:
-                        interface_info = {
-                            'name': nic.NetConnectionID,
-                            'mtu': 1500,  # Valor padrão se não conseguir detectar
-                            'status': 'connected',
-                            'type': 'wmi',
-                            'device_id': nic.DeviceID,
-                            'description': nic.Description
-                        }
-                        interfaces.append(interface_info)
-                        self.logger.info(f"Interface WMI detectada: {nic.NetConnectionID}")
+            # Complementar com adaptadores conectados que não apareceram acima
+            seen = {i['name'] for i in interfaces}
+            seen_add = seen.add
+            interfaces_append = interfaces.append
+            log_info = self.logger.info
+            for adapter in adapters:
+                # Verificar se já existe na lista
+                if adapter['name'] not in seen:
+                    seen_add(adapter['name'])
+                    interfaces_append(adapter)
+                    log_info("Interface de adaptador detectada: %s", adapter['name'])
             
             self.logger.info(f"Total de interfaces detectadas: {len(interfaces)}")
-            return interfaces
+            self._iface_cache = interfaces
+            self._iface_cache_ts = time.monotonic()
+            return list(interfaces)
             
         except Exception as e:
             self.logger.error(f"Erro ao detectar interfaces de rede: {e}")
             raise
     
+    def invalidate_interface_cache(self) -> None:
+        """Descarta a lista de interfaces em cache (usar após alterar a rede)."""
+        self._iface_cache = None
+        self._iface_cache_ts = 0.0
+    
+    def _interface_map(self) -> Dict[str, Dict]:
+        """
+        Indexa por nome as interfaces de detect_network_interfaces (usa o cache).
+        
+        Returns:
+            Dict[str, Dict]: Mapa nome da interface -> dados da interface
+        """
+        return {interface['name']: interface for interface in self.detect_network_interfaces()}
+    
+    def _map_interfaces(self, func, items: List) -> List:
+        """
+        Aplica `func` a cada item em paralelo (cada netsh é um processo à parte), mantendo a ordem.
+        
+        Args:
+            func: Função chamada com um item por vez
+            items (List): Itens a processar (interfaces, entradas de backup, ...)
+            
+        Returns:
+            List: Resultados na mesma ordem de `items`
+        """
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.MAX_IO_WORKERS, len(items))) as pool:
+            return list(pool.map(func, items))
+    
     def get_current_mtu(self, interface_name: str) -> Optional[int]:
         """
         Obtém o MTU atual de uma interface específica.
@@ -235,20 +460,15 @@ class MTUManager:
         
         try:
             success, stdout, stderr = self._execute_command(
-                f'netsh interface ipv4 show subinterface "{interface_name}"', 10
+                ['netsh', 'interface', 'ipv4', 'show', 'subinterface', interface_name], 10
             )
             
             if success:
-                lines = stdout.split('\n')
-                for line in lines:
-                    if interface_name in line and 'connected' in line.lower():
-                        parts = line.split()
-                        try:
-                            mtu = int(parts[-2])
-                            self.logger.info(f"MTU atual da interface {interface_name}: {mtu}")
-                            return mtu
-                        except (ValueError, IndexError):
-                            continue
+                for match in _SUBINTERFACE_RE.finditer(stdout):
+                    if match.group(3) == interface_name:
+                        mtu = int(match.group(1))
+                        self.logger.info(f"MTU atual da interface {interface_name}: {mtu}")
+                        return mtu
             
             self.logger.warning(f"Não foi possível obter MTU da interface {interface_name}")
             return None
@@ -270,14 +490,20 @@ class MTUManager:
         if not isinstance(mtu_value, int):
             return False, "Valor MTU deve ser um número inteiro"
         
-        if mtu_value < self.MIN_MTU:
-            return False, f"MTU muito baixo. Mínimo permitido: {self.MIN_MTU}"
+        return self._validate_int_mtu(mtu_value)
+    
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _validate_int_mtu(cls, mtu_value: int) -> Tuple[bool, str]:
+        """Validação de validate_mtu_value para inteiros; função pura, memorizada por valor."""
+        if mtu_value < cls.MIN_MTU:
+            return False, f"MTU muito baixo. Mínimo permitido: {cls.MIN_MTU}"
         
-        if mtu_value > self.MAX_MTU:
-            return False, f"MTU muito alto. Máximo permitido: {self.MAX_MTU}"
+        if mtu_value > cls.MAX_MTU:
+            return False, f"MTU muito alto. Máximo permitido: {cls.MAX_MTU}"
         
-        if mtu_value in self.SAFE_MTU_VALUES:
-            return True, f"MTU válido: {self.SAFE_MTU_VALUES[mtu_value]}"
+        if mtu_value in cls.SAFE_MTU_VALUES:
+            return True, f"MTU válido: {cls.SAFE_MTU_VALUES[mtu_value]}"
         else:
             return True, f"MTU válido (fora dos valores padrão recomendados)"
     
@@ -285,30 +511,52 @@ class MTUManager:
         """
         Faz backup dos MTUs atuais de todas as interfaces.
         
+        Returns:
+            bool: True se o backup foi bem-sucedido
+        """
+        try:
+            interfaces = self.detect_network_interfaces()
+        except Exception as e:
+            self.logger.error(f"Erro ao fazer backup dos MTUs: {e}")
+            return False
+        return self._backup_current_mtus_from(interfaces)
+    
+    def _backup_current_mtus_from(self, interfaces: List[Dict]) -> bool:
+        """
+        Faz backup dos MTUs de uma lista de interfaces já detectada.
+        
+        Args:
+            interfaces (List[Dict]): Resultado de detect_network_interfaces
+            
         Returns:
             bool: True se o backup foi bem-sucedido
         """
         self.logger.info("Iniciando backup dos MTUs atuais")
         
         try:
-            interfaces = self.detect_network_interfaces()
             backup_data = {
                 'timestamp': datetime.now().isoformat(),
                 'interfaces': {}
             }
             
+            backed_up = backup_data['interfaces']
             for interface in interfaces:
-                current_mtu = self.get_current_mtu(interface['name'])
+                # O MTU IPv4 já veio na detecção; entradas que só existem como
+                # adaptador (IP Helper ou WMI) não têm esse valor e ficam fora do backup
+                current_mtu = interface['mtu'] if interface['type'] in ('iphlpapi', 'netsh') else None
                 if current_mtu is not None:
-                    backup_data['interfaces'][interface['name']] = {
+                    backed_up[interface['name']] = {
                         'original_mtu': current_mtu,
                         'status': interface['status'],
-                        'description': interface.get('description', '')
+                        'description': interface.get('description', ''),
+                        # Se já havia um MTU fixo no registro (ver _persist_mtu); None se desconhecido
+                        'registry_mtu_pinned': self._has_persisted_mtu(interface['name'])
                     }
             
             # Salvar backup
             with open(self.backup_file, 'w', encoding='utf-8') as f:
                 json.dump(backup_data, f, indent=2, ensure_ascii=False)
+            self._last_backup = backup_data
             
             self.logger.info(f"Backup salvo em: {self.backup_file}")
             self.logger.info(f"Backup concluído para {len(backup_data['interfaces'])} interfaces")
@@ -328,28 +576,30 @@ class MTUManager:
         self.logger.info("Iniciando restauração dos MTUs originais")
         
         try:
-            if not self.backup_file.exists():
-                self.logger.error("Arquivo de backup não encontrado")
-                return False
-            
-            # Carregar backup
-            with open(self.backup_file, 'r', encoding='utf-8') as f:
-                backup_data = json.load(f)
+            # O backup gravado por esta instância já está em memória
+            backup_data = self._last_backup
+            if backup_data is None:
+                if not self.backup_file.exists():
+                    self.logger.error("Arquivo de backup não encontrado")
+                    return False
+                
+                # Carregar backup
+                with open(self.backup_file, 'r', encoding='utf-8') as f:
+                    backup_data = json.load(f)
             
-            success_count = 0
             total_count = len(backup_data['interfaces'])
             
-            for interface_name, interface_data in backup_data['interfaces'].items():
-                original_mtu = interface_data['original_mtu']
-                
-                try:
-                    if self._set_mtu(interface_name, original_mtu):
-                        success_count += 1
-                        self.logger.info(f"MTU restaurado para {interface_name}: {original_mtu}")
-                    else:
-                        self.logger.error(f"Falha ao restaurar MTU para {interface_name}")
-                except Exception as e:
-                    self.logger.error(f"Erro ao restaurar MTU para {interface_name}: {e}")
+            changes = [(name, data['original_mtu']) for name, data in backup_data['interfaces'].items()]
+            success_count = 0
+            for (interface_name, original_mtu), ok in zip(changes, self._set_mtus(changes)):
+                if ok:
+                    success_count += 1
+                    self.logger.info("MTU restaurado para %s: %d", interface_name, original_mtu)
+                    # Não deixar fixado no registro um MTU que antes não estava lá
+                    if backup_data['interfaces'][interface_name].get('registry_mtu_pinned') is False:
+                        self._unpin_mtu(interface_name)
+                else:
+                    self.logger.error("Falha ao restaurar MTU para %s", interface_name)
             
             self.logger.info(f"Restauração concluída: {success_count}/{total_count} interfaces")
             return success_count > 0
@@ -370,13 +620,37 @@ class MTUManager:
             bool: True se a operação foi bem-sucedida
         """
         self.logger.info(f"Definindo MTU {mtu_value} para interface {interface_name}")
+        return self._set_mtu_native(interface_name, mtu_value) or self._set_mtu_netsh(interface_name, mtu_value)
+    
+    def _set_mtu_native(self, interface_name: str, mtu_value: int) -> bool:
+        """
+        Altera a interface em execução via IP Helper e grava o MTU persistente no registro.
         
+        Returns:
+            bool: False se o caminho nativo falhou e o netsh deve ser usado
+        """
         try:
-            command = f'netsh interface ipv4 set subinterface "{interface_name}" mtu={mtu_value} store=persistent'
+            ip_helper.set_ip_interface_mtu(interface_name, mtu_value)
+            self._persist_mtu(interface_name, mtu_value)
+        except Exception as e:
+            self.logger.debug("Caminho nativo falhou para %s (%s), usando netsh", interface_name, e)
+            return False
+        self.logger.info("MTU definido com sucesso para %s: %d", interface_name, mtu_value)
+        self.invalidate_interface_cache()
+        return True
+    
+    def _set_mtu_netsh(self, interface_name: str, mtu_value: int) -> bool:
+        """Define o MTU com `netsh ... store=persistent` (um processo por interface)."""
+        try:
+            command = [
+                'netsh', 'interface', 'ipv4', 'set', 'subinterface', interface_name,
+                f'mtu={mtu_value}', 'store=persistent',
+            ]
             success, stdout, stderr = self._execute_command(command, 15)
             
             if success:
-                self.logger.info(f"MTU definido com sucesso para {interface_name}: {mtu_value}")
+                self.logger.info("MTU definido com sucesso para %s: %d", interface_name, mtu_value)
+                self.invalidate_interface_cache()
                 return True
             else:
                 self.logger.error(f"Falha ao definir MTU para {interface_name}: {stderr}")
@@ -386,6 +660,134 @@ class MTUManager:
             self.logger.error(f"Erro ao definir MTU para {interface_name}: {e}")
             return False
     
+    def _set_mtu_netsh_batch(self, changes: List[Tuple[str, int]]) -> List[bool]:
+        """
+        Aplica várias alterações com um único `netsh -f script`, em vez de um processo por interface.
+        
+        O código de saída do netsh não reflete cada linha do script, então o resultado
+        é conferido relendo a tabela de interfaces IPv4.
+        
+        Args:
+            changes (List[Tuple[str, int]]): Pares (nome da interface, MTU)
+            
+        Returns:
+            List[bool]: Se cada interface ficou com o MTU pedido, na mesma ordem
+        """
+        failed = [False] * len(changes)
+        script = "".join(
+            f'interface ipv4 set subinterface "{name}" mtu={mtu} store=persistent\n' for name, mtu in changes
+        )
+        try:
+            # O netsh lê o script na página de código ANSI do sistema
+            with tempfile.NamedTemporaryFile('w', suffix='.nsh', delete=False, encoding='mbcs') as f:
+                f.write(script)
+                script_path = f.name
+        except (LookupError, UnicodeEncodeError, OSError) as e:
+            self.logger.debug(f"Script netsh não pôde ser gerado ({e}), aplicando por interface")
+            return failed
+        
+        try:
+            success, stdout, stderr = self._execute_command(['netsh', '-f', script_path], 15 + 5 * len(changes))
+        finally:
+            try:
+                os.remove(script_path)
+            except OSError:
+                pass
+        
+        if not success:
+            return failed
+        
+        self.invalidate_interface_cache()
+        current = {interface['name']: interface['mtu'] for interface in self._detect_ip_interfaces()}
+        results = []
+        for name, mtu in changes:
+            applied = current.get(name) == mtu
+            if applied:
+                self.logger.info("MTU definido com sucesso para %s: %d", name, mtu)
+            else:
+                self.logger.warning("netsh não aplicou o MTU %d em %s", mtu, name)
+            results.append(applied)
+        return results
+    
+    def _set_mtus(self, changes: List[Tuple[str, int]]) -> List[bool]:
+        """
+        Aplica várias alterações de MTU: IP Helper em paralelo e, para o que sobrar,
+        um script netsh único (ou um netsh por interface se o script falhar).
+        
+        Args:
+            changes (List[Tuple[str, int]]): Pares (nome da interface, MTU)
+            
+        Returns:
+            List[bool]: Resultado de cada alteração, na mesma ordem
+        """
+        results = self._map_interfaces(lambda change: self._set_mtu_native(*change), changes)
+        pending = [i for i, ok in enumerate(results) if not ok]
+        if not pending:
+            return results
+        
+        if len(pending) > 1:
+            batch_results = self._set_mtu_netsh_batch([changes[i] for i in pending])
+            for i, ok in zip(pending, batch_results):
+                results[i] = ok
+            pending = [i for i in pending if not results[i]]
+        
+        # Um processo por interface identifica exatamente qual alteração falhou
+        fallback_results = self._map_interfaces(lambda i: self._set_mtu_netsh(*changes[i]), pending)
+        for i, ok in zip(pending, fallback_results):
+            results[i] = ok
+        return results
+    
+    @staticmethod
+    def _persist_mtu(interface_name: str, mtu_value: int) -> None:
+        """
+        Grava o MTU nos parâmetros TCP/IP da interface para sobreviver à reinicialização.
+        
+        Atenção: este não é o mesmo armazenamento do `netsh ... store=persistent` (NSI).
+        Depois de um ajuste por aqui, `netsh interface ipv4 show subinterface store=persistent`
+        continua mostrando o valor anterior, e um ajuste posterior pelo netsh não altera este
+        valor. Por isso o backup registra se o valor existia (registry_mtu_pinned) e a
+        restauração o remove quando ele não existia antes.
+        
+        Args:
+            interface_name (str): Nome da interface
+            mtu_value (int): Valor MTU
+            
+        Raises:
+            OSError: Se a interface não for encontrada ou a chave não puder ser gravada
+        """
+        guid = ip_helper.get_interface_guid(interface_name)
+        with OpenKey(HKEY_LOCAL_MACHINE, f"{TCPIP_INTERFACES_PATH}\\{guid}", 0, KEY_SET_VALUE) as key:
+            SetValueEx(key, "MTU", 0, REG_DWORD, mtu_value)
+    
+    @staticmethod
+    def _has_persisted_mtu(interface_name: str) -> Optional[bool]:
+        """
+        Indica se a interface já tem um valor MTU nos parâmetros TCP/IP do registro.
+        
+        Returns:
+            Optional[bool]: None se a interface ou a chave não puderem ser lidas
+        """
+        try:
+            guid = ip_helper.get_interface_guid(interface_name)
+            with OpenKey(HKEY_LOCAL_MACHINE, f"{TCPIP_INTERFACES_PATH}\\{guid}", 0, KEY_QUERY_VALUE) as key:
+                QueryValueEx(key, "MTU")
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError:
+            return None
+    
+    def _unpin_mtu(self, interface_name: str) -> None:
+        """Remove o valor MTU gravado por _persist_mtu (melhor esforço)."""
+        try:
+            guid = ip_helper.get_interface_guid(interface_name)
+            with OpenKey(HKEY_LOCAL_MACHINE, f"{TCPIP_INTERFACES_PATH}\\{guid}", 0, KEY_SET_VALUE) as key:
+                DeleteValue(key, "MTU")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning("Não foi possível remover o MTU fixo do registro para %s: %s", interface_name, e)
+    
     def set_mtu(self, interface_name: str, mtu_value: int, backup_first: bool = True) -> bool:
         """
         Define o MTU para uma interface específica com validação e backup opcional.
@@ -414,8 +816,13 @@ class MTUManager:
                 if not self.backup_current_mtus():
                     self.logger.warning("Falha no backup, continuando sem backup")
             
-            # Obter MTU atual
-            current_mtu = self.get_current_mtu(interface_name)
+            # Obter MTU atual da lista em cache; netsh só se a interface não estiver nela
+            # (entradas de adaptador trazem o MTU do enlace, não o da interface IPv4)
+            interface = self._interface_map().get(interface_name)
+            if interface and interface['type'] in ('iphlpapi', 'netsh'):
+                current_mtu = interface['mtu']
+            else:
+                current_mtu = self.get_current_mtu(interface_name)
             if current_mtu == mtu_value:
                 self.logger.info(f"Interface {interface_name} já tem MTU {mtu_value}")
                 return True
@@ -454,38 +861,37 @@ class MTUManager:
             
             self.logger.info(f"Validação MTU: {message}")
             
+            # Obter interfaces (uma única detecção serve ao backup e ao ajuste)
+            interfaces = self.detect_network_interfaces()
+            
             # Fazer backup se solicitado
             if backup_first:
-                if not self.backup_current_mtus():
+                if not self._backup_current_mtus_from(interfaces):
                     self.logger.warning("Falha no backup, continuando sem backup")
             
-            # Obter interfaces
-            interfaces = self.detect_network_interfaces()
             connected_interfaces = [i for i in interfaces if i['status'] == 'connected']
             
             if not connected_interfaces:
                 self.logger.warning("Nenhuma interface conectada encontrada")
                 return False
             
-            success_count = 0
             total_count = len(connected_interfaces)
             
+            to_change = []
             for interface in connected_interfaces:
-                interface_name = interface['name']
-                current_mtu = interface['mtu']
-                
-                if current_mtu == mtu_value:
-                    self.logger.info(f"Interface {interface_name} já tem MTU {mtu_value}")
-                    continue
-                
-                try:
-                    if self._set_mtu(interface_name, mtu_value):
-                        success_count += 1
-                        self.logger.info(f"MTU ajustado: {interface_name} ({current_mtu} -> {mtu_value})")
-                    else:
-                        self.logger.error(f"Falha ao ajustar MTU para {interface_name}")
-                except Exception as e:
-                    self.logger.error(f"Erro ao ajustar MTU para {interface_name}: {e}")
+                if interface['mtu'] == mtu_value:
+                    self.logger.info("Interface %s já tem MTU %d", interface['name'], mtu_value)
+                else:
+                    to_change.append(interface)
+            
+            results = self._set_mtus([(interface['name'], mtu_value) for interface in to_change])
+            success_count = 0
+            for interface, ok in zip(to_change, results):
+                if ok:
+                    success_count += 1
+                    self.logger.info("MTU ajustado: %s (%d -> %d)", interface['name'], interface['mtu'], mtu_value)
+                else:
+                    self.logger.error("Falha ao ajustar MTU para %s", interface['name'])
             
             self.logger.info(f"Ajuste de MTU concluído: {success_count}/{total_count} interfaces")
             return success_count > 0
@@ -519,34 +925,30 @@ class MTUManager:
                 }
             }
             
+            if interface_name:
+                interfaces = [i for i in interfaces if i['name'] == interface_name]
+            
+            # Validar cada valor MTU distinto uma única vez
+            validations = {mtu: self.validate_mtu_value(mtu) for mtu in {i['mtu'] for i in interfaces}}
+            
+            statuses = status_info['interfaces']
+            safe_values = self.SAFE_MTU_VALUES
             for interface in interfaces:
-                if interface_name and interface['name'] != interface_name:
-                    continue
-                
-                interface_status = {
+                is_valid, message = validations[interface['mtu']]
+                statuses[interface['name']] = {
                     'name': interface['name'],
                     'current_mtu': interface['mtu'],
                     'status': interface['status'],
-                    'is_recommended': interface['mtu'] in self.SAFE_MTU_VALUES,
-                    'validation_message': None
+                    'is_recommended': interface['mtu'] in safe_values,
+                    'validation_message': message,
+                    'is_valid': is_valid
                 }
-                
-                # Validar MTU atual
-                is_valid, message = self.validate_mtu_value(interface['mtu'])
-                interface_status['is_valid'] = is_valid
-                interface_status['validation_message'] = message
-                
-                status_info['interfaces'][interface['name']] = interface_status
-                
-                # Atualizar resumo
-                status_info['summary']['total_interfaces'] += 1
-                if interface['status'] == 'connected':
-                    status_info['summary']['connected_interfaces'] += 1
-                
-                # Contar valores MTU
-                mtu_str = str(interface['mtu'])
-                status_info['summary']['mtu_values'][mtu_str] = \
-                    status_info['summary']['mtu_values'].get(mtu_str, 0) + 1
+            
+            # Atualizar resumo
+            summary = status_info['summary']
+            summary['total_interfaces'] = len(interfaces)
+            summary['connected_interfaces'] = sum(1 for i in interfaces if i['status'] == 'connected')
+            summary['mtu_values'] = dict(Counter(str(i['mtu']) for i in interfaces))
             
             self.logger.info("Verificação de status de MTU concluída")
             return status_info
@@ -563,13 +965,6 @@ class MTUManager:
             Dict[int, str]: Dicionário com valores MTU e suas descrições
         """
         return self.SAFE_MTU_VALUES.copy()
-    
-    def __del__(self):
-        """Limpeza ao destruir o objeto."""
-        try:
-            pythoncom.CoUninitialize()
-        except:
-            pass
 
 
 # Funções de conveniência para uso direto
@@ -582,7 +977,7 @@ def set_mtu_interface(interface_name: str, mtu_value: int, backup_first: bool =
         mtu_value (int): Novo valor MTU
         backup_first (bool): Se deve fazer backup antes da alteração
     """
-    manager = MTUManager()
+    manager = MTUManager.get_shared()
     return manager.set_mtu(interface_name, mtu_value, backup_first)
 
 
@@ -594,7 +989,7 @@ def set_mtu_all_interfaces(mtu_value: int, backup_first: bool = True):
         mtu_value (int): Novo valor MTU
         backup_first (bool): Se deve fazer backup antes da alteração
     """
-    manager = MTUManager()
+    manager = MTUManager.get_shared()
     return manager.set_mtu_for_all_interfaces(mtu_value, backup_first)
 
 
@@ -605,32 +1000,31 @@ def get_mtu_status(interface_name: Optional[str] = None):
     Args:
         interface_name (str, optional): Nome específico da interface para verificar
     """
-    manager = MTUManager()
+    manager = MTUManager.get_shared()
     return manager.get_mtu_status(interface_name)
 
 
 def list_network_interfaces():
     """Lista todas as interfaces de rede disponíveis."""
-    manager = MTUManager()
+    manager = MTUManager.get_shared()
     return manager.detect_network_interfaces()
 
 
 def backup_mtus():
     """Faz backup dos MTUs atuais de todas as interfaces."""
-    manager = MTUManager()
+    manager = MTUManager.get_shared()
     return manager.backup_current_mtus()
 
 
 def restore_original_mtus():
     """Restaura os MTUs originais a partir do backup."""
-    manager = MTUManager()
+    manager = MTUManager.get_shared()
     return manager.restore_original_mtus()
 
 
 def get_recommended_mtu_values():
     """Lista os valores MTU recomendados."""
-    manager = MTUManager()
-    return manager.list_recommended_mtu_values()
+    return MTUManager.SAFE_MTU_VALUES.copy()
 
 
 # Exemplo de uso
@@ -16,9 +16,12 @@ Data: 2025-12-12
 import logging
 import os
 import sys
+import time
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+import ip_helper
+
 # Importações específicas do Windows
 try:
     import winreg
@@ -31,6 +34,14 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Adaptadores com nome de conexão, conectados (2) ou desconectados (1)
+ADAPTER_WQL = (
+    "SELECT NetConnectionID, DeviceID, AdapterType, MACAddress, Speed, "
+    "NetConnectionStatus, Manufacturer, Description FROM Win32_NetworkAdapter "
+    "WHERE NetConnectionID IS NOT NULL AND (NetConnectionStatus = 1 OR NetConnectionStatus = 2)"
+)
+
+
 class NetworkAdapterManager:
     """
     Gerenciador de Adaptadores de Rede para Automação
@@ -39,6 +50,9 @@ class NetworkAdapterManager:
     as configurações de economia de energia dos adaptadores de rede.
     """
     
+    # Tempo (segundos) em que a lista de adaptadores detectada é reutilizada
+    ADAPTER_CACHE_TTL = 5.0
+    
     def __init__(self, log_level: int = logging.INFO):
         """
         Inicializa o gerenciador de adaptadores de rede.
@@ -63,6 +77,13 @@ class NetworkAdapterManager:
         self.POWER_REGISTRY_PATH = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e972-e325-11ce-bfc1-08002be10318}"
         self.POWER_SETTINGS_KEY = "PnPCapabilities"
         
+        # Enumeração de adaptadores via IP Helper (o WMI fica como fallback)
+        self._adapter_reader = ip_helper.AdapterAddressesReader()
+        
+        # Cache da detecção de adaptadores (ver ADAPTER_CACHE_TTL)
+        self._adapter_cache: Optional[List[Dict]] = None
+        self._adapter_cache_ts = 0.0
+        
     def _setup_logging(self, log_level: int) -> None:
         """Configura o sistema de logging."""
         logging.basicConfig(
@@ -81,33 +102,135 @@ class NetworkAdapterManager:
         Returns:
             List[Dict]: Lista de adaptadores com informações detalhadas
         """
+        if self._adapter_cache is not None and time.monotonic() - self._adapter_cache_ts < self.ADAPTER_CACHE_TTL:
+            return list(self._adapter_cache)
+        
         self.logger.info("Iniciando detecção de adaptadores de rede")
-        adapters = []
         
         try:
-            # Buscar adaptadores via WMI
-            for nic in self.wmi.Win32_NetworkAdapter():
-                if nic.NetConnectionID and nic.NetConnectionStatus in [1, 2]:  # Conectado ou desconectado
-                    adapter_info = {
-                        'name': nic.NetConnectionID,
-                        'device_id': nic.DeviceID,
-                        'adapter_type': nic.AdapterType,
-                        'mac_address': nic.MACAddress,
-                        'speed': nic.Speed,
-                        'status': 'Conectado' if nic.NetConnectionStatus == 2 else 'Desconectado',
-                        'manufacturer': nic.Manufacturer,
-                        'description': nic.Description
-                    }
-                    adapters.append(adapter_info)
-                    self.logger.info(f"Adaptador detectado: {nic.NetConnectionID}")
+            try:
+                adapters = self._enum_adapters_iphlpapi()
+            except OSError as e:
+                self.logger.warning(f"GetAdaptersAddresses indisponível, usando WMI: {e}")
+                adapters = []
+            
+            if not adapters:
+                adapters = self._enum_adapters_wmi()
             
             self.logger.info(f"Total de adaptadores detectados: {len(adapters)}")
-            return adapters
+            self._adapter_cache = adapters
+            self._adapter_cache_ts = time.monotonic()
+            return list(adapters)
             
         except Exception as e:
             self.logger.error(f"Erro ao detectar adaptadores: {e}")
             raise
     
+    def _read_adapter_class_keys(self) -> Dict[str, Tuple[str, Optional[str]]]:
+        """
+        Mapeia o GUID de cada adaptador (NetCfgInstanceId) para sua subchave na classe de rede.
+        
+        Returns:
+            Dict[str, Tuple[str, Optional[str]]]: GUID em minúsculas -> (DeviceID, fabricante)
+            
+        Raises:
+            OSError: Se a chave da classe de rede não puder ser lida
+        """
+        class_keys = {}
+        with winreg.OpenKey(HKEY_LOCAL_MACHINE, self.POWER_REGISTRY_PATH, 0, winreg.KEY_READ) as class_key:
+            index = 0
+            while True:
+                try:
+                    subkey_name = winreg.EnumKey(class_key, index)
+                except OSError:
+                    break
+                index += 1
+                # Só as subchaves numéricas (0000, 0001, ...) são adaptadores; "Properties" é negada
+                if not subkey_name.isdigit():
+                    continue
+                try:
+                    with winreg.OpenKey(class_key, subkey_name, 0, winreg.KEY_READ) as key:
+                        guid, _ = winreg.QueryValueEx(key, "NetCfgInstanceId")
+                        try:
+                            manufacturer, _ = winreg.QueryValueEx(key, "ProviderName")
+                        except FileNotFoundError:
+                            manufacturer = None
+                except OSError:
+                    continue
+                # Mesmo formato do DeviceID do WMI ("7" para a subchave 0007)
+                class_keys[guid.lower()] = (str(int(subkey_name)), manufacturer)
+        return class_keys
+    
+    def _enum_adapters_iphlpapi(self) -> List[Dict]:
+        """
+        Enumera adaptadores via IP Helper (GetAdaptersAddresses), sem COM/WMI.
+        
+        O DeviceID (índice da subchave em POWER_REGISTRY_PATH) vem do registro,
+        casando o GUID do adaptador com o valor NetCfgInstanceId.
+        
+        Returns:
+            List[Dict]: Adaptadores no mesmo formato de detect_adapters
+            
+        Raises:
+            OSError: Se a API ou a chave da classe de rede não estiverem disponíveis
+        """
+        class_keys = self._read_adapter_class_keys()
+        adapters = []
+        for entry in self._adapter_reader.read():
+            # Loopback e túneis não têm chave de energia (e não aparecem no WMI)
+            if entry['if_type'] in (ip_helper.IF_TYPE_SOFTWARE_LOOPBACK, ip_helper.IF_TYPE_TUNNEL):
+                continue
+            if entry['oper_status'] not in (ip_helper.IF_OPER_STATUS_UP, ip_helper.IF_OPER_STATUS_DORMANT):
+                continue
+            class_key = class_keys.get(entry['adapter_name'].lower())
+            if class_key is None:
+                self.logger.debug("Adaptador sem chave na classe de rede: %s", entry['friendly_name'])
+                continue
+            device_id, manufacturer = class_key
+            
+            adapter_info = {
+                'name': entry['friendly_name'],
+                'device_id': device_id,
+                'adapter_type': ip_helper.IF_TYPE_NAMES.get(entry['if_type'], str(entry['if_type'])),
+                'mac_address': entry['mac_address'] or None,
+                'speed': entry['transmit_link_speed'],
+                'status': 'Conectado' if entry['oper_status'] == ip_helper.IF_OPER_STATUS_UP else 'Desconectado',
+                'manufacturer': manufacturer,
+                'description': entry['description']
+            }
+            adapters.append(adapter_info)
+            self.logger.info("Adaptador detectado: %s", entry['friendly_name'])
+        return adapters
+    
+    def _enum_adapters_wmi(self) -> List[Dict]:
+        """
+        Enumera adaptadores via WMI (Win32_NetworkAdapter); usado como fallback.
+        
+        Returns:
+            List[Dict]: Adaptadores no mesmo formato de detect_adapters
+        """
+        adapters = []
+        # Só as colunas usadas, filtradas no servidor
+        for nic in self.wmi.query(ADAPTER_WQL):
+            adapter_info = {
+                'name': nic.NetConnectionID,
+                'device_id': nic.DeviceID,
+                'adapter_type': nic.AdapterType,
+                'mac_address': nic.MACAddress,
+                'speed': nic.Speed,
+                'status': 'Conectado' if nic.NetConnectionStatus == 2 else 'Desconectado',
+                'manufacturer': nic.Manufacturer,
+                'description': nic.Description
+            }
+            adapters.append(adapter_info)
+            self.logger.info("Adaptador detectado: %s", nic.NetConnectionID)
+        return adapters
+    
+    def invalidate_adapter_cache(self) -> None:
+        """Descarta a lista de adaptadores em cache (usar após alterar a rede)."""
+        self._adapter_cache = None
+        self._adapter_cache_ts = 0.0
+    
     def _get_adapter_registry_path(self, device_id: str) -> str:
         """
         Obtém o caminho do registro para um adaptador específico.
@@ -131,6 +254,24 @@ class NetworkAdapterManager:
             Dict: Status detalhado dos adaptadores
         """
         self.logger.info(f"Verificando status de economia de energia para: {adapter_name or 'todos os adaptadores'}")
+        
+        try:
+            return self._check_power_status_from(self.detect_adapters(), adapter_name)
+        except Exception as e:
+            self.logger.error(f"Erro ao verificar status de energia: {e}")
+            raise
+    
+    def _check_power_status_from(self, adapters: List[Dict], adapter_name: Optional[str] = None) -> Dict:
+        """
+        Verifica a economia de energia de uma lista de adaptadores já detectada.
+        
+        Args:
+            adapters (List[Dict]): Resultado de detect_adapters
+            adapter_name (str, optional): Nome específico do adaptador para verificar
+            
+        Returns:
+            Dict: Status detalhado dos adaptadores
+        """
         status_info = {
             'timestamp': str(Path(__file__).stat().st_mtime),
             'adapters': {},
@@ -142,58 +283,51 @@ class NetworkAdapterManager:
             }
         }
         
-        try:
-            adapters = self.detect_adapters()
-            
-            for adapter in adapters:
-                if adapter_name and adapter['name'] != adapter_name:
-                    continue
-                    
-                adapter_status = {
-                    'name': adapter['name'],
-                    'device_id': adapter['device_id'],
-                    'current_status': 'unknown',
-                    'registry_path': None,
-                    'power_setting_value': None,
-                    'can_modify': False
-                }
-                
-                try:
-                    # Tentar acessar as configurações do registro
-                    registry_path = self._get_adapter_registry_path(adapter['device_id'])
-                    adapter_status['registry_path'] = registry_path
-                    
-                    with winreg.OpenKey(HKEY_LOCAL_MACHINE, registry_path, 0, winreg.KEY_READ) as key:
-                        try:
-                            value, _ = winreg.QueryValueEx(key, self.POWER_SETTINGS_KEY)
-                            adapter_status['power_setting_value'] = value
-                            adapter_status['current_status'] = 'power_saving_disabled' if value == 0 else 'power_saving_enabled'
-                            adapter_status['can_modify'] = True
-                        except FileNotFoundError:
-                            adapter_status['current_status'] = 'not_configured'
-                            adapter_status['can_modify'] = True
-                            
-                except Exception as e:
-                    self.logger.warning(f"Não foi possível verificar status do adaptador {adapter['name']}: {e}")
-                    adapter_status['current_status'] = 'error'
+        for adapter in adapters:
+            if adapter_name and adapter['name'] != adapter_name:
+                continue
                 
-                status_info['adapters'][adapter['name']] = adapter_status
+            adapter_status = {
+                'name': adapter['name'],
+                'device_id': adapter['device_id'],
+                'current_status': 'unknown',
+                'registry_path': None,
+                'power_setting_value': None,
+                'can_modify': False
+            }
+            
+            try:
+                # Tentar acessar as configurações do registro
+                registry_path = self._get_adapter_registry_path(adapter['device_id'])
+                adapter_status['registry_path'] = registry_path
                 
-                # Atualizar resumo
-                status_info['summary']['total_adapters'] += 1
-                if adapter_status['current_status'] == 'power_saving_enabled':
-                    status_info['summary']['power_saving_enabled'] += 1
-                elif adapter_status['current_status'] == 'power_saving_disabled':
-                    status_info['summary']['power_saving_disabled'] += 1
-                else:
-                    status_info['summary']['unknown_status'] += 1
+                with winreg.OpenKey(HKEY_LOCAL_MACHINE, registry_path, 0, winreg.KEY_READ) as key:
+                    try:
+                        value, _ = winreg.QueryValueEx(key, self.POWER_SETTINGS_KEY)
+                        adapter_status['power_setting_value'] = value
+                        adapter_status['current_status'] = 'power_saving_disabled' if value == 0 else 'power_saving_enabled'
+                        adapter_status['can_modify'] = True
+                    except FileNotFoundError:
+                        adapter_status['current_status'] = 'not_configured'
+                        adapter_status['can_modify'] = True
+                        
+            except Exception as e:
+                self.logger.warning(f"Não foi possível verificar status do adaptador {adapter['name']}: {e}")
+                adapter_status['current_status'] = 'error'
             
-            self.logger.info("Verificação de status concluída")
-            return status_info
+            status_info['adapters'][adapter['name']] = adapter_status
             
-        except Exception as e:
-            self.logger.error(f"Erro ao verificar status de energia: {e}")
-            raise
+            # Atualizar resumo
+            status_info['summary']['total_adapters'] += 1
+            if adapter_status['current_status'] == 'power_saving_enabled':
+                status_info['summary']['power_saving_enabled'] += 1
+            elif adapter_status['current_status'] == 'power_saving_disabled':
+                status_info['summary']['power_saving_disabled'] += 1
+            else:
+                status_info['summary']['unknown_status'] += 1
+        
+        self.logger.info("Verificação de status concluída")
+        return status_info
     
     def disable_power_saving(self, adapter_name: Optional[str] = None) -> bool:
         """
@@ -308,8 +442,11 @@ class NetworkAdapterManager:
             
             for adapter in adapters:
                 if adapter['name'] == adapter_name:
-                    # Adicionar informações de energia
-                    power_status = self.check_power_status(adapter_name)
+                    # Cópia: os dicionários da lista são compartilhados com o cache
+                    adapter = dict(adapter)
+                    
+                    # Adicionar informações de energia (reaproveita a lista já detectada)
+                    power_status = self._check_power_status_from(adapters, adapter_name)
                     adapter['power_status'] = power_status['adapters'].get(adapter_name, {})
                     
                     self.logger.info(f"Informações obtidas para: {adapter_name}")